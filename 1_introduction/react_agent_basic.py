@@ -4,12 +4,13 @@ from langchain_community.tools import TavilySearchResults
 from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
+from graph_utils import cached_tool, print_stream
 
 # 환경설정
 load_dotenv()
 
-# tools
-search_tool = TavilySearchResults(search_depth="basic")
+# tools (반복 검색은 SQLite 캐시에서 바로 반환)
+search_tool = cached_tool(TavilySearchResults(search_depth="basic"))
 
 
 @tool
@@ -26,30 +27,16 @@ llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
 # agent 생성
 agent = create_react_agent(llm, [search_tool, get_system_time])
 
-# 방법 1: LangGraph의 간단한 디버그 모드
-print("=== 방법 1: 간단한 실행 (verbose 스타일) ===")
+# 한 번의 실행으로 진행 과정(노드, 도구, 토큰)과 최종 결과를 함께 확인
+# stream()과 invoke()를 따로 호출하면 LLM/검색 호출 비용이 두 배가 됨
+print("=== 스트리밍으로 상세 과정 보기 (단일 실행) ===")
 query = "대한민국 대통령이 선출된지 몇 일이 지났나요"
 messages = [HumanMessage(content=query)]
 
-# 간단하게 실행하고 결과만 보기
-result = agent.invoke({"messages": messages})
-print("Final result:", result["messages"][-1].content)
+result = print_stream(agent, {"messages": messages})
 
 print("\n" + "=" * 50)
-print("=== 방법 2: 스트리밍으로 상세 과정 보기 ===")
-
-# 상세한 과정을 보고 싶다면 스트리밍 사용
-for step in agent.stream({"messages": messages}):
-    for node, data in step.items():
-        if "messages" in data:
-            for msg in data["messages"]:
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_m in msg.tool_calls:
-                        print(f"🔧 도구 사용: {tool_m['name']}")
-                        print(f"   입력: {tool_m['args']}")
-                elif hasattr(msg, "name") and msg.name:
-                    print(f"✅ 도구 결과: {msg.content[:200]}...")
-                elif msg.content and not hasattr(msg, "tool_calls"):
-                    print(f"💭 최종 답변: {msg.content}")
+print("💭 최종 답변:", result["messages"][-1].content)
+print(search_tool.cache.stats.summary())
 
 print("\n=== 완료 ===")
@@ -5,10 +5,15 @@
 # 트윗을 생성한 후 스스로 평가하고 개선하는 과정을 반복합니다.
 
 from dotenv import load_dotenv
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langgraph.graph import END, StateGraph, add_messages
 from typing_extensions import TypedDict, Annotated
-from chains import generation_prompt_chain, reflection_prompt_chain
+from chains import (
+    generation_prompt_chain,
+    reflection_prompt_chain,
+    scored_reflection_chain,
+)
+from graph_utils import ConvergencePolicy
 
 # 환경변수 로드 (Google API Key 등)
 load_dotenv()
@@ -27,9 +32,11 @@ class AgentState(TypedDict):
     Attributes:
         messages: add_messages 리듀서로 관리되는 메시지 리스트
         자동으로 새 메시지들이 기존 리스트에 추가됨
+        score: 최신 비평 점수 (조기 종료 모드에서만 사용)
     """
 
     messages: Annotated[list[BaseMessage], add_messages]
+    score: int
 
 
 # StateGraph 초기화 - 메시지 기반 상태 관리
@@ -44,6 +51,18 @@ graph = StateGraph(AgentState)
 REFLECT = "reflect"  # 반성/평가 노드 이름
 GENERATE = "generate"  # 생성 노드 이름
 
+# ==============================================
+# 조기 종료 설정
+# ==============================================
+# EARLY_STOPPING이 True이면 비평 점수가 충분히 높거나 연속된 트윗이
+# 거의 같아질 때 바로 종료합니다. 최대 생성 횟수는 기존 방식(메시지 4개에서
+# 종료 = 트윗 2회 생성)과 같게 두어 안전장치로 사용합니다.
+
+EARLY_STOPPING = True
+MAX_GENERATIONS = 2
+
+convergence = ConvergencePolicy(max_iterations=MAX_GENERATIONS)
+
 
 def generate_node(state: AgentState) -> AgentState:
     """트윗 생성 노드 (리듀서 사용)
@@ -72,7 +91,13 @@ def reflect_node(state: AgentState) -> AgentState:
 
     Returns:
         반성 결과 - add_messages 리듀서가 자동으로 기존 메시지에 추가
+        (조기 종료 모드에서는 비평 점수도 함께 반환)
     """
+    if EARLY_STOPPING:
+        review = scored_reflection_chain.invoke({"messages": state["messages"]})
+        critique_msg = HumanMessage(content=review.critique)
+        return {"messages": [critique_msg], "score": review.score}
+
     response = reflection_prompt_chain.invoke({"messages": state["messages"]})
     # ✨ 리듀서 사용: 단순히 새 메시지만 반환하면 자동으로 기존 메시지에 추가됨
     reflection_msg = HumanMessage(content=response.content)
@@ -108,38 +133,69 @@ def should_continue(state: AgentState):
         REFLECT: 반성 단계로 이동
         END: 작업 종료
     """
+    if EARLY_STOPPING:
+        # 직전 트윗과 거의 같으면 더 반복해도 나아지지 않으므로 종료
+        drafts = [m.content for m in state["messages"] if isinstance(m, AIMessage)]
+        previous = drafts[-2] if len(drafts) > 1 else None
+        if convergence.check(len(drafts), None, previous, drafts[-1]):
+            return END
+        return REFLECT
+
     if len(state["messages"]) > 3:  # 3개부터 종료
         return END  # 메시지가 3개 이상이면 종료
     return REFLECT  # 아니면 계속 반성
 
 
+def should_refine(state: AgentState):
+    """반성 후 라우팅 함수
+
+    조기 종료 모드에서 비평 점수가 기준 이상이면 트윗을 다시 생성하지 않고 종료합니다.
+
+    Returns:
+        GENERATE: 비평을 반영해 다시 생성
+        END: 작업 종료 (마지막 트윗이 최종 결과)
+    """
+    if EARLY_STOPPING:
+        drafts = [m for m in state["messages"] if isinstance(m, AIMessage)]
+        if convergence.check(len(drafts), state.get("score")):
+            return END
+    return GENERATE
+
+
 # 조건부 엣지: GENERATE 노드에서 조건에 따라 분기
 # 이것만 설정하고 고정 엣지는 설정하지 않음!
 graph.add_conditional_edges(GENERATE, should_continue)
 
-# REFLECT → GENERATE: 반성 후 다시 생성으로 돌아감
-graph.add_edge(REFLECT, GENERATE)
+# REFLECT → GENERATE: 반성 후 다시 생성으로 돌아감 (점수가 충분하면 종료)
+graph.add_conditional_edges(REFLECT, should_refine, [GENERATE, END])
 
 # 그래프 컴파일 - 실행 가능한 앱으로 변환
 app = graph.compile()
 
-# 그래프 구조 시각화
-print("=== 그래프 구조 ===")
-print(app.get_graph().draw_mermaid())
-print(app.get_graph().draw_ascii())
-
-# 테스트 실행
-message = HumanMessage(content="최신 AI 기술에 대한 바이럴 트윗 작성해줘.")
-print("\n=== Agent 실행 시작 ===")
-response = app.invoke({"messages": [message]}, {"recursion_limit": 10})
-print(f"총 메시지 수: {len(response['messages'])}\n")
-
-for i, msg in enumerate(response["messages"], 1):
-    msg_type = type(msg).__name__
-    role = " 사용자" if msg_type == "HumanMessage" else " AI"
-    print(f"[{i}] {role} ({msg_type}):")
-    print(f"{msg.content}\n")
-    print("-" * 30)
-
-print("\n최종 결과:")
-print(response["messages"][-1].content)
+if __name__ == "__main__":
+    # 그래프 구조 시각화
+    print("=== 그래프 구조 ===")
+    print(app.get_graph().draw_mermaid())
+    print(app.get_graph().draw_ascii())
+
+    # 테스트 실행
+    message = HumanMessage(content="최신 AI 기술에 대한 바이럴 트윗 작성해줘.")
+    print("\n=== Agent 실행 시작 ===")
+    response = app.invoke({"messages": [message]}, {"recursion_limit": 10})
+    print(f"총 메시지 수: {len(response['messages'])}\n")
+
+    for i, msg in enumerate(response["messages"], 1):
+        msg_type = type(msg).__name__
+        role = " 사용자" if msg_type == "HumanMessage" else " AI"
+        print(f"[{i}] {role} ({msg_type}):")
+        print(f"{msg.content}\n")
+        print("-" * 30)
+
+    # 점수로 조기 종료하면 마지막 메시지가 비평이므로 마지막 AI 트윗을 출력
+    final_tweet = [m for m in response["messages"] if isinstance(m, AIMessage)][-1]
+    print("\n최종 결과:")
+    print(final_tweet.content)
+
+    if EARLY_STOPPING:
+        print()
+        print(convergence.summary())
@@ -5,9 +5,9 @@
 # 각 체인은 특정 역할을 수행하는 AI 어시스턴트로 설정됩니다.
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+from graph_utils import cache_llm, lazy_chat_model
 
 # 환경변수 로드 (.env 파일에서 API 키 등을 가져옴)
 load_dotenv()
@@ -56,24 +56,46 @@ reflection_prompt = ChatPromptTemplate.from_messages(
 )
 
 
+# ==============================================
+# 구조화된 평가 스키마
+# ==============================================
+# 여러 후보 트윗 중 최선을 고르려면 비교 가능한 점수가 필요합니다.
+
+
+class Critique(BaseModel):
+    """트윗 평가 결과 (비평 + 점수)"""
+
+    critique: str = Field(description="트윗에 대한 구체적인 비평과 개선안")
+    score: int = Field(description="트윗 품질 점수 (1~10, 10이 최고)", ge=1, le=10)
+
+
 # ==============================================
 # LLM 모델 설정
 # ==============================================
 # Google Generative AI (Gemini) 모델 초기화
 # API 키를 환경변수에서 직접 로드하여 인증 문제 방지
+# lazy_chat_model: 첫 호출 때 프로바이더 패키지를 import하고 클라이언트 생성
+# (사용하지 않는 프로바이더 패키지는 import하지 않음)
 
-# llm = ChatOpenAI(
+# llm = lazy_chat_model(
+#     "openai",
 #     model="gpt-4.1-nano",  # 빠르고 효율적인 Gemini 모델
 #     temperature=0.7,  # 창의성과 일관성의 균형
 # )
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
+llm = lazy_chat_model("google_genai", model="gemini-2.5-flash")
 
 # ==============================================
 # 체인 구성
 # ==============================================
 # 프롬프트와 LLM을 연결하여 실행 가능한 체인으로 구성
 # | 연산자는 LangChain의 파이프라인 연결 방식
+# cache_llm: 같은 프롬프트/모델/파라미터 호출은 SQLite 캐시에서 바로 반환
 
-generation_prompt_chain = generation_prompt | llm  # 트윗 생성 체인
-reflection_prompt_chain = reflection_prompt | llm  # 트윗 평가 체인
+generation_prompt_chain = generation_prompt | cache_llm(llm)  # 트윗 생성 체인
+reflection_prompt_chain = reflection_prompt | cache_llm(llm)  # 트윗 평가 체인
+
+# 점수까지 받는 평가 체인 (같은 반성 프롬프트 + 구조화 출력)
+scored_reflection_chain = reflection_prompt | cache_llm(
+    llm.with_structured_output(Critique)
+)
@@ -0,0 +1,146 @@
+# ==============================================
+# Fan-out Reflection Agent 구현
+# ==============================================
+# basic.py의 "생성-반성" 루프를 병렬화한 버전입니다.
+# 매 라운드마다 N개의 후보 트윗을 동시에 생성하고 동시에 평가한 뒤,
+# 가장 점수가 높은 후보 하나만 다음 라운드로 가져갑니다.
+# → 전체 소요 시간이 (라운드 × 후보 수)가 아니라 라운드 수에 비례합니다.
+
+from typing import Any
+
+from dotenv import load_dotenv
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+from typing_extensions import Annotated, TypedDict
+
+from basic import AgentState
+from chains import generation_prompt_chain, scored_reflection_chain
+
+load_dotenv()
+
+CANDIDATE = "candidate"  # 후보 생성 + 평가 노드 이름 (Send로 N개 병렬 실행)
+SELECT = "select"  # 최선 후보 선택 노드 이름
+
+NUM_CANDIDATES = 3  # 라운드당 후보 수
+MAX_ROUNDS = 2  # 최대 라운드 수
+
+
+# ==============================================
+# Fan-out State 정의
+# ==============================================
+
+
+def collect_candidates(left: list, right: list | None) -> list:
+    """후보 리듀서: 병렬 브랜치 결과를 모으고, None이 오면 비움 (라운드 초기화)"""
+    if right is None:
+        return []
+    return left + right
+
+
+class FanOutState(AgentState):
+    """basic.py의 AgentState에 후보 목록과 라운드 수를 추가한 상태
+
+    Attributes:
+        candidates: 이번 라운드 후보들 ({"tweet", "critique", "score"})
+        round: 완료된 라운드 수
+    """
+
+    candidates: Annotated[list[dict], collect_candidates]
+    round: int
+
+
+class CandidateState(TypedDict):
+    """Send로 각 후보 브랜치에 전달되는 상태"""
+
+    messages: list
+    index: int
+
+
+# ==============================================
+# 노드 정의
+# ==============================================
+
+
+def fan_out(state: FanOutState) -> list[Send]:
+    """라운드 시작: 같은 대화 히스토리로 후보 N개를 병렬 실행"""
+    return [
+        Send(CANDIDATE, {"messages": state["messages"], "index": i})
+        for i in range(NUM_CANDIDATES)
+    ]
+
+
+def candidate_node(state: CandidateState) -> dict[str, Any]:
+    """후보 트윗 하나를 생성하고 바로 평가
+
+    Returns:
+        candidates 리듀서에 추가될 후보 1개
+    """
+    # 같은 입력이라도 후보마다 다른 응답이 캐시되도록 후보 번호를 캐시 시드로 사용
+    config = {"configurable": {"cache_seed": state["index"]}}
+    tweet = generation_prompt_chain.invoke({"messages": state["messages"]}, config)
+    review = scored_reflection_chain.invoke(
+        {"messages": state["messages"] + [tweet]}, config
+    )
+    return {
+        "candidates": [
+            {"tweet": tweet, "critique": review.critique, "score": review.score}
+        ]
+    }
+
+
+def select_node(state: FanOutState) -> dict[str, Any]:
+    """점수가 가장 높은 후보만 메시지 히스토리에 남기고 후보 목록 초기화
+
+    마지막 라운드가 아니면 비평도 HumanMessage로 추가해 다음 라운드 생성에 반영합니다.
+    """
+    best = max(state["candidates"], key=lambda c: c["score"])
+    round_ = state.get("round", 0) + 1
+
+    messages = [AIMessage(content=best["tweet"].content)]
+    if round_ < MAX_ROUNDS:
+        messages.append(HumanMessage(content=best["critique"]))
+
+    print(
+        f"🏆 라운드 {round_}: 후보 {len(state['candidates'])}개 중 "
+        f"최고 점수 {best['score']}/10"
+    )
+    return {"messages": messages, "candidates": None, "round": round_}
+
+
+def should_continue(state: FanOutState):
+    """최대 라운드에 도달하면 종료, 아니면 다음 라운드 fan-out"""
+    if state["round"] >= MAX_ROUNDS:
+        return END
+    return fan_out(state)
+
+
+# ==============================================
+# 그래프 구성
+# ==============================================
+
+graph = StateGraph(FanOutState)
+
+graph.add_node(CANDIDATE, candidate_node)
+graph.add_node(SELECT, select_node)
+
+# START → 후보 N개 병렬 실행 → 선택 → (다음 라운드 or 종료)
+graph.add_conditional_edges(START, fan_out, [CANDIDATE])
+graph.add_edge(CANDIDATE, SELECT)
+graph.add_conditional_edges(SELECT, should_continue, [CANDIDATE, END])
+
+app = graph.compile()
+
+if __name__ == "__main__":
+    print("=== 그래프 구조 ===")
+    print(app.get_graph().draw_mermaid())
+
+    message = HumanMessage(content="최신 AI 기술에 대한 바이럴 트윗 작성해줘.")
+    print("\n=== Fan-out Agent 실행 시작 ===")
+    response = app.invoke(
+        {"messages": [message], "candidates": [], "round": 0},
+        {"recursion_limit": 20},
+    )
+
+    print("\n최종 결과:")
+    print(response["messages"][-1].content)
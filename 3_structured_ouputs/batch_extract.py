@@ -0,0 +1,219 @@
+# ==============================================
+# Country 대량 구조화 추출
+# ==============================================
+# types.py처럼 invoke()를 한 건씩 블로킹 호출하는 대신
+# 1) asyncio로 동시 요청 수를 제한하며 병렬 실행하고
+# 2) 선택적으로 여러 요청을 CountryList 하나로 묶어(pack) 요청 수를 줄이고
+# 3) 검증된 결과를 도착하는 대로 스트리밍하며
+# 4) 실패한 항목만 단건으로 다시 시도합니다.
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterable, List, Optional
+
+from dotenv import load_dotenv
+from graph_utils import lazy_chat_model
+from schema import Country, CountryList
+
+load_dotenv()
+
+MAX_CONCURRENCY = 8  # 동시에 보낼 최대 요청 수
+PACK_SIZE = 1  # 요청 하나에 묶을 항목 수 (1이면 단건 요청)
+MAX_ATTEMPTS = 3  # 항목별 최대 시도 횟수
+
+# gemini-2.5-flash 가격 (USD / 1K 토큰)
+PRICE_INPUT_PER_1K = 0.0003
+PRICE_OUTPUT_PER_1K = 0.0025
+
+llm = lazy_chat_model("google_genai", model="gemini-2.5-flash")
+
+
+@dataclass
+class ExtractionResult:
+    """항목 하나의 추출 결과"""
+
+    index: int
+    prompt: str
+    record: Optional[Country] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.record is not None
+
+
+@dataclass
+class BatchStats:
+    """처리량/비용 통계"""
+
+    succeeded: int = 0
+    failed: int = 0
+    requests: int = 0
+    retries: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def cost(self) -> float:
+        return (
+            self.input_tokens / 1000 * PRICE_INPUT_PER_1K
+            + self.output_tokens / 1000 * PRICE_OUTPUT_PER_1K
+        )
+
+    @property
+    def cost_per_record(self) -> float:
+        return self.cost / self.succeeded if self.succeeded else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"📊 성공 {self.succeeded} / 실패 {self.failed} "
+            f"(요청 {self.requests}회, 재시도 {self.retries}회)\n"
+            f"   처리량: {self.records_per_second:.2f} records/s "
+            f"({self.elapsed:.1f}s)\n"
+            f"   토큰: 입력 {self.input_tokens} / 출력 {self.output_tokens}, "
+            f"비용 ${self.cost:.5f} (건당 ${self.cost_per_record:.6f})"
+        )
+
+
+def _pack_prompt(prompts: List[str]) -> str:
+    """여러 요청을 번호가 매겨진 하나의 프롬프트로 묶기"""
+    lines = [
+        f"다음 {len(prompts)}개 요청 각각에 대해 국가 정보를 하나씩, "
+        "요청 순서대로 countries 목록에 담아 답하세요."
+    ]
+    lines.extend(f"{i}. {prompt}" for i, prompt in enumerate(prompts, 1))
+    return "\n".join(lines)
+
+
+class BatchExtractor:
+    """llm.with_structured_output(Country) 기반 대량 추출기"""
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        pack_size: int = PACK_SIZE,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        """
+        초기화
+
+        Args:
+            max_concurrency: 동시에 보낼 최대 요청 수
+            pack_size: 요청 하나에 묶을 항목 수 (CountryList 래퍼 스키마 사용)
+            max_attempts: 항목별 최대 시도 횟수
+        """
+        self.max_concurrency = max_concurrency
+        self.pack_size = pack_size
+        self.max_attempts = max_attempts
+        # include_raw=True: 파싱 실패를 예외 대신 값으로 받고, 토큰 사용량도 확인
+        self.single_model = llm.with_structured_output(Country, include_raw=True)
+        self.packed_model = llm.with_structured_output(CountryList, include_raw=True)
+        self.stats = BatchStats()
+
+    def _record_usage(self, raw) -> None:
+        usage = getattr(raw, "usage_metadata", None) or {}
+        self.stats.input_tokens += usage.get("input_tokens", 0)
+        self.stats.output_tokens += usage.get("output_tokens", 0)
+
+    async def _extract_pack(self, items: List[ExtractionResult]) -> None:
+        """항목 묶음 하나를 요청하고 각 항목에 결과/에러 기록"""
+        for item in items:
+            item.attempts += 1
+        self.stats.requests += 1
+
+        try:
+            if len(items) == 1:
+                output = await self.single_model.ainvoke(items[0].prompt)
+                records = [output["parsed"]] if output["parsed"] else []
+            else:
+                output = await self.packed_model.ainvoke(
+                    _pack_prompt([item.prompt for item in items])
+                )
+                parsed = output["parsed"]
+                records = parsed.countries if parsed else []
+            self._record_usage(output["raw"])
+            error = output["parsing_error"]
+        except Exception as e:
+            records, error = [], e
+
+        # 개수가 맞지 않으면 순서 대응을 믿을 수 없으므로 묶음 전체를 실패로 처리
+        if len(records) != len(items):
+            for item in items:
+                item.error = str(error or f"{len(records)}/{len(items)}개만 추출됨")
+            return
+        for item, record in zip(items, records):
+            item.record, item.error = record, None
+
+    async def astream(self, prompts: Iterable[str]) -> AsyncIterator[ExtractionResult]:
+        """
+        프롬프트들을 병렬 추출하며 최종 결과(성공 또는 시도 소진)를 도착 순서대로 반환
+
+        실패한 항목은 단건 요청으로만 다시 시도합니다.
+        """
+        self.stats = BatchStats()
+        items = [ExtractionResult(i, p) for i, p in enumerate(prompts)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(pack: List[ExtractionResult]) -> List[ExtractionResult]:
+            async with semaphore:
+                await self._extract_pack(pack)
+            return pack
+
+        packs = [
+            items[i : i + self.pack_size]
+            for i in range(0, len(items), self.pack_size)
+        ]
+        pending = {asyncio.ensure_future(run(pack)) for pack in packs}
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                for item in task.result():
+                    if item.ok:
+                        self.stats.succeeded += 1
+                        yield item
+                    elif item.attempts < self.max_attempts:
+                        self.stats.retries += 1
+                        pending.add(asyncio.ensure_future(run([item])))
+                    else:
+                        self.stats.failed += 1
+                        yield item
+
+        self.stats.finished_at = time.perf_counter()
+
+    async def aextract(self, prompts: Iterable[str]) -> List[ExtractionResult]:
+        """모든 결과를 입력 순서대로 반환"""
+        results = [result async for result in self.astream(prompts)]
+        return sorted(results, key=lambda r: r.index)
+
+    def extract(self, prompts: Iterable[str]) -> List[ExtractionResult]:
+        """동기 버전 aextract"""
+        return asyncio.run(self.aextract(prompts))
+
+
+if __name__ == "__main__":
+    countries = ["대한민국", "일본", "프랑스", "브라질", "캐나다", "이집트"]
+    prompts = [f"{name}에 대한 간단한 정보를 알려줘." for name in countries]
+
+    async def main() -> None:
+        extractor = BatchExtractor(max_concurrency=4, pack_size=2)
+        async for result in extractor.astream(prompts):
+            status = result.record if result.ok else f"❌ {result.error}"
+            print(f"[{result.index}] (시도 {result.attempts}) {status}")
+        print(extractor.stats.summary())
+
+    asyncio.run(main())
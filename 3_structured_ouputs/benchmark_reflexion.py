@@ -0,0 +1,253 @@
+# ==============================================
+# Reflexion 그래프 오프라인 벤치마크
+# ==============================================
+# OpenAI/Tavily 없이 가짜 구조화 출력 체인과 가짜 검색 도구로
+# reflexion_graph.build_graph()의 draft → execute_tools → revise 그래프를 실행해
+# 프레임워크 자체 오버헤드를 측정합니다.
+#
+# 측정 항목:
+#   - 노드별 지연 시간 (p50/p95)
+#   - LLM 호출당 오버헤드 = (LLM 노드 실행 시간 - 가짜 모델이 잠든 시간) / LLM 호출 수
+#   - 메모리 증가량 (tracemalloc, 실행을 느리게 하므로 시간 측정과 별도 실행)
+#   - 동시 실행 1/10/100개에서의 처리량
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python benchmark_reflexion.py
+#   PYTHONPATH=../4_state_deepdive python benchmark_reflexion.py \
+#       --concurrency 1 10 100 --llm-latency 0.05 --search-latency 0.02 --json out.json
+#   PYTHONPATH=../4_state_deepdive python benchmark_reflexion.py --concurrency 10 --heatmap
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool
+
+from execute_tools import compaction_stats
+from graph_utils import ConvergencePolicy, ExecutionRecorder, GraphVisualizer
+from reflexion_graph import MAX_REVISIONS, build_graph
+from schema import AnswerQuestion, Reflection, ReviseAnswer
+
+
+class LatencyModel:
+    """로그정규 분포 지연 시간 (중앙값 median초, 퍼짐 정도 sigma)
+
+    실제로 잠든 시간을 누적해 전체 실행 시간에서 뺄 수 있게 합니다.
+    """
+
+    def __init__(self, median: float, sigma: float = 0.3, seed: int = 0):
+        self.median = median
+        self.sigma = sigma
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.slept = 0.0
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.median <= 0:
+                return 0.0
+            delay = self.median * self._random.lognormvariate(0, self.sigma)
+            self.slept += delay
+            return delay
+
+
+class FakeStructuredChain(Runnable):
+    """prompt | llm.with_structured_output(schema)를 흉내 내는 가짜 체인
+
+    FakeListChatModel처럼 미리 만든 응답을 순서대로 돌려주되, 문자열 대신
+    pydantic 객체를 반환하고 지정한 분포만큼 지연됩니다.
+    """
+
+    def __init__(self, make_response: Callable[[int], Any], latency: LatencyModel):
+        self._counter = itertools.count()
+        self.make_response = make_response
+        self.latency = latency
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        time.sleep(self.latency.sample())
+        return self.make_response(next(self._counter))
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        await asyncio.sleep(self.latency.sample())
+        return self.make_response(next(self._counter))
+
+
+class FakeSearchTool(BaseTool):
+    """TavilySearchResults와 같은 형태의 결과를 돌려주는 가짜 검색 도구"""
+
+    name: str = "tavily_search_results_json"
+    description: str = "가짜 검색 도구 (벤치마크용)"
+    latency: Any = None
+    results_per_query: int = 5
+
+    def _results(self, query: str) -> List[dict]:
+        return [
+            {
+                "url": f"https://example.com/{abs(hash(query)) % 1000}/{i}",
+                "content": f"{query} 관련 검색 결과 {i}. " + "내용 " * 60,
+            }
+            for i in range(self.results_per_query)
+        ]
+
+    def _run(self, query: str) -> List[dict]:
+        time.sleep(self.latency.sample())
+        return self._results(query)
+
+    async def _arun(self, query: str) -> List[dict]:
+        await asyncio.sleep(self.latency.sample())
+        return self._results(query)
+
+
+def _reflection() -> Reflection:
+    # 점수를 낮게 두어 조기 종료 없이 최대 수정 횟수까지 반복
+    return Reflection(missing="근거 부족", superfluous="없음", score=1)
+
+
+def make_fakes(args: argparse.Namespace):
+    """가짜 초안/수정 체인과 검색 도구 생성"""
+    llm_latency = LatencyModel(args.llm_latency, args.sigma, seed=1)
+    search_latency = LatencyModel(args.search_latency, args.sigma, seed=2)
+    queries = [f"query {i}" for i in range(args.queries)]
+
+    draft = FakeStructuredChain(
+        lambda n: AnswerQuestion(
+            search_queries=queries, answer=f"초안 {n} " * 50, reflection=_reflection()
+        ),
+        llm_latency,
+    )
+    revise = FakeStructuredChain(
+        # 수정본마다 내용이 달라야 수렴(유사도) 종료가 일어나지 않음
+        lambda n: ReviseAnswer(
+            search_queries=queries,
+            answer=" ".join(random.Random(n).choice("가나다라마바사") * 5 for _ in range(50)),
+            reflection=_reflection(),
+            references=["https://example.com"],
+        ),
+        llm_latency,
+    )
+    search = FakeSearchTool(latency=search_latency)
+    return draft, revise, search, [llm_latency, search_latency]
+
+
+def run_level(app, concurrency: int, runs: int, mode: str, timer) -> float:
+    """동시 실행 concurrency개로 총 runs번 실행하고 걸린 시간 반환"""
+    config = {"callbacks": [timer], "recursion_limit": 50}
+    inputs = [
+        {"messages": [HumanMessage(content=f"질문 {i}: AI 에이전트란?")]}
+        for i in range(runs)
+    ]
+
+    start = time.perf_counter()
+    if mode == "async":
+
+        async def main():
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one(inp):
+                async with semaphore:
+                    return await app.ainvoke(inp, config)
+
+            await asyncio.gather(*(one(inp) for inp in inputs))
+
+        asyncio.run(main())
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda inp: app.invoke(inp, config), inputs))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reflexion 그래프 오프라인 벤치마크")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--runs", type=int, default=0, help="수준별 실행 수 (기본: 동시 실행 수 x 2, 최소 10)")
+    parser.add_argument("--mode", choices=["async", "sync"], default="async")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="가짜 LLM 지연 중앙값 (초)")
+    parser.add_argument("--search-latency", type=float, default=0.02, help="가짜 검색 지연 중앙값 (초)")
+    parser.add_argument("--sigma", type=float, default=0.3, help="로그정규 분포 퍼짐 정도")
+    parser.add_argument("--queries", type=int, default=3, help="단계별 검색 쿼리 수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--heatmap", action="store_true", help="마지막 수준의 노드 지연 히트맵 저장")
+    args = parser.parse_args()
+
+    results = []
+    for concurrency in args.concurrency:
+        runs = args.runs or max(concurrency * 2, 10)
+
+        # 1) 시간 측정 실행
+        draft, revise, search, latencies = make_fakes(args)
+        app = build_graph(draft, revise, search, ConvergencePolicy(max_iterations=MAX_REVISIONS))
+        timer = ExecutionRecorder()
+        elapsed = run_level(app, concurrency, runs, args.mode, timer)
+
+        # 2) 메모리 측정 실행 (tracemalloc은 실행을 몇 배 느리게 하므로 새 그래프로 따로)
+        draft, revise, search, _ = make_fakes(args)
+        traced = build_graph(draft, revise, search, ConvergencePolicy(max_iterations=MAX_REVISIONS))
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        run_level(traced, concurrency, runs, args.mode, ExecutionRecorder())
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        llm_latency, _ = latencies
+        summary = timer.summary()
+        # 검색은 쿼리끼리 병렬로 잠들어 합계를 뺄 수 없으므로 LLM 노드만 사용
+        llm_nodes = [summary[node] for node in ("draft", "revise") if node in summary]
+        llm_total = sum(stats["total"] for stats in llm_nodes)
+        llm_calls = sum(stats["count"] for stats in llm_nodes) or 1
+        result = {
+            "concurrency": concurrency,
+            "runs": runs,
+            "mode": args.mode,
+            "elapsed_s": elapsed,
+            "throughput_runs_per_s": runs / elapsed,
+            # LLM 노드 실행 시간에서 가짜 지연을 뺀 값 = 프레임워크/상태 처리 오버헤드
+            "overhead_per_llm_call_ms": (llm_total - llm_latency.slept) / llm_calls * 1000,
+            "memory_growth_kb": (after - before) / 1024,
+            "memory_peak_kb": peak / 1024,
+            "nodes": {
+                node: {k: v * 1000 if k != "count" else v for k, v in stats.items()}
+                for node, stats in summary.items()
+            },
+        }
+        results.append(result)
+
+        print(
+            f"\n⚙️ 동시 실행 {concurrency} ({args.mode}, {runs}회): "
+            f"{result['throughput_runs_per_s']:.1f} runs/s, "
+            f"LLM 호출당 오버헤드 {result['overhead_per_llm_call_ms']:.2f}ms, "
+            f"메모리 +{result['memory_growth_kb']:.0f}KB (peak {result['memory_peak_kb']:.0f}KB)"
+        )
+        for node, stats in result["nodes"].items():
+            print(
+                f"   [{node}] {stats['count']}회 "
+                f"p50 {stats['p50']:.1f}ms / p95 {stats['p95']:.1f}ms"
+            )
+
+    print(compaction_stats.summary())
+
+    if args.heatmap:
+        GraphVisualizer().visualize_execution(
+            app, timer, "reflexion_benchmark", auto_open=False
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
+from graph_utils import cache_llm, lazy_chat_model
 from schema import AnswerQuestion, ReviseAnswer
 
 load_dotenv()
 
-# LLM 설정
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+# LLM 설정 (첫 호출 때 langchain_openai import + 클라이언트 생성)
+llm = lazy_chat_model("openai", model="gpt-4o-mini", temperature=0)
 
 # 초안 작성 프롬프트
 draft_prompt = ChatPromptTemplate.from_messages(
@@ -31,5 +31,14 @@ revise_prompt = ChatPromptTemplate.from_messages(
 )
 
 # 체인 생성 (LangGraph 1.0 방식)
-first_chain = draft_prompt | llm.with_structured_output(AnswerQuestion)
-revisor_chain = revise_prompt | llm.with_structured_output(ReviseAnswer)
+# temperature=0이므로 같은 입력의 재실행은 캐시된 pydantic 객체를 그대로 반환 (모델 호출 없음)
+first_chain = draft_prompt | cache_llm(llm.with_structured_output(AnswerQuestion))
+revisor_chain = revise_prompt | cache_llm(llm.with_structured_output(ReviseAnswer))
+
+# 스트리밍용 체인: 도구 호출 인자(JSON)를 토큰 단위로 받아 필드별로 파싱 (structured_stream.py)
+first_stream_chain = draft_prompt | llm.bind_tools(
+    [AnswerQuestion], tool_choice="AnswerQuestion"
+)
+revisor_stream_chain = revise_prompt | llm.bind_tools(
+    [ReviseAnswer], tool_choice="ReviseAnswer"
+)
@@ -0,0 +1,182 @@
+# ==============================================
+# 검색 결과 압축 (Compaction)
+# ==============================================
+# execute_tools의 원시 Tavily 결과를 revise 단계에 넘기기 전에
+# 1) URL 중복 및 거의 같은 스니펫 제거
+# 2) 질문과의 관련도로 정렬 (로컬 BM25 점수)
+# 3) 토큰 예산 안으로 잘라내기
+# 를 수행해 revisor_chain의 프롬프트 크기와 지연 시간을 줄입니다.
+
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+TOKEN_BUDGET = 1500  # 한 번의 도구 실행에서 revise로 넘길 최대 토큰 수 (추정치)
+NEAR_DUPLICATE = 0.7  # 스니펫 유사도(3-gram Jaccard)가 이 이상이면 중복으로 간주
+MIN_PARTIAL_TOKENS = 40  # 남은 예산이 이보다 작으면 잘린 패시지를 넣지 않음
+
+_WORD = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (약 4글자당 1토큰 - 네트워크/토크나이저 없이 계산)"""
+    return math.ceil(len(text) / 4)
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _shingles(words: List[str], n: int = 3) -> set:
+    if len(words) < n:
+        return {tuple(words)}
+    return {tuple(words[i : i + n]) for i in range(len(words) - n + 1)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def bm25_scores(query: str, passages: List[str], k1: float = 1.5, b: float = 0.75):
+    """질문 대비 각 패시지의 BM25 점수"""
+    docs = [_words(p) for p in passages]
+    if not docs:
+        return []
+    avg_len = sum(len(d) for d in docs) / len(docs) or 1
+    doc_freq = Counter(term for d in docs for term in set(d))
+    query_terms = set(_words(query))
+
+    scores = []
+    for doc in docs:
+        tf = Counter(doc)
+        score = 0.0
+        for term in query_terms:
+            if term not in tf:
+                continue
+            df = doc_freq[term]
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            norm = tf[term] + k1 * (1 - b + b * len(doc) / avg_len)
+            score += idf * tf[term] * (k1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+@dataclass
+class CompactionStats:
+    """압축 전후 통계"""
+
+    tokens_before: int = 0
+    tokens_after: int = 0
+    passages_before: int = 0
+    passages_after: int = 0
+    duplicates: int = 0
+
+    def add(self, other: "CompactionStats") -> None:
+        """다른 실행의 통계를 누적"""
+        self.tokens_before += other.tokens_before
+        self.tokens_after += other.tokens_after
+        self.passages_before += other.passages_before
+        self.passages_after += other.passages_after
+        self.duplicates += other.duplicates
+
+    def summary(self) -> str:
+        saved = self.tokens_before - self.tokens_after
+        ratio = saved / self.tokens_before if self.tokens_before else 0
+        return (
+            f"🗜️ 검색 결과 압축: {self.tokens_before} → {self.tokens_after} 토큰 "
+            f"({ratio:.0%} 절감), 패시지 {self.passages_before} → "
+            f"{self.passages_after}개 (중복 {self.duplicates}개 제거)"
+        )
+
+
+def compact_results(
+    question: str,
+    entries: List[Tuple[str, Any]],
+    token_budget: int = TOKEN_BUDGET,
+) -> Tuple[List[Any], CompactionStats]:
+    """
+    여러 검색 쿼리의 결과를 한꺼번에 압축
+
+    Args:
+        question: 원래 질문 (관련도 기준)
+        entries: (검색어, 검색 결과) 목록 - 결과는 [{"url", "content", ...}] 리스트
+            또는 에러 dict 등 그 밖의 값
+        token_budget: 전체 패시지에 허용할 토큰 수
+
+    Returns:
+        (entries와 같은 순서의 압축된 결과 목록, 통계)
+    """
+    stats = CompactionStats()
+    stats.tokens_before = estimate_tokens(
+        json.dumps([r for _, r in entries], ensure_ascii=False)
+    )
+
+    # 1) 패시지 펼치기 + URL/스니펫 중복 제거
+    passages = []  # (entry 번호, 패시지 dict)
+    seen_urls = set()
+    seen_shingles = []
+    for index, (_, result) in enumerate(entries):
+        if not isinstance(result, list):
+            continue
+        for item in result:
+            stats.passages_before += 1
+            if not isinstance(item, dict):
+                continue
+            url = item.get("url")
+            shingles = _shingles(_words(item.get("content", "")))
+            # URL이 없는 결과끼리는 URL로 비교하지 않음 (스니펫 유사도만 사용)
+            if (url and url in seen_urls) or any(
+                _jaccard(shingles, other) >= NEAR_DUPLICATE for other in seen_shingles
+            ):
+                stats.duplicates += 1
+                continue
+            if url:
+                seen_urls.add(url)
+            seen_shingles.append(shingles)
+            passages.append((index, item))
+
+    # 2) 질문 + 검색어 기준 관련도 정렬
+    texts = [
+        f"{entries[i][0]} {p.get('title', '')} {p.get('content', '')}"
+        for i, p in passages
+    ]
+    scores = bm25_scores(question, texts)
+    ranked = sorted(zip(scores, range(len(passages))), key=lambda x: -x[0])
+
+    # 3) 토큰 예산 안에서 관련도 높은 순으로 채우기 (마지막 패시지는 잘라서 포함)
+    remaining = token_budget
+    kept = {}
+    for _, pos in ranked:
+        if remaining <= 0:
+            break
+        index, item = passages[pos]
+        compact = {"url": item.get("url"), "content": item.get("content", "")}
+        tokens = estimate_tokens(json.dumps(compact, ensure_ascii=False))
+        if tokens > remaining:
+            if remaining < MIN_PARTIAL_TOKENS:
+                continue  # 더 짧은 패시지가 남은 예산에 들어갈 수 있음
+            # 초과분은 URL/이스케이프까지 포함한 JSON 크기 기준이므로 본문보다 클 수 있음
+            overflow_chars = (tokens - remaining) * 4
+            content = compact["content"]
+            keep_chars = max(0, len(content) - overflow_chars)
+            if estimate_tokens(content[:keep_chars]) < MIN_PARTIAL_TOKENS:
+                continue  # 남는 본문이 너무 짧으면 예산만 쓰므로 제외
+            compact["content"] = content[:keep_chars] + "…"
+            tokens = remaining
+        kept[pos] = (index, compact)
+        remaining -= tokens
+
+    # 원래 쿼리별로 다시 묶되, 쿼리 안에서는 원래 순서 유지
+    compacted = [r if not isinstance(r, list) else [] for _, r in entries]
+    for pos in sorted(kept):
+        index, compact = kept[pos]
+        compacted[index].append(compact)
+
+    stats.passages_after = len(kept)
+    stats.tokens_after = estimate_tokens(json.dumps(compacted, ensure_ascii=False))
+    return compacted, stats
@@ -1,42 +1,220 @@
+import asyncio
 import json
-from typing import List
-from unittest.mock import Base
-from langchain_core.messages import AIMessage, BaseMessage, ToolMessage, HumanMessage
-from langchain_community.tools import TavilySearchResults
+import threading
+import time
+from concurrent.futures import Future, wait
+from math import ceil
+from typing import Any, List, Optional, Tuple
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from compaction import TOKEN_BUDGET, CompactionStats, compact_results
+from graph_utils import lazy_tool
 
-tavily_tool = TavilySearchResults(search_depth="basic")
+# 리플렉션 루프에서 반복되는 검색은 캐시에서 반환
+# langchain_community 전체 대신 첫 검색 때 tavily_search 모듈만 import
+tavily_tool = lazy_tool("tavily_results", cached=True, search_depth="basic")
 
+SEARCH_TOOLS = ["AnswerQuestion", "ReviseAnswer"]  # 검색 쿼리를 담는 도구 이름
+SEARCH_TIMEOUT = 15.0  # 쿼리별 제한 시간 (초, 쿼리가 실행을 시작한 시점부터)
+MAX_CONCURRENCY = 8  # 도구 실행 한 번에서 동시에 실행할 최대 검색 수
 
-def execute_tools(state: List[BaseMessage]) -> List[BaseMessage]:
-    """도구 실행기"""
+# 검색 결과 압축 누적 통계 (실행 스크립트에서 compaction_stats.summary()로 출력)
+compaction_stats = CompactionStats()
+_stats_lock = threading.Lock()
+
+
+def _collect_queries(state: List[BaseMessage]) -> List[Tuple[str, str]]:
+    """마지막 AI 메시지의 모든 도구 호출에서 (tool_call_id, 검색어) 목록 추출"""
     last_ai_message: AIMessage = state[-1]  # 마지막 AI 메시지 가져오기
 
     if not hasattr(last_ai_message, "tool_calls") or not last_ai_message.tool_calls:
         return []  # 도구 호출이 없으면 종료
 
-    tool_messages: List[ToolMessage] = []
-
+    queries = []
     for tool_call in last_ai_message.tool_calls:
+        # 특정 도구에 대해 처리
+        if tool_call["name"] in SEARCH_TOOLS:
+            search_queries = tool_call["args"].get("search_queries")
+            queries.extend(queries_for_call(tool_call["id"], search_queries))
+    return queries
 
-        tool_name = tool_call["name"]  # 도구 이름
-        tool_args = tool_call["args"]  # 도구 인자
 
-        # 특정 도구에 대해 처리
-        if tool_name in ["AnswerQuestion", "ReviseAnswer"]:
+def queries_for_call(
+    call_id: str, search_queries: Optional[List[str]]
+) -> List[Tuple[str, str]]:
+    """도구 호출 하나의 (tool_call_id, 검색어) 목록"""
+    if not search_queries:
+        return [(call_id, None)]  # 검색어 없어도 ToolMessage는 필요
+    return [(call_id, query) for query in search_queries]
+
+
+def _to_tool_messages(
+    state: List[BaseMessage],
+    queries: List[Tuple[str, str]],
+    results: List[object],
+    token_budget: int,
+) -> List[ToolMessage]:
+    """검색 결과를 압축한 뒤 도구 호출별로 {검색어: 결과}를 모아
+    기존과 같은 ToolMessage 형태로 변환"""
+    question = next(
+        (m.content for m in state if isinstance(m, HumanMessage)), ""
+    )
+    searched = [(q, r) for (_, q), r in zip(queries, results) if q is not None]
+    compacted, stats = compact_results(question, searched, token_budget)
+    with _stats_lock:
+        compaction_stats.add(stats)
+
+    compacted = iter(compacted)
+    query_results = {}
+    for call_id, query in queries:
+        per_call = query_results.setdefault(call_id, {})
+        if query is not None:
+            per_call[query] = next(compacted)
+
+    # 도구 메시지 생성 및 추가
+    return [
+        ToolMessage(content=json.dumps(per_call), tool_call_id=call_id)
+        for call_id, per_call in query_results.items()
+    ]
+
+
+def execute_tools(
+    state: List[BaseMessage],
+    timeout: float = SEARCH_TIMEOUT,
+    token_budget: int = TOKEN_BUDGET,
+    search_tool: Optional[Any] = None,
+) -> List[BaseMessage]:
+    """도구 실행기
+
+    모든 AnswerQuestion/ReviseAnswer 호출의 검색 쿼리를 쿼리별 스레드에서 동시에 실행합니다.
+    실행을 시작하고 제한 시간 안에 끝나지 않은 쿼리는 {"error": ...}로 채워 나머지 결과만 반환합니다.
+
+    결과는 중복 제거, 관련도 정렬 후 token_budget 안으로 압축해 revise 단계에 넘깁니다.
+
+    Args:
+        state: 메시지 히스토리 (마지막이 도구 호출을 담은 AI 메시지)
+        timeout: 쿼리별 제한 시간 (초)
+        token_budget: 압축 후 검색 결과 전체의 최대 토큰 수
+        search_tool: 사용할 검색 도구 (None이면 tavily_tool, 벤치마크에서는 가짜 도구)
+    """
+    queries = _collect_queries(state)
+    if not queries:
+        return []
+
+    futures = start_searches(queries, search_tool)
+    return finish_searches(state, queries, futures, timeout, token_budget)
+
+
+def _start_search(tool: Any, query: str, slots: threading.Semaphore) -> Future:
+    """
+    검색 하나를 전용 데몬 스레드에서 실행
+
+    스레드는 멈출 수 없으므로 멈춘 검색은 끝날 때까지 스레드를 붙잡습니다.
+    공용 풀을 쓰면 그런 검색이 작업자를 차지해 이후 요청의 검색까지 줄을 서므로,
+    검색마다 스레드를 만들고 동시 실행 상한(slots)도 같은 도구 실행 안에서만 공유합니다.
+    """
+    future: Future = Future()
+    future.started_at = None  # 실행 시작 시각 (쿼리별 제한 시간의 기준)
+
+    def target() -> None:
+        with slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            future.started_at = time.monotonic()
+            try:
+                future.set_result(tool.run(tool_input=query))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=target, name="tavily", daemon=True).start()
+    return future
+
+
+def start_searches(
+    queries: List[Tuple[str, str]], search_tool: Optional[Any] = None
+) -> List[Future]:
+    """검색 쿼리들을 시작하고 바로 반환 (결과는 finish_searches로 수집)"""
+    tool = search_tool or tavily_tool
+    slots = threading.Semaphore(MAX_CONCURRENCY)
+    return [
+        _start_search(tool, query, slots)
+        for _, query in queries
+        if query is not None
+    ]
+
+
+def _wait_search(future: Future, timeout: float, hard_deadline: float) -> None:
+    """실행을 시작한 시점부터 timeout초까지 기다림 (시작 전이면 시작을 기다림)"""
+    while not future.done():
+        now = time.monotonic()
+        started_at = future.started_at
+        if started_at is None:
+            limit = hard_deadline
+            step = min(limit - now, 0.05)  # 시작하면 그 시각 기준으로 다시 계산
+        else:
+            limit = min(started_at + timeout, hard_deadline)
+            step = limit - now
+        if step <= 0:
+            return
+        wait([future], timeout=step)
+
+
+def finish_searches(
+    state: List[BaseMessage],
+    queries: List[Tuple[str, str]],
+    futures: List[Future],
+    timeout: float = SEARCH_TIMEOUT,
+    token_budget: int = TOKEN_BUDGET,
+) -> List[ToolMessage]:
+    """start_searches로 시작한 검색을 쿼리별 제한 시간까지 기다려 ToolMessage로 변환"""
+    # 동시 실행 상한 때문에 줄을 선 쿼리가 있어도 전체 대기는 대기열 순서만큼으로 제한
+    waves = ceil(len(futures) / MAX_CONCURRENCY) if futures else 0
+    hard_deadline = time.monotonic() + timeout * waves
+    for future in futures:
+        _wait_search(future, timeout, hard_deadline)
+
+    results = []
+    pending = iter(futures)
+    for _, query in queries:
+        if query is None:
+            results.append(None)
+            continue
+        future = next(pending)
+        if not future.done():
+            future.cancel()  # 아직 시작하지 않은 검색만 취소됨
+            results.append({"error": f"timeout after {timeout}s"})
+        elif future.exception() is not None:
+            results.append({"error": str(future.exception())})
+        else:
+            results.append(future.result())
+
+    return _to_tool_messages(state, queries, results, token_budget)
+
 
-            call_id = tool_call["id"]
-            search_queries = tool_args.get("search_queries", [])
-            queury_results = {}
+async def aexecute_tools(
+    state: List[BaseMessage],
+    timeout: float = SEARCH_TIMEOUT,
+    max_concurrency: int = MAX_CONCURRENCY,
+    token_budget: int = TOKEN_BUDGET,
+    search_tool: Optional[Any] = None,
+) -> List[BaseMessage]:
+    """비동기 도구 실행기 (ainvoke용) - execute_tools와 같은 결과 형태"""
+    queries = _collect_queries(state)
+    if not queries:
+        return []
 
-            # 각 검색 쿼리에 대해 도구 실행
-            for query in search_queries:
-                # Tavily 도구로 검색 실행
-                search_result = tavily_tool.run(tool_input=query)
-                queury_results[query] = search_result
+    tool = search_tool or tavily_tool
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-            # 도구 메시지 생성 및 추가
-            tool_messages.append(
-                ToolMessage(content=json.dumps(queury_results), tool_call_id=call_id)
-            )
+    async def search(query: str) -> object:
+        if query is None:
+            return None
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(tool.ainvoke(query), timeout)
+            except asyncio.TimeoutError:
+                return {"error": f"timeout after {timeout}s"}
+            except Exception as e:
+                return {"error": str(e)}
 
-    return tool_messages
+    results = await asyncio.gather(*(search(query) for _, query in queries))
+    return _to_tool_messages(state, queries, results, token_budget)
@@ -1,57 +1,195 @@
-from typing import TypedDict, Annotated, Literal
+import uuid
+from typing import Any, Optional, TypedDict, Annotated, Literal
 from langchain_core.messages import BaseMessage, AIMessage
-from langgraph.graph import StateGraph, add_messages
-from chains import first_chain, revisor_chain
-from execute_tools import execute_tools
-from graph_utils import show_graph
+from langchain_core.runnables import Runnable, RunnableLambda
+from langgraph.graph import END, StateGraph, add_messages
+from pydantic import BaseModel
+from chains import first_chain, first_stream_chain, revisor_chain, revisor_stream_chain
+from execute_tools import (
+    aexecute_tools,
+    execute_tools,
+    finish_searches,
+    queries_for_call,
+    start_searches,
+)
+from graph_utils import ConvergencePolicy, visualize_async
+from schema import AnswerQuestion, ReviseAnswer
+from structured_stream import FINAL, stream_fields, to_ai_message
+
+# 수정 횟수 상한 (기존 방식: 메시지 5개 이상에서 종료 = 수정 2회)
+MAX_REVISIONS = 2
+
+# 점수가 충분하거나 수정본이 더 이상 바뀌지 않으면 상한 전에 종료
+convergence = ConvergencePolicy(max_iterations=MAX_REVISIONS)
 
 
 class GraphState(TypedDict):
     """그래프 상태 정의"""
 
     messages: Annotated[list[BaseMessage], add_messages]
+    score: int
+
+
+def build_graph(
+    draft_chain: Runnable = first_chain,
+    revise_chain: Runnable = revisor_chain,
+    search_tool: Optional[Any] = None,
+    policy: ConvergencePolicy = convergence,
+):
+    """draft → execute_tools → revise 그래프 생성
+
+    기본값은 실제 체인/Tavily 검색을 사용하고, 벤치마크에서는
+    가짜 체인/검색 도구를 넣어 같은 그래프를 오프라인으로 실행합니다.
+
+    Args:
+        draft_chain: 초안 체인 (AnswerQuestion 반환)
+        revise_chain: 수정 체인 (ReviseAnswer 반환)
+        search_tool: 검색 도구 (None이면 execute_tools의 tavily_tool)
+        policy: 종료 정책
+    """
+
+    def draft_node(state: GraphState) -> GraphState:
+        """초안 작성"""
+        result = draft_chain.invoke({"messages": state["messages"]})
+        return {"messages": [to_ai_message(result)]}
 
+    async def adraft_node(state: GraphState) -> GraphState:
+        result = await draft_chain.ainvoke({"messages": state["messages"]})
+        return {"messages": [to_ai_message(result)]}
 
-def draft_node(state: GraphState) -> GraphState:
-    """초안 작성"""
-    result = first_chain.invoke({"messages": state["messages"]})
-    return {"messages": [AIMessage(content=result.answer)]}
+    def execute_tools_node(state: GraphState) -> GraphState:
+        """도구 실행 (검색 쿼리 동시 실행)"""
+        tool_results = execute_tools(state["messages"], search_tool=search_tool)
+        return {"messages": tool_results}
 
+    async def aexecute_tools_node(state: GraphState) -> GraphState:
+        """도구 실행 - ainvoke/astream용 비동기 버전"""
+        tool_results = await aexecute_tools(state["messages"], search_tool=search_tool)
+        return {"messages": tool_results}
 
-def execute_tools_node(state: GraphState) -> GraphState:
-    """도구 실행"""
-    tool_results = execute_tools(state["messages"])
-    return {"messages": tool_results}
+    def revise_node(state: GraphState) -> GraphState:
+        """답변 수정"""
+        result = revise_chain.invoke({"messages": state["messages"]})
+        return {
+            "messages": [to_ai_message(result)],
+            "score": result.reflection.score,
+        }
 
+    async def arevise_node(state: GraphState) -> GraphState:
+        result = await revise_chain.ainvoke({"messages": state["messages"]})
+        return {
+            "messages": [to_ai_message(result)],
+            "score": result.reflection.score,
+        }
 
-def revise_node(state: GraphState) -> GraphState:
-    """답변 수정"""
-    result = revisor_chain.invoke({"messages": state["messages"]})
-    return {"messages": [AIMessage(content=result.answer)]}
+    # 그래프 구성 (invoke()는 동기 함수, ainvoke()는 async 함수로 실행)
+    graph = StateGraph(GraphState)
+    graph.add_node("draft", RunnableLambda(draft_node, afunc=adraft_node))
+    graph.add_node(
+        "execute_tools", RunnableLambda(execute_tools_node, afunc=aexecute_tools_node)
+    )
+    graph.add_node("revise", RunnableLambda(revise_node, afunc=arevise_node))
 
+    graph.add_edge("draft", "execute_tools")
+    graph.add_edge("execute_tools", "revise")
+    graph.add_conditional_edges(
+        "revise", lambda state: should_continue(state, policy), ["execute_tools", END]
+    )
+    graph.set_entry_point("draft")
 
-def should_continue(state: GraphState) -> Literal["execute_tools", "__end__"]:
+    return graph.compile()
+
+
+def should_continue(
+    state: GraphState, policy: ConvergencePolicy = convergence
+) -> Literal["execute_tools", "__end__"]:
     """계속할지 결정"""
-    messages = state["messages"]
-    # 메시지가 5개 이상이면 종료 (초안 + 검색 + 수정 완료)
-    if len(messages) >= 5:
+    answers = [m.content for m in state["messages"] if isinstance(m, AIMessage)]
+    revisions = len(answers) - 1
+    # 점수 기준 충족, 수정본 수렴, 수정 횟수 상한 중 하나라도 해당하면 종료
+    if policy.check(revisions, state.get("score"), answers[-2], answers[-1]):
         return "__end__"
     return "execute_tools"
 
 
-# 그래프 구성
-graph = StateGraph(GraphState)
-graph.add_node("draft", draft_node)
-graph.add_node("execute_tools", execute_tools_node)
-graph.add_node("revise", revise_node)
+app = build_graph()
+
+
+# ==============================================
+# 파이프라인 모드: 답변 생성과 검색을 겹쳐서 실행
+# ==============================================
+# search_queries 필드가 완성되는 즉시 검색을 시작하고, 나머지 답변이 생성되는 동안
+# 검색이 진행됩니다. 초안/수정 노드가 검색 결과(ToolMessage)까지 함께 반환하므로
+# 별도의 execute_tools 노드가 없습니다.
+
+
+def pipelined_node(
+    chain: Runnable,
+    schema: type[BaseModel],
+    policy: Optional[ConvergencePolicy] = None,
+):
+    """구조화 출력을 스트리밍하면서 검색을 미리 시작하는 노드 생성
+
+    policy가 있으면(수정 노드) 검색 결과를 기다리기 전에 종료 여부를 먼저 판단해,
+    종료할 때는 검색을 취소하고 답변만 반환합니다.
+    """
+
+    def node(state: GraphState) -> GraphState:
+        call_id = f"call_{uuid.uuid4().hex}"
+        queries, futures, result = None, None, None
+
+        # 이번이 마지막 수정이면 (횟수 상한) 결과를 쓸 일이 없으므로 검색을 시작하지 않음
+        revision = sum(isinstance(m, AIMessage) for m in state["messages"])
+        last = policy is not None and revision >= policy.max_iterations
+
+        fields = stream_fields(chain, {"messages": state["messages"]}, schema)
+        for field, value in fields:
+            if field == "search_queries" and not last:
+                queries = queries_for_call(call_id, value)
+                futures = start_searches(queries)  # 답변 생성과 동시에 검색 시작
+            elif field == FINAL:
+                result = value
+
+        ai_message = to_ai_message(result, call_id)
+        update = {"messages": [ai_message], "score": result.reflection.score}
+        if policy is not None:
+            done = {**update, "messages": state["messages"] + update["messages"]}
+            if should_continue(done, policy) == "__end__":
+                for future in futures or []:
+                    future.cancel()  # 아직 시작하지 않은 검색은 취소
+                return update
+
+        tool_messages = finish_searches(
+            state["messages"] + [ai_message], queries, futures
+        )
+        update["messages"].extend(tool_messages)
+        return update
+
+    return node
+
+
+def should_continue_pipelined(state: GraphState) -> Literal["revise", "__end__"]:
+    """파이프라인 모드 라우팅 - 종료 여부는 revise 노드가 이미 판단
+
+    계속할 때만 검색 결과(ToolMessage)를 붙여 반환하므로 마지막 메시지가
+    AIMessage이면 종료합니다.
+    """
+    return "__end__" if isinstance(state["messages"][-1], AIMessage) else "revise"
+
+
+pipelined_graph = StateGraph(GraphState)
+pipelined_graph.add_node("draft", pipelined_node(first_stream_chain, AnswerQuestion))
+pipelined_graph.add_node(
+    "revise", pipelined_node(revisor_stream_chain, ReviseAnswer, convergence)
+)
+
+pipelined_graph.add_edge("draft", "revise")
+pipelined_graph.add_conditional_edges("revise", should_continue_pipelined)
+pipelined_graph.set_entry_point("draft")
 
-graph.add_edge("draft", "execute_tools")
-graph.add_edge("execute_tools", "revise")
-graph.add_conditional_edges("revise", should_continue)
-graph.set_entry_point("draft")
+pipelined_app = pipelined_graph.compile()
 
-app = graph.compile()
 if __name__ == "__main__":
     # 그래프 시각화 (PNG 이미지로 바로 보기)
     print("Reflexion Agent 그래프 시각화")
-    show_graph(app, "reflexion_agent")
+    visualize_async(app, "reflexion_agent")
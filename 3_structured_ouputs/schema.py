@@ -21,6 +21,11 @@ class Reflection(BaseModel):
     superfluous: str = Field(
         description="불필요한 내용에 대한 비판적 분석 - 답변에서 제거해야 할 부분들"
     )
+    score: int = Field(
+        description="현재 답변의 품질 점수 (1~10, 10이 최고) - 조기 종료 판단에 사용",
+        ge=1,
+        le=10,
+    )
 
 
 class AnswerQuestion(BaseModel):
@@ -28,14 +33,17 @@ class AnswerQuestion(BaseModel):
 
     AI가 질문에 대한 완전한 답변을 생성할 때 사용하는 구조화된 형식입니다.
     답변, 추가 검색 쿼리, 자체 비판 모두 포함합니다.
+
+    필드 순서대로 JSON이 생성되므로 search_queries를 가장 앞에 두어,
+    스트리밍 시 답변이 생성되는 동안 검색을 먼저 시작할 수 있게 합니다.
     """
 
-    answer: str = Field(
-        description="질문에 대한 ~250단어 분량의 답변 - 핵심 내용을 포괄적으로 다룸"
-    )
     search_queries: List[str] = Field(
         description="답변 개선을 위한 1-3개의 추가 검색 쿼리 - 더 나은 정보 수집을 위한 검색 키워드"
     )
+    answer: str = Field(
+        description="질문에 대한 ~250단어 분량의 답변 - 핵심 내용을 포괄적으로 다룸"
+    )
     reflection: Reflection = Field(
         description="답변 품질에 대한 자체 비판 - 누락 및 불필요한 부분 분석"
     )
@@ -47,3 +55,21 @@ class ReviseAnswer(AnswerQuestion):
     references: List[str] = Field(
         description="참고자료 - 수정된 답변을 뒷받침하는 인용문헌 목록"
     )
+
+
+class Country(BaseModel):
+    """국가 정보 스키마 (types.py 단건 추출, batch_extract.py 대량 추출에서 사용)"""
+
+    name: str = Field(..., description="국가 이름")
+    capital: str = Field(..., description="수도 이름")
+    language: str = Field(..., description="언어")
+    population: int = Field(..., description="인구 수")
+    area: float = Field(..., description="면적 (제곱킬로미터)")
+
+
+class CountryList(BaseModel):
+    """여러 국가를 한 번의 요청으로 추출하기 위한 래퍼 스키마"""
+
+    countries: List[Country] = Field(
+        description="요청 순서와 같은 순서의 국가 정보 목록 - 요청 하나당 정확히 하나"
+    )
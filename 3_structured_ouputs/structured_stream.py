@@ -0,0 +1,74 @@
+# ==============================================
+# 구조화 출력 점진적 스트리밍
+# ==============================================
+# with_structured_output()은 JSON 전체가 끝나야 결과를 돌려주므로,
+# 도구 호출 인자(JSON)를 토큰 단위로 받아 부분 파싱하고
+# 필드가 완성되는 즉시 (필드 이름, 값)을 내보냅니다.
+# → search_queries가 완성되면 나머지 답변이 생성되는 동안 검색을 시작할 수 있습니다.
+
+import uuid
+from typing import Any, Iterator, Optional, Tuple, Type
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+FINAL = "__final__"  # 마지막 이벤트: 검증된 pydantic 객체
+
+
+def stream_fields(
+    chain: Runnable, input: Any, schema: Type[BaseModel]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    도구 호출 체인을 스트리밍하며 완성된 최상위 필드를 순서대로 반환
+
+    JSON 객체의 키는 순서대로 생성되므로, 부분 파싱 결과에서 새 키가 나타나면
+    그 앞의 키들은 완성된 것으로 봅니다.
+
+    Args:
+        chain: prompt | llm.bind_tools([schema], tool_choice=...) 형태의 체인
+        input: 체인 입력
+        schema: 결과 검증에 사용할 pydantic 스키마
+
+    Yields:
+        (필드 이름, 값) - 마지막은 (FINAL, schema 객체)
+    """
+    gathered: Optional[AIMessageChunk] = None
+    emitted = set()
+
+    for chunk in chain.stream(input):
+        gathered = chunk if gathered is None else gathered + chunk
+        if not gathered.tool_calls:
+            continue
+        # AIMessageChunk가 tool_call_chunks의 부분 JSON을 dict로 파싱해 둠
+        args = gathered.tool_calls[0]["args"]
+        for name in list(args)[:-1]:
+            if name not in emitted:
+                emitted.add(name)
+                yield name, args[name]
+
+    if gathered is None or not gathered.tool_calls:
+        raise ValueError(f"{schema.__name__} 도구 호출이 생성되지 않았습니다.")
+
+    result = schema.model_validate(gathered.tool_calls[0]["args"])
+    for name in type(result).model_fields:
+        if name not in emitted:
+            yield name, getattr(result, name)
+    yield FINAL, result
+
+
+def to_ai_message(result: BaseModel, call_id: Optional[str] = None) -> AIMessage:
+    """구조화 출력을 도구 호출이 담긴 AI 메시지로 변환
+
+    execute_tools가 tool_calls의 search_queries를 읽으므로 답변과 함께 도구 호출을 남깁니다.
+    """
+    return AIMessage(
+        content=result.answer,
+        tool_calls=[
+            {
+                "name": type(result).__name__,
+                "args": result.model_dump(),
+                "id": call_id or f"call_{uuid.uuid4().hex}",
+            }
+        ],
+    )
@@ -1,20 +1,10 @@
-from langchain_text_splitters import Language
-from pydantic import BaseModel, Field
-from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
+from graph_utils import lazy_chat_model
+from schema import Country
 
 load_dotenv()
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash")
-
-
-class Country(BaseModel):
-    name: str = Field(..., description="국가 이름")
-    capital: str = Field(..., description="수도 이름")
-    language: str = Field(..., description="언어")
-    population: int = Field(..., description="인구 수")
-    area: float = Field(..., description="면적 (제곱킬로미터)")
-
+llm = lazy_chat_model("google_genai", model="gemini-2.5-flash")
 
 country_output_model = llm.with_structured_output(Country)
 
@@ -1,6 +1,6 @@
 from typing import TypedDict
 from langgraph.graph import StateGraph
-from graph_utils.visualizer import quick_visualize
+from graph_utils import visualize_async
 
 
 class SimpleState(TypedDict):
@@ -33,7 +33,8 @@ app = workflow.compile()
 
 state: SimpleState = {"count": 0}
 
+# 렌더링은 백그라운드에서 진행하고 그래프는 바로 실행 (종료 시 자동으로 마무리됨)
+visualize_async(app)
+
 result = app.invoke(state)
 print("최종 상태:", result)
-
-quick_visualize(app)
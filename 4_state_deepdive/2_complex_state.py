@@ -1,14 +1,15 @@
 import operator
 from langgraph.graph import StateGraph
-from typing import TypedDict, List, Annotated
+from typing import TypedDict, Annotated
 
-from graph_utils.visualizer import quick_visualize
+from graph_utils import AppendOnlyHistory, append_history, visualize_async
 
 
 class SimpleState(TypedDict):
     count: int
     sum: Annotated[int, operator.add]
-    history: Annotated[List[int], operator.concat]
+    # operator.concat은 매 스텝 전체 리스트를 복사 → 추가 전용 리듀서 사용
+    history: Annotated[AppendOnlyHistory, append_history]
 
 
 def increment(state: SimpleState) -> SimpleState:
@@ -47,7 +48,8 @@ app = workflow.compile()
 state: SimpleState = {"count": 0, "sum": 0, "history": []}
 
 
-quick_visualize(app)
+# 렌더링은 백그라운드에서 진행하고 그래프는 바로 실행
+visualize_async(app)
 result = app.invoke(state)
 
 print("최종 상태:", result)
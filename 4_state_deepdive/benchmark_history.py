@@ -0,0 +1,162 @@
+# ==============================================
+# 히스토리 리듀서 벤치마크: operator.concat vs append_history
+# ==============================================
+# 1) 리듀서 단독: 슈퍼스텝마다 항목 하나를 추가하는 상황을 10k ~ 1M 스텝으로 재현
+#    - 실행 시간, tracemalloc 최대 메모리, 체크포인트 직렬화 크기/시간
+# 2) 그래프: 2_complex_state.py와 같은 카운터 그래프를 두 리듀서로 실행
+#
+# operator.concat은 O(N²)이라 큰 N에서는 --concat-max 이상을 건너뜁니다.
+#
+# 실행 예:
+#   python benchmark_history.py
+#   python benchmark_history.py --steps 10000 100000 1000000 --graph-steps 1000 5000 --json history.json
+
+import argparse
+import json
+import operator
+import time
+import tracemalloc
+from typing import Annotated, Any, Callable, List, TypedDict
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, StateGraph
+
+from graph_utils import AppendOnlyHistory, append_history
+
+REDUCERS = {
+    "operator.concat": (operator.concat, list),
+    "append_history": (append_history, AppendOnlyHistory),
+}
+
+
+def run_reducer(reducer: Callable, initial: Any, steps: int) -> Any:
+    """슈퍼스텝마다 [i]를 반영하는 것과 같은 누적"""
+    value = initial
+    for i in range(steps):
+        value = reducer(value, [i])
+    return value
+
+
+def bench_reducer(name: str, steps: int) -> dict:
+    reducer, factory = REDUCERS[name]
+
+    start = time.perf_counter()
+    value = run_reducer(reducer, factory(), steps)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc은 실행을 느리게 하므로 메모리는 별도 실행으로 측정
+    tracemalloc.start()
+    value = run_reducer(reducer, factory(), steps)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    serde = JsonPlusSerializer()
+    start = time.perf_counter()
+    _, payload = serde.dumps_typed(value)
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    restored = serde.loads_typed((_, payload))
+    load_time = time.perf_counter() - start
+    assert len(restored) == steps
+
+    return {
+        "reducer": name,
+        "steps": steps,
+        "elapsed_s": elapsed,
+        "per_step_us": elapsed / steps * 1e6,
+        "memory_final_kb": current / 1024,
+        "memory_peak_kb": peak / 1024,
+        "serialized_kb": len(payload) / 1024,
+        "dump_ms": dump_time * 1000,
+        "load_ms": load_time * 1000,
+    }
+
+
+def build_graph(reducer: Callable, history_type: type, limit: int):
+    """2_complex_state.py의 카운터 그래프 (print 노드 제외, limit번 반복)"""
+
+    class CounterState(TypedDict):
+        count: int
+        sum: Annotated[int, operator.add]
+        history: Annotated[history_type, reducer]
+
+    def increment(state: CounterState) -> CounterState:
+        new_count = state["count"] + 1
+        return {"count": new_count, "sum": new_count, "history": [new_count]}
+
+    def should_continue(state: CounterState) -> str:
+        return "continue" if state["count"] < limit else "stop"
+
+    workflow = StateGraph(CounterState)
+    workflow.add_node("increment", increment)
+    workflow.set_entry_point("increment")
+    workflow.add_conditional_edges(
+        "increment", should_continue, {"continue": "increment", "stop": END}
+    )
+    return workflow.compile()
+
+
+def bench_graph(name: str, steps: int) -> dict:
+    reducer, factory = REDUCERS[name]
+    history_type = List[int] if factory is list else AppendOnlyHistory
+    app = build_graph(reducer, history_type, steps)
+
+    start = time.perf_counter()
+    result = app.invoke(
+        {"count": 0, "sum": 0, "history": []},
+        {"recursion_limit": steps + 10},
+    )
+    elapsed = time.perf_counter() - start
+    assert len(result["history"]) == steps
+
+    return {
+        "reducer": name,
+        "graph_steps": steps,
+        "elapsed_s": elapsed,
+        "per_step_us": elapsed / steps * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="히스토리 리듀서 벤치마크")
+    parser.add_argument("--steps", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--graph-steps", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--concat-max", type=int, default=100_000, help="operator.concat을 실행할 최대 스텝 수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = {"reducer": [], "graph": []}
+
+    print("📚 리듀서 단독")
+    for steps in args.steps:
+        for name in REDUCERS:
+            if name == "operator.concat" and steps > args.concat_max:
+                print(f"   {name:16} {steps:>9} 스텝: 건너뜀 (O(N²), --concat-max)")
+                continue
+            r = bench_reducer(name, steps)
+            results["reducer"].append(r)
+            print(
+                f"   {name:16} {steps:>9} 스텝: {r['elapsed_s']:.3f}s "
+                f"({r['per_step_us']:.2f}µs/스텝), peak {r['memory_peak_kb']:.0f}KB, "
+                f"직렬화 {r['serialized_kb']:.0f}KB "
+                f"(dump {r['dump_ms']:.1f}ms / load {r['load_ms']:.1f}ms)"
+            )
+
+    print("\n🔁 그래프 실행")
+    for steps in args.graph_steps:
+        for name in REDUCERS:
+            r = bench_graph(name, steps)
+            results["graph"].append(r)
+            print(
+                f"   {name:16} {steps:>9} 스텝: {r['elapsed_s']:.3f}s "
+                f"({r['per_step_us']:.1f}µs/스텝)"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# ==============================================
+# StateGraph 슈퍼스텝 오버헤드 벤치마크
+# ==============================================
+# 1_basic_state.py / 2_complex_state.py의 카운터 그래프를 N번 반복하도록 키워
+# 모델 호출 없이 LangGraph 오케스트레이션 자체 비용을 측정합니다.
+#
+# 조합: 그래프(basic, complex) x 체크포인터(none, memory, sqlite) x 실행(invoke, stream)
+# 측정: 슈퍼스텝당 지연 시간(stream은 p50/p95 포함), tracemalloc 할당량, 최대 RSS
+#
+# 최대 RSS는 프로세스 전체 기준으로만 커지므로 조합마다 하위 프로세스에서 실행합니다.
+#
+# 실행 예:
+#   python benchmark_superstep.py
+#   python benchmark_superstep.py --steps 100 1000 --checkpointers none sqlite --json superstep.json
+
+import argparse
+import json
+import operator
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Annotated, TypedDict
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph import END, StateGraph
+
+from graph_utils import AppendOnlyHistory, append_history, percentile
+
+GRAPHS = ["basic", "complex"]
+CHECKPOINTERS = ["none", "memory", "sqlite"]
+MODES = ["invoke", "stream"]
+
+
+class BasicState(TypedDict):
+    count: int
+
+
+class ComplexState(TypedDict):
+    count: int
+    sum: Annotated[int, operator.add]
+    history: Annotated[AppendOnlyHistory, append_history]
+
+
+def build_basic(limit: int) -> StateGraph:
+    """1_basic_state.py: increment 노드 하나가 자기 자신으로 반복"""
+
+    def increment_node(state: BasicState) -> BasicState:
+        return {"count": state["count"] + 1}
+
+    def should_continue(state: BasicState) -> str:
+        return "continue" if state["count"] < limit else "stop"
+
+    workflow = StateGraph(BasicState)
+    workflow.add_node("increment", increment_node)
+    workflow.add_conditional_edges(
+        "increment", should_continue, {"continue": "increment", "stop": END}
+    )
+    workflow.set_entry_point("increment")
+    return workflow
+
+
+def build_complex(limit: int) -> StateGraph:
+    """2_complex_state.py: increment → print 두 노드 반복 (출력은 생략)"""
+
+    def increment(state: ComplexState) -> ComplexState:
+        new_count = state["count"] + 1
+        return {"count": new_count, "sum": new_count, "history": [new_count]}
+
+    def print_state(state: ComplexState) -> ComplexState:
+        return {}
+
+    def should_continue(state: ComplexState) -> str:
+        return "continue" if state["count"] < limit else "stop"
+
+    workflow = StateGraph(ComplexState)
+    workflow.add_node("increment", increment)
+    workflow.add_node("print", print_state)
+    workflow.set_entry_point("increment")
+    workflow.add_conditional_edges(
+        "increment", should_continue, {"continue": "print", "stop": END}
+    )
+    workflow.add_edge("print", "increment")
+    return workflow
+
+
+def initial_state(graph: str) -> dict:
+    if graph == "basic":
+        return {"count": 0}
+    return {"count": 0, "sum": 0, "history": []}
+
+
+def supersteps(graph: str, steps: int) -> int:
+    # complex는 반복마다 increment, print 두 슈퍼스텝 (마지막 반복은 print 없음)
+    return steps if graph == "basic" else 2 * steps - 1
+
+
+def make_checkpointer(kind: str, workdir: str):
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemorySaver()
+    conn = sqlite3.connect(
+        os.path.join(workdir, "checkpoints.sqlite"), check_same_thread=False
+    )
+    return SqliteSaver(conn)
+
+
+def execute(app, graph: str, mode: str, steps: int, thread_id: str) -> list:
+    """그래프를 한 번 실행하고 stream 모드면 슈퍼스텝 간 간격 목록 반환"""
+    config = {
+        "recursion_limit": supersteps(graph, steps) + 10,
+        "configurable": {"thread_id": thread_id},
+    }
+    if mode == "invoke":
+        app.invoke(initial_state(graph), config)
+        return []
+
+    gaps = []
+    last = time.perf_counter()
+    for _ in app.stream(initial_state(graph), config, stream_mode="updates"):
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+    return gaps
+
+
+def run_single(graph: str, checkpointer: str, mode: str, steps: int) -> dict:
+    """조합 하나 측정 (하위 프로세스에서 호출)"""
+    builder = build_basic if graph == "basic" else build_complex
+
+    with tempfile.TemporaryDirectory() as workdir:
+        saver = make_checkpointer(checkpointer, workdir)
+        app = builder(steps).compile(checkpointer=saver)
+        total_steps = supersteps(graph, steps)
+
+        # 짧은 그래프로 워밍업 (지연 임포트/캐시) 후 시간 측정
+        warmup = builder(10).compile(checkpointer=saver)
+        execute(warmup, graph, mode, 10, "warmup")
+        start = time.perf_counter()
+        gaps = execute(app, graph, mode, steps, "timed")
+        elapsed = time.perf_counter() - start
+
+        # tracemalloc은 실행을 느리게 하므로 별도 실행으로 할당량 측정
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        execute(app, graph, mode, steps, "traced")
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # Linux는 KB, macOS는 바이트 단위
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss //= 1024
+
+    result = {
+        "graph": graph,
+        "checkpointer": checkpointer,
+        "mode": mode,
+        "steps": steps,
+        "supersteps": total_steps,
+        "elapsed_s": elapsed,
+        "per_superstep_us": elapsed / total_steps * 1e6,
+        "alloc_growth_kb": (after - before) / 1024,
+        "alloc_peak_kb": peak / 1024,
+        "alloc_peak_per_superstep_b": peak / total_steps,
+        "max_rss_kb": max_rss,
+    }
+    if gaps:
+        result["p50_us"] = percentile(gaps, 50) * 1e6
+        result["p95_us"] = percentile(gaps, 95) * 1e6
+    return result
+
+
+def run_isolated(graph: str, checkpointer: str, mode: str, steps: int) -> dict:
+    """하위 프로세스에서 run_single 실행 (RSS/할당 상태를 조합마다 분리)"""
+    completed = subprocess.run(
+        [sys.executable, __file__, "--single", graph, checkpointer, mode, str(steps)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="StateGraph 슈퍼스텝 오버헤드 벤치마크")
+    parser.add_argument("--steps", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--graphs", nargs="+", choices=GRAPHS, default=GRAPHS)
+    parser.add_argument("--checkpointers", nargs="+", choices=CHECKPOINTERS, default=CHECKPOINTERS)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--single", nargs=4, metavar=("GRAPH", "CHECKPOINTER", "MODE", "STEPS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        graph, checkpointer, mode, steps = args.single
+        print(json.dumps(run_single(graph, checkpointer, mode, int(steps))))
+        return
+
+    results = []
+    print(f"{'graph':8} {'checkpointer':12} {'mode':7} {'steps':>6} "
+          f"{'µs/step':>9} {'p95 µs':>8} {'alloc KB':>9} {'RSS MB':>7}")
+    for graph in args.graphs:
+        for checkpointer in args.checkpointers:
+            for mode in args.modes:
+                for steps in args.steps:
+                    r = run_isolated(graph, checkpointer, mode, steps)
+                    results.append(r)
+                    p95 = f"{r['p95_us']:.0f}" if "p95_us" in r else "-"
+                    print(
+                        f"{graph:8} {checkpointer:12} {mode:7} {steps:>6} "
+                        f"{r['per_superstep_us']:>9.1f} {p95:>8} "
+                        f"{r['alloc_peak_kb']:>9.0f} {r['max_rss_kb'] / 1024:>7.1f}"
+                    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,98 @@
 """
-🎨 LangGraph 시각화 유틸리티
+🎨 LangGraph 시각화/실행/캐시 유틸리티
+
+💡 서브모듈은 이름을 처음 꺼낼 때 import 됩니다 (PEP 562 모듈 __getattr__).
+   `from graph_utils import lazy_chat_model` 은 graph_utils.lazy 만 불러오고,
+   hedging/model_router/local_render 같은 나머지 모듈은 건드리지 않습니다.
 """
 
-from .visualizer import GraphVisualizer, show_graph, quick_visualize, save_all_formats
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .visualizer import GraphVisualizer, show_graph, quick_visualize, save_all_formats, topology_hash
+    from .streaming import StreamEvent, StreamMetrics, StreamRunner, print_stream
+    from .cache import CacheStats, CachedSearchTool, SqliteCache, cached_tool
+    from .convergence import ConvergencePolicy, RunReport, draft_similarity
+    from .llm_cache import CachedRunnable, cache_llm, default_llm_cache
+    from .lazy import LazyChatModel, LazyRunnable, lazy_chat_model, lazy_tool
+    from .profiler import NodeTimingCallback, percentile
+    from .history import AppendOnlyHistory, append_history
+    from .artifacts import Artifact, ArtifactStore
+    from .render_queue import RenderQueue, render_queue, visualize_async
+    from .heatmap import ExecutionRecorder, heatmap_mermaid
+    from .local_render import layout_graph, render_png, render_svg
+    from .hedging import HedgedChatModel, HedgeStats, LatencyHistogram, hedged_chat_model, provider_latency
+    from .model_router import ModelRouter, ModelTier, RoutingLog, RoutingPolicy, default_router
+
+# 📦 공개 이름 → 정의된 서브모듈
+_EXPORTS = {
+    'GraphVisualizer': 'visualizer',
+    'show_graph': 'visualizer',
+    'quick_visualize': 'visualizer',
+    'save_all_formats': 'visualizer',
+    'topology_hash': 'visualizer',
+    'StreamEvent': 'streaming',
+    'StreamMetrics': 'streaming',
+    'StreamRunner': 'streaming',
+    'print_stream': 'streaming',
+    'CacheStats': 'cache',
+    'CachedSearchTool': 'cache',
+    'SqliteCache': 'cache',
+    'cached_tool': 'cache',
+    'ConvergencePolicy': 'convergence',
+    'RunReport': 'convergence',
+    'draft_similarity': 'convergence',
+    'CachedRunnable': 'llm_cache',
+    'cache_llm': 'llm_cache',
+    'default_llm_cache': 'llm_cache',
+    'LazyChatModel': 'lazy',
+    'LazyRunnable': 'lazy',
+    'lazy_chat_model': 'lazy',
+    'lazy_tool': 'lazy',
+    'NodeTimingCallback': 'profiler',
+    'percentile': 'profiler',
+    'AppendOnlyHistory': 'history',
+    'append_history': 'history',
+    'RenderQueue': 'render_queue',
+    'render_queue': 'render_queue',
+    'visualize_async': 'render_queue',
+    'ExecutionRecorder': 'heatmap',
+    'heatmap_mermaid': 'heatmap',
+    'Artifact': 'artifacts',
+    'ArtifactStore': 'artifacts',
+    'layout_graph': 'local_render',
+    'render_png': 'local_render',
+    'render_svg': 'local_render',
+    'HedgedChatModel': 'hedging',
+    'HedgeStats': 'hedging',
+    'LatencyHistogram': 'hedging',
+    'hedged_chat_model': 'hedging',
+    'provider_latency': 'hedging',
+    'ModelRouter': 'model_router',
+    'ModelTier': 'model_router',
+    'RoutingLog': 'model_router',
+    'RoutingPolicy': 'model_router',
+    'default_router': 'model_router',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """공개 이름을 처음 꺼낼 때 해당 서브모듈을 불러와 패키지에 바인딩합니다."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(f".{module_name}", __name__)
+    # 같은 모듈의 이름을 한꺼번에 바인딩 — 이후 조회는 __getattr__ 를 거치지 않고,
+    # import 가 패키지에 심어 둔 서브모듈 객체(render_queue)도 함수로 덮어씁니다.
+    for export, owner in _EXPORTS.items():
+        if owner == module_name:
+            globals()[export] = getattr(module, export)
+    return globals()[name]
+
 
-__all__ = ['GraphVisualizer', 'show_graph', 'quick_visualize', 'save_all_formats']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
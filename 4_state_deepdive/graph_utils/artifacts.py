@@ -0,0 +1,254 @@
+"""
+🗂️ 시각화 산출물 저장소
+
+graph_visualizations/ 안의 파일을 SQLite 매니페스트(.manifest.sqlite)로 색인합니다.
+- (이름, 구조 해시, 형식)으로 조회 → 디렉토리 glob/stat 없이 바로 찾음
+- 임시 파일에 쓴 뒤 os.replace로 교체 → 다른 프로세스가 반쯤 쓴 파일을 보지 않음
+- 색인 변경과 정리는 BEGIN IMMEDIATE 트랜잭션 → 여러 프로세스가 동시에 써도 안전
+- 전체 크기/보관 기간/개수 기준 정리
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+MANIFEST_NAME = ".manifest.sqlite"
+TEMP_PREFIX = ".tmp-"
+
+
+@dataclass
+class Artifact:
+    """색인된 산출물 하나"""
+
+    path: Path
+    name: str
+    topology: str
+    format: str
+    size: int
+    mtime: float
+
+
+class ArtifactStore:
+    """매니페스트로 색인된 산출물 디렉토리 (프로세스 간 공유)"""
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        초기화
+
+        Args:
+            root: 산출물 디렉토리 (매니페스트도 이 안에 저장)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = self.root / MANIFEST_NAME
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artifacts (
+                filename TEXT PRIMARY KEY,
+                name     TEXT NOT NULL,
+                topology TEXT NOT NULL,
+                format   TEXT NOT NULL,
+                size     INTEGER NOT NULL,
+                mtime    REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS artifacts_key "
+            "ON artifacts (name, topology, format)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS artifacts_mtime ON artifacts (mtime)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (WAL 모드로 여러 프로세스 동시 접근 허용)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.manifest, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _artifact(self, row: tuple) -> Artifact:
+        filename, name, topology, fmt, size, mtime = row
+        return Artifact(self.root / filename, name, topology, fmt, size, mtime)
+
+    def lookup(self, name: str, topology: str, fmt: str) -> Optional[Artifact]:
+        """
+        색인에서 산출물 조회
+
+        파일이 밖에서 지워졌다면 색인에서도 지우고 None을 반환합니다.
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT filename, name, topology, format, size, mtime FROM artifacts "
+            "WHERE name = ? AND topology = ? AND format = ?",
+            (name, topology, fmt),
+        ).fetchone()
+        if row is None:
+            return None
+        artifact = self._artifact(row)
+        if not artifact.path.exists():
+            conn.execute("DELETE FROM artifacts WHERE filename = ?", (row[0],))
+            return None
+        return artifact
+
+    def write(
+        self,
+        filename: str,
+        data: Union[str, bytes],
+        name: str,
+        topology: str,
+        fmt: str,
+    ) -> Artifact:
+        """
+        파일을 원자적으로 쓰고 색인에 등록
+
+        같은 디렉토리의 임시 파일에 모두 쓴 뒤 os.replace로 바꾸므로,
+        같은 파일을 여러 프로세스가 동시에 써도 항상 완성된 파일 하나만 남습니다.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        path = self.root / filename
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        artifact = Artifact(path, name, topology, fmt, len(data), time.time())
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts "
+                "(filename, name, topology, format, size, mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (filename, name, topology, fmt, artifact.size, artifact.mtime),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return artifact
+
+    def list(self, fmt: Optional[str] = None) -> List[Artifact]:
+        """색인된 산출물 목록 (최신순, 파일 시스템 조회 없음)"""
+        query = "SELECT filename, name, topology, format, size, mtime FROM artifacts"
+        params: tuple = ()
+        if fmt is not None:
+            query += " WHERE format = ?"
+            params = (fmt,)
+        rows = self._connect().execute(query + " ORDER BY mtime DESC", params)
+        return [self._artifact(row) for row in rows]
+
+    def total_size(self) -> int:
+        return self._connect().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM artifacts"
+        ).fetchone()[0]
+
+    def prune(
+        self,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        keep_recent: Optional[int] = None,
+    ) -> List[Artifact]:
+        """
+        보관 정책에 따라 오래된 산출물 삭제
+
+        Args:
+            max_bytes: 전체 크기 상한 (초과분을 오래된 것부터 삭제)
+            max_age: 보관 기간 (초)
+            keep_recent: 남길 최대 개수
+
+        Returns:
+            삭제된 산출물 목록
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT filename, name, topology, format, size, mtime "
+                "FROM artifacts ORDER BY mtime DESC"
+            ).fetchall()
+            cutoff = time.time() - max_age if max_age is not None else None
+
+            victims = []
+            kept_bytes = 0
+            for index, row in enumerate(rows):
+                artifact = self._artifact(row)
+                if (
+                    (keep_recent is not None and index >= keep_recent)
+                    or (cutoff is not None and artifact.mtime < cutoff)
+                    or (max_bytes is not None and kept_bytes + artifact.size > max_bytes)
+                ):
+                    victims.append(artifact)
+                else:
+                    kept_bytes += artifact.size
+
+            conn.executemany(
+                "DELETE FROM artifacts WHERE filename = ?",
+                [(a.path.name,) for a in victims],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        # 색인에서 먼저 빠졌으므로 다른 프로세스가 지워지는 파일을 재사용하지 않음
+        for artifact in victims:
+            artifact.path.unlink(missing_ok=True)
+        return victims
+
+    def reindex(self) -> int:
+        """
+        디렉토리를 한 번 훑어 색인에 없는 파일 등록 (기존 디렉토리 이전용)
+
+        파일 이름 '{이름}_{해시}.{확장자}'에서 이름과 해시를 읽습니다.
+
+        Returns:
+            새로 등록한 파일 수
+        """
+        conn = self._connect()
+        known = {row[0] for row in conn.execute("SELECT filename FROM artifacts")}
+        added = []
+        for path in self.root.iterdir():
+            if (
+                not path.is_file()
+                or path.name in known
+                or path.name.startswith((MANIFEST_NAME, TEMP_PREFIX))
+            ):
+                continue
+            stem, _, ext = path.name.partition(".")
+            name, _, topology = stem.rpartition("_")
+            stat = path.stat()
+            added.append((path.name, name or stem, topology, ext, stat.st_size, stat.st_mtime))
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO artifacts "
+                "(filename, name, topology, format, size, mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                added,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(added)
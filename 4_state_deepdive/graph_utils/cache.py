@@ -0,0 +1,349 @@
+"""
+🗄️ SQLite 기반 결과 캐시
+
+검색 도구/LLM 호출 결과를 여러 프로세스가 함께 쓰는 SQLite 파일에 저장합니다.
+TTL 만료, 크기 제한 LRU 제거, 히트율 카운터를 지원합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+
+DEFAULT_CACHE_PATH = ".cache/tool_cache.sqlite"
+
+# 캐시 키에 포함할 검색 도구 파라미터 (TavilySearch / TavilySearchResults)
+SEARCH_PARAM_FIELDS = (
+    "search_depth",
+    "max_results",
+    "topic",
+    "time_range",
+    "include_domains",
+    "exclude_domains",
+    "include_answer",
+    "include_raw_content",
+    "include_images",
+)
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """캐시 히트율 카운터
+
+    Attributes:
+        hits: 캐시에서 바로 반환한 횟수
+        misses: 원본을 호출해야 했던 횟수
+        expired: TTL이 지나 무효화된 항목 수
+        evictions: 크기 제한으로 제거된 항목 수
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"🗄️ 캐시 히트 {self.hits} / 미스 {self.misses} "
+            f"(히트율 {self.hit_rate:.0%}, 만료 {self.expired}, 제거 {self.evictions})"
+        )
+
+
+def make_key(*parts: Any) -> str:
+    """JSON 정규화 후 SHA-256 해시로 캐시 키 생성"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SqliteCache:
+    """SQLite 기반 TTL/LRU 캐시 (프로세스 간 공유)"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        namespace: str = "default",
+        ttl: Optional[float] = 24 * 3600,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (여러 프로세스가 같은 파일을 공유 가능)
+            namespace: 캐시 구분 이름 (예: 'tavily', 'llm')
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+            max_entries: 네임스페이스별 최대 항목 수 (초과 시 LRU 제거)
+            max_bytes: 네임스페이스별 최대 저장 크기 (초과 시 LRU 제거)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    namespace   TEXT NOT NULL,
+                    key         TEXT NOT NULL,
+                    value       BLOB NOT NULL,
+                    size        INTEGER NOT NULL,
+                    created_at  REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    hits        INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_lru ON cache (namespace, accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환 (WAL 모드로 여러 프로세스 동시 접근 허용)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """캐시 조회 - 없거나 만료되면 default 반환"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+
+        if row is None:
+            self.stats.misses += 1
+            return default
+
+        value, created_at = row
+        now = time.time()
+        if self.ttl is not None and now - created_at > self.ttl:
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return default
+
+        conn.execute(
+            "UPDATE cache SET accessed_at = ?, hits = hits + 1 "
+            "WHERE namespace = ? AND key = ?",
+            (now, self.namespace, key),
+        )
+        self.stats.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 저장 후 크기 제한 초과분을 LRU 순서로 제거"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(namespace, key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, blob, len(blob), now, now),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    # 비동기 버전: SQLite I/O(쓰기 잠금 대기 최대 30초 포함)가 이벤트 루프를 막지 않도록
+    # 작업 스레드에서 실행 (연결은 스레드별이므로 그대로 안전)
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """get의 비동기 버전"""
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """set의 비동기 버전"""
+        await asyncio.to_thread(self.set, key, value)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """만료 항목과 한도를 넘는 오래된 항목 제거 (트랜잭션 안에서 호출)"""
+        if self.ttl is not None:
+            cur = conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl),
+            )
+            self.stats.expired += cur.rowcount
+
+        count, total_size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+
+        over_count = count - self.max_entries if self.max_entries else 0
+        if self.max_bytes is None or total_size <= self.max_bytes:
+            if over_count <= 0:
+                return
+
+        # 가장 오래 사용되지 않은 항목부터 한도 안으로 들어올 때까지 제거
+        victims = []
+        rows = conn.execute(
+            "SELECT key, size FROM cache WHERE namespace = ? ORDER BY accessed_at",
+            (self.namespace,),
+        )
+        for key, size in rows:
+            if over_count <= 0 and (
+                self.max_bytes is None or total_size <= self.max_bytes
+            ):
+                break
+            victims.append((self.namespace, key))
+            over_count -= 1
+            total_size -= size
+
+        conn.executemany("DELETE FROM cache WHERE namespace = ? AND key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def clear(self) -> None:
+        """현재 네임스페이스의 모든 항목 삭제"""
+        self._connect().execute(
+            "DELETE FROM cache WHERE namespace = ?", (self.namespace,)
+        )
+
+    def __len__(self) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+
+def is_error_result(result: Any) -> bool:
+    """실패를 나타내는 도구 결과인지 (이런 결과는 캐시하지 않음)
+
+    - {"error": ...} dict (Tavily 오류 응답)
+    - "Error..."로 시작하는 문자열 (handle_tool_error가 예외를 바꾼 결과 등)
+    - status="error"인 ToolMessage
+    """
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, str):
+        return result.lstrip().lower().startswith("error")
+    if isinstance(result, ToolMessage):
+        return result.status == "error"
+    return False
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (대소문자, 공백 차이 무시)"""
+    return " ".join(str(query).lower().split())
+
+
+class CachedSearchTool(BaseTool):
+    """검색 도구 결과를 SqliteCache에 저장하는 래퍼 (ToolNode에서 그대로 사용 가능)"""
+
+    tool: BaseTool
+    cache: Any
+
+    def __init__(self, tool: BaseTool, cache: SqliteCache, **kwargs: Any):
+        # 원본이 예외를 문자열로 바꾸면 성공한 결과와 구분할 수 없으므로
+        # 예외는 원본에서 그대로 올리고 같은 설정으로 래퍼가 처리 (실패는 캐시하지 않음)
+        kwargs.setdefault("handle_tool_error", tool.handle_tool_error)
+        super().__init__(
+            tool=tool.model_copy(update={"handle_tool_error": False}),
+            cache=cache,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            **kwargs,
+        )
+
+    def _cache_key(self, tool_kwargs: dict) -> str:
+        """정규화된 검색어 + 호출 인자 + 도구 설정으로 키 생성"""
+        args = dict(tool_kwargs)
+        query = normalize_query(args.pop("query", ""))
+        params = {
+            name: getattr(self.tool, name)
+            for name in SEARCH_PARAM_FIELDS
+            if getattr(self.tool, name, None) is not None
+        }
+        return make_key(self.tool.name, query, args, params)
+
+    def _tool_kwargs(self, args: tuple, kwargs: dict) -> dict:
+        """tool.run("검색어")처럼 위치 인자로 호출된 경우 첫 인자 이름에 매핑"""
+        tool_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        if args:
+            tool_kwargs[next(iter(self.tool.args))] = args[0]
+        return tool_kwargs
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.pop("run_manager", None)
+        tool_kwargs = self._tool_kwargs(args, kwargs)
+        key = self._cache_key(tool_kwargs)
+
+        result = self.cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        result = self.tool.invoke(tool_kwargs)
+        if not is_error_result(result):
+            self.cache.set(key, result)
+        return result
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.pop("run_manager", None)
+        tool_kwargs = self._tool_kwargs(args, kwargs)
+        key = self._cache_key(tool_kwargs)
+
+        result = await self.cache.aget(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        result = await self.tool.ainvoke(tool_kwargs)
+        if not is_error_result(result):
+            await self.cache.aset(key, result)
+        return result
+
+
+def cached_tool(
+    tool: BaseTool,
+    cache: Optional[SqliteCache] = None,
+    ttl: Optional[float] = 24 * 3600,
+    max_entries: Optional[int] = 10_000,
+) -> CachedSearchTool:
+    """
+    검색 도구를 캐시 래퍼로 감싸기
+
+    Args:
+        tool: 원본 검색 도구 (TavilySearch, TavilySearchResults 등)
+        cache: 공유할 캐시 (None이면 'search' 네임스페이스 기본 캐시 생성)
+        ttl: 항목 유효 시간 (초)
+        max_entries: 최대 항목 수
+
+    Returns:
+        원본과 같은 이름/스키마를 가진 캐시 도구
+    """
+    if cache is None:
+        cache = SqliteCache(namespace="search", ttl=ttl, max_entries=max_entries)
+    return CachedSearchTool(tool, cache)
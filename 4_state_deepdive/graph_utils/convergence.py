@@ -0,0 +1,123 @@
+"""
+🎯 수렴 기반 조기 종료
+
+반성/리플렉션 루프를 고정 횟수만큼 돌리는 대신,
+1) 비평의 구조화된 점수가 기준 이상이거나
+2) 연속된 초안이 거의 같아지면
+바로 종료합니다. 최대 반복 횟수는 안전장치로 유지합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+# 종료 사유
+STOP_SCORE = "score"  # 점수가 기준 이상
+STOP_CONVERGED = "converged"  # 초안이 더 이상 바뀌지 않음
+STOP_MAX_ITERATIONS = "max_iterations"  # 최대 반복 도달 (안전장치)
+
+
+SHINGLE_SIZE = 3  # 유사도 비교에 쓰는 연속 단어 묶음 크기
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    words = text.split()
+    if len(words) <= size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def draft_similarity(previous: str, current: str) -> float:
+    """두 초안의 유사도 (0~1)
+
+    연속 단어 묶음(shingle) 집합의 Jaccard 유사도입니다. 글자 단위 diff
+    (SequenceMatcher)는 250단어 초안에서도 수십 ms가 걸리지만, 이 방식은
+    단어 수에 비례하는 시간에 끝나고 단어 하나를 고치면 묶음 SHINGLE_SIZE개만 바뀝니다.
+    """
+    a, b = _shingles(previous), _shingles(current)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class RunReport:
+    """실행 1회의 종료 기록
+
+    Attributes:
+        iterations: 실제 수행한 반복 수
+        max_iterations: 최대 반복 수 (고정 횟수 방식이었다면 수행했을 반복 수)
+        reason: 종료 사유 (STOP_SCORE / STOP_CONVERGED / STOP_MAX_ITERATIONS)
+    """
+
+    iterations: int
+    max_iterations: int
+    reason: str
+
+    @property
+    def saved(self) -> int:
+        """절약한 반복 수"""
+        return self.max_iterations - self.iterations
+
+
+@dataclass
+class ConvergencePolicy:
+    """점수/유사도 기반 종료 정책
+
+    Attributes:
+        max_iterations: 최대 반복 수 (안전장치)
+        score_threshold: 이 점수 이상이면 종료 (None이면 점수 신호 사용 안 함)
+        similarity_threshold: 연속 초안 유사도가 이 값 이상이면 종료
+        reports: 실행별 종료 기록
+    """
+
+    max_iterations: int
+    score_threshold: Optional[float] = 8
+    similarity_threshold: float = 0.9
+    reports: list = field(default_factory=list)
+
+    def check(
+        self,
+        iteration: int,
+        score: Optional[float] = None,
+        previous_draft: Optional[str] = None,
+        current_draft: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        종료 여부 판단 - 종료해야 하면 사유를, 계속하면 None을 반환하고
+        종료 시 실행 기록을 남김
+
+        Args:
+            iteration: 지금까지 수행한 반복 수
+            score: 최신 비평 점수
+            previous_draft: 직전 초안
+            current_draft: 최신 초안
+        """
+        reason = None
+        if self.score_threshold is not None and score is not None:
+            if score >= self.score_threshold:
+                reason = STOP_SCORE
+        if reason is None and previous_draft and current_draft:
+            similarity = draft_similarity(previous_draft, current_draft)
+            if similarity >= self.similarity_threshold:
+                reason = STOP_CONVERGED
+        if reason is None and iteration >= self.max_iterations:
+            reason = STOP_MAX_ITERATIONS
+
+        if reason is not None:
+            self.reports.append(RunReport(iteration, self.max_iterations, reason))
+        return reason
+
+    def summary(self) -> str:
+        """실행별/전체 절약 통계"""
+        if not self.reports:
+            return "🎯 종료 기록 없음"
+        lines = []
+        for i, report in enumerate(self.reports, 1):
+            lines.append(
+                f"🎯 실행 {i}: {report.iterations}/{report.max_iterations}회 "
+                f"반복 후 종료 ({report.reason}), {report.saved}회 절약"
+            )
+        total_saved = sum(r.saved for r in self.reports)
+        total_max = sum(r.max_iterations for r in self.reports)
+        lines.append(f"🎯 전체: {total_saved}/{total_max}회 절약")
+        return "\n".join(lines)
@@ -0,0 +1,199 @@
+"""
+🔥 노드 지연 시간 히트맵
+
+invoke/stream 실행 중 콜백으로 노드별 실행 시간, 호출 횟수, 토큰 사용량,
+노드 간 이동 횟수를 기록하고, 같은 그래프를 mermaid로 다시 그리면서
+노드는 p50/p95 지연 시간에 따라 색칠하고 엣지에는 이동 횟수를 표시합니다.
+
+사용 예:
+    recorder = ExecutionRecorder()
+    app.invoke(inputs, config={"callbacks": [recorder]})
+    GraphVisualizer().visualize_execution(app, recorder, "reflexion_agent")
+"""
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from .profiler import NodeTimingCallback
+
+START, END = "__start__", "__end__"
+
+# 느린 순서: 초록 → 노랑 → 빨강
+COLD = (0xA8, 0xE6, 0xA1)
+WARM = (0xFF, 0xE0, 0x8A)
+HOT = (0xF4, 0x97, 0x8E)
+
+
+class ExecutionRecorder(NodeTimingCallback):
+    """노드 실행 시간 + 토큰 사용량 + 엣지 이동 횟수 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.tokens: Dict[str, int] = defaultdict(int)
+        self.transitions: Counter = Counter()
+        self._llm_nodes: Dict[UUID, str] = {}
+        # 그래프 실행(run_id)별로 실행된 노드 순서
+        self._paths: Dict[UUID, List[str]] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Optional[dict],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().on_chain_start(
+            serialized, inputs, run_id=run_id, metadata=metadata, **kwargs
+        )
+        node = (metadata or {}).get("langgraph_node")
+        with self._lock:
+            if node is None and parent_run_id is None:
+                self._paths[run_id] = []  # 최상위 그래프 실행
+            elif node is not None and kwargs.get("name") == node:
+                if parent_run_id in self._paths:
+                    self._paths[parent_run_id].append(node)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        super().on_chain_end(outputs, run_id=run_id, **kwargs)
+        self._finish_path(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        super().on_chain_error(error, run_id=run_id, **kwargs)
+        self._finish_path(run_id)
+
+    def _finish_path(self, run_id: UUID) -> None:
+        # 같은 슈퍼스텝에서 병렬로 실행된 노드는 시작 순서대로 이어진 것으로 근사
+        with self._lock:
+            path = self._paths.pop(run_id, None)
+            if path is None:
+                return
+            steps = [START] + path + [END]
+            self.transitions.update(zip(steps, steps[1:]))
+
+    def on_chat_model_start(
+        self,
+        serialized: Optional[dict],
+        messages: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._track_llm(run_id, metadata)
+
+    def on_llm_start(
+        self,
+        serialized: Optional[dict],
+        prompts: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._track_llm(run_id, metadata)
+
+    def _track_llm(self, run_id: UUID, metadata: Optional[dict]) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        if node is not None:
+            with self._lock:
+                self._llm_nodes[run_id] = node
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            node = self._llm_nodes.pop(run_id, None)
+            if node is not None:
+                self.tokens[node] += _total_tokens(response)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        with self._lock:
+            self._llm_nodes.pop(run_id, None)
+
+
+def _total_tokens(response: Any) -> int:
+    """LLMResult에서 총 토큰 수 (usage_metadata 우선, 없으면 llm_output)"""
+    total = 0
+    for generations in getattr(response, "generations", []):
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    if not total:
+        usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+        total = usage.get("total_tokens", 0)
+    return total
+
+
+def _blend(a: tuple, b: tuple, t: float) -> tuple:
+    return tuple(round(x + (y - x) * t) for x, y in zip(a, b))
+
+
+def heat_color(value: float, maximum: float) -> str:
+    """0~maximum 값을 초록 → 노랑 → 빨강 색으로 변환"""
+    t = value / maximum if maximum else 0.0
+    rgb = _blend(COLD, WARM, t * 2) if t < 0.5 else _blend(WARM, HOT, (t - 0.5) * 2)
+    return "#%02x%02x%02x" % rgb
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+
+def heatmap_mermaid(graph: Any, recorder: ExecutionRecorder, metric: str = "p95") -> str:
+    """
+    실행 기록을 입힌 mermaid 코드 생성
+
+    Args:
+        graph: compiled_graph.get_graph() 결과
+        recorder: 실행을 기록한 ExecutionRecorder
+        metric: 색 기준 - 'p50' 또는 'p95'
+
+    Returns:
+        노드 색/라벨과 엣지 이동 횟수가 포함된 mermaid 코드
+    """
+    summary = recorder.summary()
+    maximum = max((stats[metric] for stats in summary.values()), default=0.0)
+
+    lines = ["graph TD;"]
+    styles = []
+    for node_id, node in graph.nodes.items():
+        name = getattr(node, "name", None) or node_id
+        stats = summary.get(node_id)
+        if node_id in (START, END):
+            lines.append(f'\t{node_id}(["{name.strip("_")}"])')
+            styles.append(f"\tstyle {node_id} fill:#bfb6fc,stroke:#9370db")
+            continue
+        if stats is None:
+            lines.append(f'\t{node_id}["{name}<br/><i>실행 안 됨</i>"]')
+            styles.append(f"\tstyle {node_id} fill:#eeeeee,stroke:#999999")
+            continue
+        label = (
+            f"{name}<br/>p50 {_format_seconds(stats['p50'])} · "
+            f"p95 {_format_seconds(stats['p95'])}<br/>{stats['count']}회"
+        )
+        tokens = recorder.tokens.get(node_id)
+        if tokens:
+            label += f" · {tokens:,} tokens"
+        lines.append(f'\t{node_id}["{label}"]')
+        styles.append(
+            f"\tstyle {node_id} fill:{heat_color(stats[metric], maximum)},stroke:#333333"
+        )
+
+    for edge in graph.edges:
+        count = recorder.transitions.get((edge.source, edge.target), 0)
+        parts = [str(edge.data)] if edge.data not in (None, "") and edge.data != edge.target else []
+        parts.append(f"{count}회")
+        label = " ".join(parts)
+        if edge.conditional:
+            lines.append(f'\t{edge.source} -. "{label}" .-> {edge.target}')
+        else:
+            lines.append(f'\t{edge.source} -- "{label}" --> {edge.target}')
+
+    return "\n".join(lines + styles) + "\n"
@@ -0,0 +1,472 @@
+"""
+🏁 프로바이더 간 헤지(hedged) 요청
+
+primary 프로바이더에 먼저 요청하고, 정해진 시간 안에 첫 토큰이 오지 않으면
+backup 프로바이더에도 같은 요청을 보냅니다. 먼저 첫 토큰을 보낸 쪽의 응답을 사용하고
+나머지 요청은 취소합니다.
+
+- 헤지 대기 시간 = primary의 최근 첫 토큰 지연 시간 백분위수 (기본 p95)
+- 프로바이더별 첫 토큰 지연 시간은 프로세스 공용 히스토그램에 기록
+  (첫 토큰 전에 취소된 요청은 '그 시점보다 느렸다'는 잘린 표본으로 따로 기록)
+- primary가 첫 토큰 전에 실패하면 기다리지 않고 backup으로 전환
+
+사용 예:
+    llm = hedged_chat_model(
+        lazy_chat_model("groq", model="llama-3.1-8b-instant"),
+        lazy_chat_model("openai", model="gpt-4o-mini"),
+    )
+    llm.bind_tools(tools).invoke(messages)
+    print(llm.stats.summary())
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import (
+    agenerate_from_stream,
+    generate_from_stream,
+)
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableBinding
+from pydantic import Field, model_validator
+
+from .lazy import LazyRunnable
+
+MIN_SAMPLES = 20  # 이보다 적게 기록되면 default_delay 사용
+
+_DONE = object()
+
+
+class LatencyHistogram:
+    """프로바이더 하나의 최근 첫 토큰 지연 시간 (초)
+
+    첫 토큰 전에 취소된 요청은 실제 지연을 알 수 없으므로 (잘린 표본)
+    관측값과 섞지 않고 표시해 두었다가, 백분위수 계산 때 가장 느린 쪽에 둡니다.
+    잘린 시간을 관측값처럼 쓰면 p95가 내려가고 → 헤지가 늘고 → 더 많이 잘리는
+    악순환이 생기기 때문입니다.
+    """
+
+    def __init__(self, window: int = 500):
+        self._samples: deque = deque(maxlen=window)  # (초, 잘린 표본 여부)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, censored: bool = False) -> None:
+        with self._lock:
+            self._samples.append((seconds, censored))
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def censored(self) -> int:
+        """최근 표본 중 첫 토큰 전에 취소된 수"""
+        with self._lock:
+            return sum(c for _, c in self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        최근 지연 시간의 q 백분위수 (표본이 부족하면 None)
+
+        잘린 표본은 관측값보다 느렸다고 보고 관측값 뒤에 둡니다. 실제 값은 모르므로
+        잘린 시간(실제 지연의 하한)을 값으로 쓰며, 백분위수가 그 구간에 떨어지면
+        추정치가 하한 쪽으로 올라가 헤지가 줄어듭니다.
+        """
+        with self._lock:
+            samples = list(self._samples)
+        if len(samples) < MIN_SAMPLES:
+            return None
+        observed = sorted(s for s, censored in samples if not censored)
+        top = observed[-1] if observed else 0.0
+        ranked = observed + sorted(max(s, top) for s, censored in samples if censored)
+        pos = (len(ranked) - 1) * q / 100
+        low = int(pos)
+        high = min(low + 1, len(ranked) - 1)
+        return ranked[low] + (ranked[high] - ranked[low]) * (pos - low)
+
+    def buckets(self, start: float = 0.05) -> Dict[str, int]:
+        """2배씩 커지는 구간별 관측 표본 수 (예: '<50ms', '<100ms', ..., 잘린 표본은 '취소')"""
+        with self._lock:
+            samples = list(self._samples)
+        counts: Dict[str, int] = {}
+        for seconds in sorted(s for s, censored in samples if not censored):
+            bound = start
+            while seconds >= bound:
+                bound *= 2
+            label = f"<{bound * 1000:.0f}ms" if bound < 1 else f"<{bound:.1f}s"
+            counts[label] = counts.get(label, 0) + 1
+        clipped = sum(c for _, c in samples)
+        if clipped:
+            counts["취소"] = clipped
+        return counts
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def provider_latency(name: str) -> LatencyHistogram:
+    """프로바이더 이름별 공용 히스토그램 (같은 모델을 쓰는 래퍼끼리 공유)"""
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        return histogram
+
+
+def provider_name(model: Any) -> str:
+    """히스토그램 키로 쓸 '프로바이더:모델' 이름 (지연 모델은 생성하지 않음)"""
+    if isinstance(model, LazyRunnable):
+        return model.name or repr(model)
+    if isinstance(model, RunnableBinding):
+        return provider_name(model.bound)
+    if isinstance(model, BaseChatModel):
+        model_id = getattr(model, "model_name", None) or getattr(model, "model", None)
+        return f"{model._llm_type}:{model_id}" if model_id else model._llm_type
+    return type(model).__name__
+
+
+@dataclass
+class HedgeStats:
+    """헤지 동작 통계
+
+    Attributes:
+        requests: 전체 요청 수
+        hedged: 대기 시간이 지나 backup 요청을 보낸 횟수
+        backup_wins: backup 응답을 사용한 횟수
+        failovers: primary가 첫 토큰 전에 실패해 backup으로 전환한 횟수
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    backup_wins: int = 0
+    failovers: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"🏁 요청 {self.requests}회 중 헤지 {self.hedged}회 ({self.hedge_rate:.0%}), "
+            f"backup 사용 {self.backup_wins}회, 장애 전환 {self.failovers}회"
+        )
+
+
+class _Lane:
+    """경주 중인 요청 하나"""
+
+    def __init__(self, role: str, name: str, model: Runnable):
+        self.role = role
+        self.name = name
+        self.model = model
+        self.started = False
+        self.failed = False
+        self.cancelled = threading.Event()
+        self.task: Optional[asyncio.Task] = None
+        self._started_at = 0.0
+        self._timed = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self.started = True
+        self._started_at = time.perf_counter()
+
+    def first_token(self) -> None:
+        """첫 토큰 지연 기록 (이미 취소된 뒤라면 취소 시점에 기록했으므로 무시)"""
+        with self._lock:
+            if self._timed:
+                return
+            self._timed = True
+        provider_latency(self.name).record(time.perf_counter() - self._started_at)
+
+    def cancel(self) -> None:
+        """
+        요청 취소 표시
+
+        첫 토큰 전에 취소되면 지연 시간을 잘린 표본으로 기록합니다.
+        동기(멈출 수 없는 스레드)와 비동기(태스크 취소) 모두 이 시점에 한 번만 기록하므로
+        두 경로의 히스토그램이 같은 규칙으로 쌓입니다.
+        """
+        self.cancelled.set()
+        with self._lock:
+            if self._timed or not self.started or self.failed:
+                return
+            self._timed = True
+        provider_latency(self.name).record(time.perf_counter() - self._started_at, censored=True)
+
+
+class _Race:
+    """primary/backup 이벤트를 받아 승자를 정하는 공용 상태"""
+
+    def __init__(self, owner: "HedgedChatModel"):
+        self.owner = owner
+        self.primary = _Lane("primary", owner.primary_name, owner.primary)
+        self.backup = _Lane("backup", owner.backup_name, owner.backup)
+        self.winner: Optional[_Lane] = None
+
+    @property
+    def lanes(self) -> List[_Lane]:
+        return [self.primary, self.backup]
+
+    def start_backup(self, failover: bool) -> None:
+        self.backup.started = True
+        self.owner.stats.record(**({"failovers": 1} if failover else {"hedged": 1}))
+
+    def accept(self, lane: _Lane, item: Any) -> Optional[Any]:
+        """
+        이벤트 처리
+
+        Returns:
+            호출자에게 넘길 청크, 승자 스트림이 끝났으면 _DONE, 무시할 이벤트면 None
+        """
+        if self.winner is None:
+            if isinstance(item, Exception):
+                lane.failed = True
+                if all(l.failed for l in self.lanes if l.started) and self.backup.started:
+                    raise item
+                return None
+            self.winner = lane
+            for other in self.lanes:
+                if other is not lane:
+                    other.cancel()
+            if lane is self.backup:
+                self.owner.stats.record(backup_wins=1)
+            if item is not _DONE:
+                item = item.model_copy(
+                    update={"response_metadata": {**item.response_metadata, "hedge_provider": lane.name}}
+                )
+        if lane is not self.winner:
+            return None  # 취소된 쪽에서 뒤늦게 도착한 청크
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _child_config() -> dict:
+    """
+    primary/backup 호출 설정
+
+    콜백은 넘기지 않습니다. 헤지 모델 자신의 실행이 승자의 토큰만 콜백으로 내보내므로,
+    하위 모델에도 콜백을 주면 승자 토큰이 두 번, 진 쪽 토큰까지 스트리밍 핸들러에 전달됩니다.
+    (빈 목록이어야 상위 실행 컨텍스트의 콜백도 물려받지 않음)
+    """
+    return {"callbacks": []}
+
+
+class HedgedChatModel(BaseChatModel):
+    """primary가 늦으면 backup에도 요청하고 먼저 응답한 쪽을 사용하는 채팅 모델"""
+
+    primary: Runnable
+    backup: Runnable
+    primary_name: str = ""
+    backup_name: str = ""
+    hedge_percentile: float = 95.0
+    default_delay: float = 1.0  # 표본이 부족할 때 쓰는 헤지 대기 시간 (초)
+    min_delay: float = 0.05
+    max_delay: float = 10.0
+    stats: Any = Field(default_factory=HedgeStats)
+
+    @model_validator(mode="after")
+    def _fill_names(self) -> "HedgedChatModel":
+        self.primary_name = self.primary_name or provider_name(self.primary)
+        self.backup_name = self.backup_name or provider_name(self.backup)
+        return self
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"primary": self.primary_name, "backup": self.backup_name}
+
+    def hedge_delay(self) -> float:
+        """primary 첫 토큰 지연 시간의 백분위수로 정한 헤지 대기 시간 (초)"""
+        delay = provider_latency(self.primary_name).percentile(self.hedge_percentile)
+        if delay is None:
+            return self.default_delay
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "HedgedChatModel":
+        """두 프로바이더 모두에 도구를 바인딩 (통계/히스토그램은 공유)"""
+        return self.model_copy(
+            update={
+                "primary": self.primary.bind_tools(tools, **kwargs),
+                "backup": self.backup.bind_tools(tools, **kwargs),
+            }
+        )
+
+    # ============================================
+    # 동기: 요청마다 스레드로 스트림을 읽음
+    # ============================================
+
+    def _pump(self, lane: _Lane, messages: list, config: dict, kwargs: dict, events: queue.Queue) -> None:
+        try:
+            for i, chunk in enumerate(lane.model.stream(messages, config, **kwargs)):
+                if i == 0:
+                    lane.first_token()
+                # 스레드는 멈출 수 없으므로 다음 청크에서 스트림을 닫음
+                if lane.cancelled.is_set():
+                    return
+                events.put((lane, chunk))
+            events.put((lane, _DONE))
+        except Exception as e:
+            events.put((lane, e))
+
+    def _start(self, lane: _Lane, *args: Any) -> None:
+        lane.start()
+        threading.Thread(
+            target=self._pump, args=(lane, *args), name=f"hedge-{lane.role}", daemon=True
+        ).start()
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        self.stats.record(requests=1)
+        race = _Race(self)
+        events: queue.Queue = queue.Queue()
+        config = _child_config()
+        kwargs = {**kwargs, "stop": stop} if stop else kwargs
+        args = (messages, config, kwargs, events)
+
+        self._start(race.primary, *args)
+        hedge_at = time.monotonic() + self.hedge_delay()
+        try:
+            while True:
+                timeout = None if race.backup.started else max(hedge_at - time.monotonic(), 0)
+                try:
+                    lane, item = events.get(timeout=timeout)
+                except queue.Empty:
+                    race.start_backup(failover=False)
+                    self._start(race.backup, *args)
+                    continue
+                if lane is race.primary and isinstance(item, Exception) and not race.backup.started:
+                    race.start_backup(failover=True)
+                    self._start(race.backup, *args)
+                item = race.accept(lane, item)
+                if item is _DONE:
+                    return
+                if item is not None:
+                    chunk = ChatGenerationChunk(message=item)
+                    if run_manager:
+                        run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                    yield chunk
+        finally:
+            for lane in race.lanes:
+                lane.cancel()
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
+
+    # ============================================
+    # 비동기: 진 쪽 태스크를 취소해 요청 자체를 끊음
+    # ============================================
+
+    async def _apump(self, lane: _Lane, messages: list, config: dict, kwargs: dict, events: asyncio.Queue) -> None:
+        try:
+            first = True
+            async for chunk in lane.model.astream(messages, config, **kwargs):
+                if first:
+                    lane.first_token()
+                    first = False
+                events.put_nowait((lane, chunk))
+            events.put_nowait((lane, _DONE))
+        except Exception as e:
+            events.put_nowait((lane, e))
+
+    def _astart(self, lane: _Lane, *args: Any) -> None:
+        lane.start()
+        lane.task = asyncio.create_task(self._apump(lane, *args))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        self.stats.record(requests=1)
+        race = _Race(self)
+        events: asyncio.Queue = asyncio.Queue()
+        config = _child_config()
+        kwargs = {**kwargs, "stop": stop} if stop else kwargs
+        args = (messages, config, kwargs, events)
+
+        self._astart(race.primary, *args)
+        hedge_at = time.monotonic() + self.hedge_delay()
+        try:
+            while True:
+                timeout = None if race.backup.started else max(hedge_at - time.monotonic(), 0)
+                try:
+                    lane, item = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    race.start_backup(failover=False)
+                    self._astart(race.backup, *args)
+                    continue
+                if lane is race.primary and isinstance(item, Exception) and not race.backup.started:
+                    race.start_backup(failover=True)
+                    self._astart(race.backup, *args)
+                had_winner = race.winner is not None
+                item = race.accept(lane, item)
+                if not had_winner and race.winner is not None:
+                    for other in race.lanes:
+                        if other is not race.winner and other.task is not None:
+                            other.task.cancel()
+                if item is _DONE:
+                    return
+                if item is not None:
+                    chunk = ChatGenerationChunk(message=item)
+                    if run_manager:
+                        await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                    yield chunk
+        finally:
+            for lane in race.lanes:
+                lane.cancel()
+                if lane.task is not None and not lane.task.done():
+                    lane.task.cancel()
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop, run_manager, **kwargs))
+
+
+def hedged_chat_model(primary: Runnable, backup: Runnable, **kwargs: Any) -> HedgedChatModel:
+    """
+    헤지 채팅 모델 만들기
+
+    Args:
+        primary: 먼저 요청할 채팅 모델 (ChatGroq, lazy_chat_model(...) 등)
+        backup: primary가 늦거나 실패할 때 요청할 채팅 모델
+        **kwargs: hedge_percentile, default_delay, min_delay, max_delay
+    """
+    return HedgedChatModel(primary=primary, backup=backup, **kwargs)
@@ -0,0 +1,223 @@
+"""
+📚 추가 전용(append-only) 히스토리 리듀서
+
+Annotated[List[int], operator.concat]은 슈퍼스텝마다 히스토리 전체를 복사하므로
+N번 반복하면 O(N²) 시간/메모리가 듭니다.
+
+AppendOnlyHistory는 고정 크기 청크(정수는 array('q'), 그 밖의 레코드는 list)에
+값을 이어 붙이고, 각 상태 스냅샷은 (공유 저장소, 길이) 뷰로만 표현합니다.
+- 최신 뷰에 추가: 저장소 끝에 제자리 추가 → 항목당 O(1)
+- 과거 뷰에 추가(분기): 가득 찬 청크는 공유하고 마지막 청크만 복사
+- 과거 스냅샷은 자기 길이까지만 보므로 값이 바뀌지 않음
+- 체크포인트에는 평범한 int 목록으로 저장 (msgpack/pickle이 작은 정수를 1~3바이트로 쓰므로
+  항목당 8바이트인 array 바이트보다 작고, 복원도 array가 C 수준에서 한 번에 검사)
+
+사용 예:
+    class State(TypedDict):
+        history: Annotated[AppendOnlyHistory, append_history]
+"""
+
+import itertools
+import threading
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional
+
+CHUNK_SIZE = 4096  # 청크 하나에 담을 항목 수
+INT_TYPECODE = "q"  # 부호 있는 64비트 정수
+
+_INT_MIN, _INT_MAX = -(2**63), 2**63 - 1
+
+
+def _all_int64(items: Iterable[Any]) -> bool:
+    # bool도 int의 하위 클래스지만 array에 넣으면 타입이 사라지므로 제외
+    return all(type(x) is int and _INT_MIN <= x <= _INT_MAX for x in items)
+
+
+class _Store:
+    """여러 뷰가 공유하는 청크 저장소"""
+
+    __slots__ = ("chunks", "length", "typecode", "lock")
+
+    def __init__(self, typecode: Optional[str] = INT_TYPECODE):
+        self.chunks: list = []
+        self.length = 0
+        self.typecode = typecode  # None이면 객체(list) 모드
+        self.lock = threading.Lock()
+
+    def _new_chunk(self, items=()):
+        if self.typecode is None:
+            return list(items)
+        return array(self.typecode, items)
+
+    def accepts(self, items: List[Any]) -> bool:
+        return self.typecode is None or _all_int64(items)
+
+    def extend(self, items: List[Any]) -> None:
+        start = 0
+        while start < len(items):
+            if not self.chunks or len(self.chunks[-1]) == CHUNK_SIZE:
+                self.chunks.append(self._new_chunk())
+            tail = self.chunks[-1]
+            end = start + CHUNK_SIZE - len(tail)
+            tail.extend(items[start:end])
+            start = end
+        self.length += len(items)
+
+    def fork(self, length: int, typecode: Optional[str]) -> "_Store":
+        """앞의 length개만 가진 새 저장소 (가득 찬 청크는 공유)"""
+        store = _Store(typecode)
+        full, rest = divmod(length, CHUNK_SIZE)
+        if typecode == self.typecode:
+            # 가득 찬 청크에는 더 이상 추가되지 않으므로 그대로 공유
+            store.chunks = self.chunks[:full]
+        else:
+            store.chunks = [store._new_chunk(c) for c in self.chunks[:full]]
+        if rest:
+            store.chunks.append(store._new_chunk(self.chunks[full][:rest]))
+        store.length = length
+        return store
+
+
+class AppendOnlyHistory(Sequence):
+    """공유 청크 저장소 위의 불변 히스토리 뷰 (list처럼 읽을 수 있음)"""
+
+    __slots__ = ("_store", "_len")
+
+    def __init__(self, items: Iterable[Any] = (), typecode: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            items: 초기 항목들
+            typecode: 직렬화된 정수 히스토리를 복원할 때의 array typecode
+        """
+        if typecode is not None:
+            # 정수 히스토리 복원: 타입/범위 검사는 array가 C 수준에서 수행
+            data = array(typecode)
+            if isinstance(items, (bytes, bytearray)):  # 이전 형식 (array 바이트)
+                data.frombytes(items)
+            else:
+                data.fromlist(items if isinstance(items, list) else list(items))
+            store = _Store(typecode)
+            store.extend(data)
+        else:
+            items = list(items)
+            store = _Store(INT_TYPECODE if _all_int64(items) else None)
+            store.extend(items)
+        self._store = store
+        self._len = store.length
+
+    @classmethod
+    def _view(cls, store: _Store, length: int) -> "AppendOnlyHistory":
+        view = cls.__new__(cls)
+        view._store = store
+        view._len = length
+        return view
+
+    def extend(self, items: Iterable[Any]) -> "AppendOnlyHistory":
+        """items를 이어 붙인 새 뷰 반환 (self는 바뀌지 않음)"""
+        if not isinstance(items, (list, tuple, array)):
+            items = list(items)
+        if not items:
+            return self
+
+        store = self._store
+        with store.lock:
+            if store.length == self._len and store.accepts(items):
+                store.extend(items)
+                return self._view(store, store.length)
+
+        # 과거 뷰에서 분기했거나 정수 저장소에 다른 타입이 들어오는 경우
+        typecode = store.typecode if store.accepts(items) else None
+        forked = store.fork(self._len, typecode)
+        forked.extend(items)
+        return self._view(forked, forked.length)
+
+    def append(self, item: Any) -> "AppendOnlyHistory":
+        """item 하나를 추가한 새 뷰 반환"""
+        return self.extend([item])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("history index out of range")
+        chunk, offset = divmod(index, CHUNK_SIZE)
+        return self._store.chunks[chunk][offset]
+
+    def __iter__(self) -> Iterator[Any]:
+        full, rest = divmod(self._len, CHUNK_SIZE)
+        chunks = self._store.chunks
+        for chunk in chunks[:full]:
+            yield from chunk
+        if rest:
+            yield from itertools.islice(chunks[full], rest)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (Sequence, array)) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __add__(self, other: Iterable[Any]) -> "AppendOnlyHistory":
+        return self.extend(other)
+
+    def __radd__(self, other: Iterable[Any]) -> "AppendOnlyHistory":
+        return AppendOnlyHistory(other).extend(self)
+
+    def __repr__(self) -> str:
+        if self._len <= 20:
+            return f"AppendOnlyHistory({list(self)})"
+        head = ", ".join(repr(x) for x in self[:10])
+        return f"AppendOnlyHistory([{head}, ... +{self._len - 10} items])"
+
+    def tolist(self) -> List[Any]:
+        return list(self)
+
+    def _payload(self) -> tuple:
+        """(items, typecode) - 정수 히스토리도 int 목록으로 (typecode는 복원 시 검사 생략용)"""
+        typecode = self._store.typecode
+        if typecode is None:
+            return self.tolist(), None
+        full, rest = divmod(self._len, CHUNK_SIZE)
+        chunks = self._store.chunks
+        items: List[int] = []
+        for chunk in chunks[:full]:
+            items.extend(chunk.tolist())
+        if rest:
+            items.extend(chunks[full][:rest].tolist())
+        return items, typecode
+
+    def _asdict(self) -> dict:
+        # 체크포인터의 msgpack 직렬화기가 cls(**_asdict())로 복원
+        items, typecode = self._payload()
+        return {"items": items, "typecode": typecode}
+
+    def __reduce__(self):
+        return AppendOnlyHistory, self._payload()
+
+
+def append_history(left: Any, right: Any) -> AppendOnlyHistory:
+    """
+    operator.concat 대신 쓰는 리듀서
+
+    Args:
+        left: 현재 값 (AppendOnlyHistory, list 또는 None)
+        right: 노드가 반환한 새 항목들 (list/tuple/AppendOnlyHistory 또는 단일 항목)
+    """
+    if left is None:
+        left = AppendOnlyHistory()
+    elif not isinstance(left, AppendOnlyHistory):
+        left = AppendOnlyHistory(left)
+    if right is None:
+        return left
+    if not isinstance(right, (list, tuple, array, AppendOnlyHistory)):
+        right = [right]
+    return left.extend(right)
@@ -0,0 +1,126 @@
+"""
+⏱️ import 시간 벤치마크
+
+`python -X importtime`으로 각 스크립트 모듈을 새 인터프리터에서 import하고,
+최상위 패키지별 self 시간 합계로 콜드 스타트 비용을 분해합니다.
+
+사용 예 (저장소 루트에서):
+    PYTHONPATH=4_state_deepdive python -m graph_utils.importtime
+    PYTHONPATH=4_state_deepdive python -m graph_utils.importtime \
+        3_structured_ouputs:chains --top 15 --json importtime.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# 기본 측정 대상: (스크립트 디렉토리, 모듈 이름)
+DEFAULT_TARGETS = [
+    ("2_basic_reflection_agents", "chains"),
+    ("3_structured_ouputs", "chains"),
+    ("3_structured_ouputs", "execute_tools"),
+]
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        (모듈 이름, self 시간 us, 누적 시간 us) 목록
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 줄 건너뛰기
+        entries.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return entries
+
+
+def measure(script_dir: str, module: str, repo_root: Path) -> dict:
+    """
+    새 인터프리터에서 모듈 하나를 import하며 시간 측정
+
+    Returns:
+        {"target", "wall_ms", "total_ms", "packages": {패키지: self ms}}
+    """
+    env = dict(os.environ)
+    graph_utils_dir = str(repo_root / "4_state_deepdive")
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (graph_utils_dir, env.get("PYTHONPATH")) if p
+    )
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=repo_root / script_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    entries = parse_importtime(proc.stderr)
+    packages = defaultdict(float)
+    for name, self_us, _ in entries:
+        packages[name.split(".")[0]] += self_us / 1000
+
+    return {
+        "target": f"{script_dir}:{module}",
+        "ok": proc.returncode == 0,
+        "wall_ms": round(wall_ms, 1),
+        "total_ms": round(sum(packages.values()), 1),
+        "packages": dict(
+            sorted(
+                ((k, round(v, 1)) for k, v in packages.items()),
+                key=lambda kv: kv[1],
+                reverse=True,
+            )
+        ),
+    }
+
+
+def print_report(result: dict, top: int) -> None:
+    """측정 결과 출력"""
+    status = "" if result["ok"] else " ❌ import 실패"
+    print(f"\n📦 {result['target']}{status}")
+    print(
+        f"   프로세스 전체: {result['wall_ms']:.1f}ms / "
+        f"import 합계: {result['total_ms']:.1f}ms"
+    )
+    for name, ms in list(result["packages"].items())[:top]:
+        share = ms / result["total_ms"] if result["total_ms"] else 0
+        print(f"   {ms:8.1f}ms  {share:5.1%}  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스크립트 모듈 import 시간 측정")
+    parser.add_argument(
+        "targets", nargs="*", help="'디렉토리:모듈' 형식 (기본: 체인/도구 모듈)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="출력할 패키지 수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[2]
+    targets = [tuple(t.split(":", 1)) for t in args.targets] or DEFAULT_TARGETS
+
+    results = [measure(d, m, repo_root) for d, m in targets]
+    for result in results:
+        print_report(result, args.top)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
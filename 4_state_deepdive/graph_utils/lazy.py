@@ -0,0 +1,176 @@
+"""
+💤 지연 로딩 프로바이더/도구 레지스트리
+
+모듈 import 시점에 LLM 클라이언트와 도구를 만들지 않고,
+처음 호출될 때 프로바이더 패키지를 import하고 객체를 생성합니다.
+사용하지 않는 프로바이더 패키지는 아예 import되지 않습니다.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Iterator, AsyncIterator, Optional
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+# 프로바이더 이름 → (모듈, 클래스)
+CHAT_MODELS = {
+    "google_genai": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "openai": ("langchain_openai", "ChatOpenAI"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "groq": ("langchain_groq", "ChatGroq"),
+}
+
+# 도구 이름 → (모듈, 클래스)
+TOOLS = {
+    "tavily": ("langchain_tavily", "TavilySearch"),
+    "tavily_results": (
+        "langchain_community.tools.tavily_search",
+        "TavilySearchResults",
+    ),
+}
+
+
+def load_class(module_name: str, class_name: str) -> type:
+    """모듈을 import하고 클래스 반환 (이 시점에 처음 패키지가 로드됨)"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class LazyRunnable(Runnable):
+    """처음 사용될 때 factory로 실제 Runnable을 만드는 프록시"""
+
+    def __init__(self, factory: Callable[[], Any], name: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            factory: 실제 객체를 만드는 함수 (첫 사용 시 한 번만 호출)
+            name: 표시용 이름
+        """
+        self._factory = factory
+        self._target = None
+        self._lock = threading.Lock()
+        self.name = name
+
+    def resolve(self) -> Any:
+        """실제 객체 반환 (없으면 생성)"""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._factory()
+        return self._target
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._target is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # 프록시 자체 속성이 아닌 것은 실제 객체에 위임 (예: tool.run)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self.is_resolved else "pending"
+        return f"LazyRunnable({self.name or self._factory!r}, {state})"
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        return self.resolve().invoke(input, config, **kwargs)
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        return await self.resolve().ainvoke(input, config, **kwargs)
+
+    def stream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Iterator[Any]:
+        yield from self.resolve().stream(input, config, **kwargs)
+
+    async def astream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        async for chunk in self.resolve().astream(input, config, **kwargs):
+            yield chunk
+
+    def batch(self, inputs: list, config: Any = None, **kwargs: Any) -> list:
+        return self.resolve().batch(inputs, config, **kwargs)
+
+    async def abatch(self, inputs: list, config: Any = None, **kwargs: Any) -> list:
+        return await self.resolve().abatch(inputs, config, **kwargs)
+
+
+class LazyChatModel(LazyRunnable):
+    """지연 생성 채팅 모델 - bind_tools / with_structured_output도 지연 적용"""
+
+    def __init__(self, provider: str, **model_kwargs: Any):
+        """
+        초기화
+
+        Args:
+            provider: CHAT_MODELS의 프로바이더 이름 ('google_genai', 'openai', ...)
+            **model_kwargs: 모델 생성자 인자 (model, temperature 등)
+        """
+        if provider not in CHAT_MODELS:
+            raise ValueError(
+                f"알 수 없는 프로바이더: {provider} (가능: {', '.join(CHAT_MODELS)})"
+            )
+        module_name, class_name = CHAT_MODELS[provider]
+        self.provider = provider
+        self.model_kwargs = model_kwargs
+        super().__init__(
+            lambda: load_class(module_name, class_name)(**model_kwargs),
+            name=f"{provider}:{model_kwargs.get('model', '')}",
+        )
+
+    def bind_tools(self, tools: list, **kwargs: Any) -> LazyRunnable:
+        return LazyRunnable(
+            lambda: self.resolve().bind_tools(tools, **kwargs),
+            name=f"{self.name}.bind_tools",
+        )
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> LazyRunnable:
+        return LazyRunnable(
+            lambda: self.resolve().with_structured_output(schema, **kwargs),
+            name=f"{self.name}.with_structured_output",
+        )
+
+
+def lazy_chat_model(provider: str, **model_kwargs: Any) -> LazyChatModel:
+    """
+    지연 생성 채팅 모델 만들기
+
+    사용 예:
+        llm = lazy_chat_model("openai", model="gpt-4o-mini", temperature=0)
+        chain = prompt | llm.with_structured_output(Schema)  # 아직 import/생성 안 됨
+        chain.invoke(...)  # 이 시점에 langchain_openai import + ChatOpenAI 생성
+    """
+    return LazyChatModel(provider, **model_kwargs)
+
+
+def lazy_tool(name: str, cached: bool = False, **tool_kwargs: Any) -> LazyRunnable:
+    """
+    지연 생성 도구 만들기 (tool.run / tool.invoke 첫 호출 시 생성)
+
+    ToolNode/create_agent처럼 생성 시점에 도구 스키마가 필요한 곳에는
+    lazy_tool(...).resolve()로 실제 도구를 넘겨야 합니다.
+
+    Args:
+        name: TOOLS의 도구 이름 ('tavily', 'tavily_results')
+        cached: True이면 SQLite 결과 캐시(cached_tool)로 감쌈
+        **tool_kwargs: 도구 생성자 인자
+    """
+    if name not in TOOLS:
+        raise ValueError(f"알 수 없는 도구: {name} (가능: {', '.join(TOOLS)})")
+    module_name, class_name = TOOLS[name]
+
+    def factory() -> Any:
+        tool = load_class(module_name, class_name)(**tool_kwargs)
+        if cached:
+            from .cache import cached_tool
+
+            tool = cached_tool(tool)
+        return tool
+
+    return LazyRunnable(factory, name=f"tool:{name}")
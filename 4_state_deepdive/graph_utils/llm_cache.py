@@ -0,0 +1,136 @@
+"""
+🧠 LLM 응답 캐시 (정확히 일치하는 프롬프트 재사용)
+
+프롬프트 | LLM 체인에서 LLM 부분을 감싸, 렌더링된 프롬프트 + 모델 이름 +
+생성 파라미터의 해시가 같으면 저장된 결과를 그대로 반환합니다.
+with_structured_output 체인은 파싱된 pydantic 객체를 그대로 저장합니다.
+"""
+
+from typing import Any, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import messages_to_dict
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import (
+    Runnable,
+    RunnableBinding,
+    RunnableConfig,
+    RunnableSequence,
+)
+
+from .cache import SqliteCache, make_key
+from .lazy import LazyRunnable
+
+DEFAULT_LLM_CACHE_PATH = ".cache/llm_cache.sqlite"
+
+_MISSING = object()
+_default_cache: Optional[SqliteCache] = None
+
+
+def default_llm_cache() -> SqliteCache:
+    """프로세스 공용 LLM 캐시 (7일 보관, 최대 200MB)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SqliteCache(
+            path=DEFAULT_LLM_CACHE_PATH,
+            namespace="llm",
+            ttl=7 * 24 * 3600,
+            max_entries=None,
+            max_bytes=200 * 1024 * 1024,
+        )
+    return _default_cache
+
+
+def model_identity(runnable: Any, **bound_kwargs: Any) -> str:
+    """
+    Runnable 안의 채팅 모델을 찾아 모델 이름 + 생성 파라미터 문자열 반환
+
+    with_structured_output()은 RunnableBinding(모델 + 도구 스키마) | 파서 형태이므로
+    첫 단계와 바인딩 인자(도구 스키마 등)까지 키에 포함합니다.
+    """
+    if isinstance(runnable, LazyRunnable):
+        return model_identity(runnable.resolve(), **bound_kwargs)
+    if isinstance(runnable, RunnableSequence):
+        steps = [model_identity(runnable.first, **bound_kwargs)]
+        steps.extend(type(step).__name__ for step in runnable.steps[1:])
+        return "|".join(steps)
+    if isinstance(runnable, RunnableBinding):
+        return model_identity(runnable.bound, **{**bound_kwargs, **runnable.kwargs})
+    if isinstance(runnable, BaseChatModel):
+        return runnable._get_llm_string(**bound_kwargs)
+    return repr(runnable)
+
+
+class CachedRunnable(Runnable):
+    """LLM(또는 구조화 출력 LLM) 호출 결과를 SqliteCache에 저장하는 래퍼"""
+
+    def __init__(self, runnable: Runnable, cache: Optional[SqliteCache] = None):
+        """
+        초기화
+
+        Args:
+            runnable: 감쌀 LLM Runnable (llm, llm.with_structured_output(...) 등)
+            cache: 사용할 캐시 (None이면 공용 LLM 캐시)
+        """
+        self.runnable = runnable
+        self.cache = cache if cache is not None else default_llm_cache()
+        self._model_id: Optional[str] = None
+
+    @property
+    def InputType(self) -> Any:
+        return self.runnable.InputType
+
+    @property
+    def OutputType(self) -> Any:
+        return self.runnable.OutputType
+
+    def cache_key(self, input: Any, config: Optional[RunnableConfig] = None) -> str:
+        """렌더링된 프롬프트 + 모델 식별자 + cache_seed로 키 생성
+
+        같은 입력으로 여러 후보를 뽑는 경우(fan-out 등)에는
+        config["configurable"]["cache_seed"]로 후보마다 다른 키를 사용합니다.
+        """
+        if isinstance(input, PromptValue):
+            prompt = messages_to_dict(input.to_messages())
+        else:
+            prompt = input
+        # 지연 생성 모델도 있으므로 모델 식별자는 첫 호출 때 계산
+        if self._model_id is None:
+            self._model_id = model_identity(self.runnable)
+        seed = (config or {}).get("configurable", {}).get("cache_seed")
+        return make_key(prompt, self._model_id, seed)
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = self.cache_key(input, config)
+        result = self.cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        result = self.runnable.invoke(input, config, **kwargs)
+        self.cache.set(key, result)
+        return result
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = self.cache_key(input, config)
+        result = self.cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        result = await self.runnable.ainvoke(input, config, **kwargs)
+        self.cache.set(key, result)
+        return result
+
+
+def cache_llm(runnable: Runnable, cache: Optional[SqliteCache] = None) -> CachedRunnable:
+    """
+    LLM Runnable을 응답 캐시로 감싸기
+
+    사용 예:
+        chain = prompt | cache_llm(llm)
+        structured_chain = prompt | cache_llm(llm.with_structured_output(Schema))
+    """
+    return CachedRunnable(runnable, cache)
@@ -0,0 +1,556 @@
+"""
+🖌️ 로컬 그래프 렌더러 (네트워크 없음)
+
+draw_mermaid_png()는 기본적으로 원격 렌더링 서비스(mermaid.ink)에 다이어그램을 보내므로
+느리고 오프라인에서는 실패합니다. 이 모듈은 compiled_graph.get_graph()의 노드/엣지를
+직접 배치해 SVG(의존성 없음)와 PNG(Pillow)를 만듭니다.
+
+배치는 grandalf의 Sugiyama 레이아웃을 사용하고, grandalf가 없으면
+순수 파이썬 계층 배치로 대신합니다.
+
+원격 렌더링과 시간 비교 (저장소 루트에서):
+    PYTHONPATH=4_state_deepdive python -m graph_utils.local_render
+"""
+
+import argparse
+import io
+import math
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+FONT_SIZE = 14
+CHAR_WIDTH = 8  # FONT_SIZE 기준 평균 글자 폭 추정치
+NODE_HEIGHT = 36
+NODE_PADDING = 24
+LAYER_GAP = 56  # 계층 사이 세로 간격
+NODE_GAP = 40  # 같은 계층 노드 사이 가로 간격
+MARGIN = 24
+LOOP_GAP = 24  # 되돌아가는 엣지를 오른쪽으로 돌릴 때의 간격 (엣지마다 한 칸씩 바깥으로)
+
+# mermaid 기본 테마와 비슷한 색
+NODE_FILL = "#f2f0ff"
+NODE_STROKE = "#9370db"
+TERMINAL_FILL = "#bfb6fc"
+EDGE_COLOR = "#333333"
+TEXT_COLOR = "#333333"
+
+START, END = "__start__", "__end__"
+
+Point = Tuple[float, float]
+
+
+@dataclass
+class NodeBox:
+    """배치된 노드 (x, y는 중심 좌표)"""
+
+    id: str
+    label: str
+    x: float = 0.0
+    y: float = 0.0
+    w: float = 0.0
+    h: float = NODE_HEIGHT
+
+    @property
+    def terminal(self) -> bool:
+        return self.id in (START, END)
+
+
+@dataclass
+class EdgePath:
+    """배치된 엣지 경로"""
+
+    source: str
+    target: str
+    points: List[Point]
+    label: Optional[str] = None
+    conditional: bool = False
+
+
+@dataclass
+class Layout:
+    """노드/엣지 좌표와 전체 크기"""
+
+    nodes: Dict[str, NodeBox] = field(default_factory=dict)
+    edges: List[EdgePath] = field(default_factory=list)
+    width: float = 0.0
+    height: float = 0.0
+
+
+def _label(node: Any) -> str:
+    name = getattr(node, "name", None) or node.id
+    return name.strip("_") if node.id in (START, END) else name
+
+
+def _edge_label(edge: Any) -> Optional[str]:
+    data = getattr(edge, "data", None)
+    # 조건 엣지의 data는 분기 이름, 일반 엣지는 None
+    return str(data) if data not in (None, "") and data != edge.target else None
+
+
+def _boxes(graph: Any) -> Dict[str, NodeBox]:
+    boxes = {}
+    for node_id, node in graph.nodes.items():
+        label = _label(node)
+        boxes[node_id] = NodeBox(
+            node_id, label, w=len(label) * CHAR_WIDTH + NODE_PADDING * 2
+        )
+    return boxes
+
+
+def _clear_right(box: NodeBox, boxes: Dict[str, NodeBox]) -> bool:
+    """같은 줄에서 box 오른쪽에 다른 노드가 없는지"""
+    return not any(
+        other is not box and other.x > box.x and abs(other.y - box.y) < (other.h + box.h) / 2
+        for other in boxes.values()
+    )
+
+
+def _route_back_edges(paths: List[EdgePath], boxes: Dict[str, NodeBox]) -> None:
+    """
+    위로 되돌아가는 엣지(사이클)를 오른쪽 바깥으로 우회
+
+    그대로 두면 정방향 엣지와 같은 선 위에 겹쳐 그려져 (점선인 조건 엣지가 실선 양방향
+    화살표처럼 보임) 같은 줄의 다른 노드를 가로지릅니다. 노드 오른쪽이 비어 있으면
+    옆면에서, 아니면 위/아래로 빠져나가 LOOP_GAP 간격의 세로 통로로 올라갑니다.
+    """
+    lane = 0
+    for path in paths:
+        s, t = boxes[path.source], boxes[path.target]
+        if t.y > s.y:
+            continue
+        lane += 1
+        top, bottom = t.y - t.h / 2, s.y + s.h / 2
+        right = max(
+            b.x + b.w / 2 for b in boxes.values() if b.y + b.h / 2 >= top and b.y - b.h / 2 <= bottom
+        )
+        detour = right + LOOP_GAP * lane
+
+        # 옆이 막혀 있으면 노드 위/아래로 살짝만 빠져나감 (계층 사이 가운데는 엣지 라벨 자리)
+        if _clear_right(s, boxes):
+            leave = [(s.x + s.w / 2, s.y), (detour, s.y)]
+        else:
+            y = s.y - s.h / 2 - LOOP_GAP / 2
+            leave = [(s.x + s.w / 4, s.y - s.h / 2), (s.x + s.w / 4, y), (detour, y)]
+        if _clear_right(t, boxes):
+            arrive = [(detour, t.y), (t.x + t.w / 2, t.y)]
+        else:
+            y = t.y + t.h / 2 + LOOP_GAP / 2
+            arrive = [(detour, y), (t.x + t.w / 4, y), (t.x + t.w / 4, t.y + t.h / 2)]
+        path.points = leave + arrive
+
+
+def _grandalf_layout(graph: Any, boxes: Dict[str, NodeBox]) -> Optional[List[EdgePath]]:
+    """grandalf Sugiyama 배치 (설치되어 있지 않으면 None)"""
+    try:
+        from grandalf.graphs import Edge, Graph, Vertex
+        from grandalf.layouts import SugiyamaLayout
+        from grandalf.routing import EdgeViewer, route_with_lines
+    except ImportError:
+        return None
+
+    class _View:
+        def __init__(self, box: NodeBox):
+            self.w, self.h = box.w, box.h
+            self.xy = (0.0, 0.0)
+
+    vertices = {node_id: Vertex(node_id) for node_id in boxes}
+    for node_id, vertex in vertices.items():
+        vertex.view = _View(boxes[node_id])
+
+    edges = []
+    for edge in graph.edges:
+        if edge.source == edge.target:
+            continue  # 자기 자신으로의 엣지는 직접 그림
+        e = Edge(vertices[edge.source], vertices[edge.target], data=edge)
+        e.view = EdgeViewer()
+        edges.append(e)
+
+    g = Graph(list(vertices.values()), edges)
+    offset_x = 0.0
+    for component in g.C:
+        sug = SugiyamaLayout(component)
+        roots = [v for v in component.sV if len(v.e_in()) == 0]
+        sug.init_all(roots=roots or None, optimize=True)
+        sug.xspace = NODE_GAP
+        sug.yspace = LAYER_GAP
+        sug.route_edge = route_with_lines
+        sug.draw()
+
+        # 연결 요소들을 가로로 나란히 배치
+        xs = [v.view.xy[0] - v.view.w / 2 for v in component.sV]
+        right = offset_x
+        for v in component.sV:
+            box = boxes[v.data]
+            box.x = v.view.xy[0] - min(xs) + offset_x
+            box.y = v.view.xy[1]
+            right = max(right, box.x + box.w / 2)
+        for e in component.sE:
+            shift = -min(xs) + offset_x
+            pts = getattr(e.view, "_pts", None) or [
+                e.v[0].view.xy,
+                e.v[1].view.xy,
+            ]
+            e.view._pts = [(x + shift, y) for x, y in pts]
+        offset_x = right + NODE_GAP
+
+    paths = []
+    for e in edges:
+        source, target = e.data.source, e.data.target
+        points = list(e.view._pts)
+        # 역방향 엣지는 grandalf가 뒤집어 배치하므로 방향을 되돌림
+        if math.dist(points[0], (boxes[source].x, boxes[source].y)) > math.dist(
+            points[-1], (boxes[source].x, boxes[source].y)
+        ):
+            points.reverse()
+        paths.append(
+            EdgePath(source, target, points, _edge_label(e.data), e.data.conditional)
+        )
+    _route_back_edges(paths, boxes)
+    return paths
+
+
+def _layered_layout(graph: Any, boxes: Dict[str, NodeBox]) -> List[EdgePath]:
+    """순수 파이썬 계층 배치 (최장 경로 계층화 + 무게중심 정렬)"""
+    edges = [e for e in graph.edges if e.source != e.target]
+    out_edges = defaultdict(list)
+    for e in edges:
+        out_edges[e.source].append(e.target)
+
+    # 1) DFS로 되돌아가는 엣지(back edge)를 찾아 계층화에서 제외
+    order = [START] if START in boxes else []
+    order += [n for n in boxes if n != START]
+    state: Dict[str, int] = {}
+    back = set()
+    for root in order:
+        if root in state:
+            continue
+        stack = [(root, iter(out_edges[root]))]
+        state[root] = 1
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                state[node] = 2
+                stack.pop()
+            elif state.get(child) == 1:
+                back.add((node, child))
+            elif child not in state:
+                state[child] = 1
+                stack.append((child, iter(out_edges[child])))
+
+    # 2) 최장 경로 계층화 (위상 정렬 순서)
+    forward = [e for e in edges if (e.source, e.target) not in back]
+    indegree = {n: 0 for n in boxes}
+    for e in forward:
+        indegree[e.target] += 1
+    layer = {n: 0 for n in boxes}
+    queue = deque(n for n in order if indegree[n] == 0)
+    while queue:
+        node = queue.popleft()
+        for e in forward:
+            if e.source != node:
+                continue
+            layer[e.target] = max(layer[e.target], layer[node] + 1)
+            indegree[e.target] -= 1
+            if indegree[e.target] == 0:
+                queue.append(e.target)
+    if END in layer:
+        layer[END] = max(layer.values())
+
+    # 3) 계층별로 앞 계층 부모들의 평균 위치(무게중심) 순으로 정렬
+    layers = defaultdict(list)
+    for node in order:
+        layers[layer[node]].append(node)
+    position: Dict[str, float] = {}
+    for depth in sorted(layers):
+        def barycenter(node: str) -> float:
+            parents = [position[e.source] for e in forward if e.target == node and e.source in position]
+            return sum(parents) / len(parents) if parents else float("inf")
+
+        layers[depth].sort(key=barycenter)
+        for i, node in enumerate(layers[depth]):
+            position[node] = i
+
+    # 4) 좌표 계산 (계층마다 가운데 정렬)
+    widths = {
+        d: sum(boxes[n].w for n in nodes) + NODE_GAP * (len(nodes) - 1)
+        for d, nodes in layers.items()
+    }
+    total = max(widths.values(), default=0)
+    for depth, nodes in layers.items():
+        x = (total - widths[depth]) / 2
+        for node in nodes:
+            box = boxes[node]
+            box.x = x + box.w / 2
+            box.y = depth * (NODE_HEIGHT + LAYER_GAP) + NODE_HEIGHT / 2
+            x += box.w + NODE_GAP
+
+    # 5) 엣지 경로: 아래로 가는 엣지는 직선, 위로 가는 엣지는 오른쪽으로 우회
+    paths = []
+    for e in edges:
+        s, t = boxes[e.source], boxes[e.target]
+        points = [(s.x, s.y + s.h / 2), (t.x, t.y - t.h / 2)]
+        paths.append(EdgePath(e.source, e.target, points, _edge_label(e), e.conditional))
+    _route_back_edges(paths, boxes)
+    return paths
+
+
+def layout_graph(graph: Any) -> Layout:
+    """
+    langchain_core Graph(compiled_graph.get_graph())의 노드/엣지 배치
+
+    Args:
+        graph: nodes/edges 속성을 가진 그래프
+
+    Returns:
+        여백이 포함된 좌표의 Layout
+    """
+    boxes = _boxes(graph)
+    paths = _grandalf_layout(graph, boxes)
+    if paths is None:
+        paths = _layered_layout(graph, boxes)
+
+    # 자기 자신으로 돌아오는 엣지는 노드 오른쪽의 작은 고리로 그림
+    for e in graph.edges:
+        if e.source == e.target:
+            box = boxes[e.source]
+            right, top, bottom = box.x + box.w / 2, box.y - box.h / 4, box.y + box.h / 4
+            points = [
+                (right, top),
+                (right + LOOP_GAP, top),
+                (right + LOOP_GAP, bottom),
+                (right, bottom),
+            ]
+            paths.append(EdgePath(e.source, e.target, points, _edge_label(e), e.conditional))
+
+    # 모든 좌표가 여백 안쪽에 오도록 평행 이동
+    xs = [b.x - b.w / 2 for b in boxes.values()] + [p[0] for e in paths for p in e.points]
+    ys = [b.y - b.h / 2 for b in boxes.values()] + [p[1] for e in paths for p in e.points]
+    dx = MARGIN - min(xs, default=0)
+    dy = MARGIN - min(ys, default=0)
+    for box in boxes.values():
+        box.x += dx
+        box.y += dy
+    for e in paths:
+        e.points = [(x + dx, y + dy) for x, y in e.points]
+
+    xs = [b.x + b.w / 2 for b in boxes.values()] + [p[0] for e in paths for p in e.points]
+    ys = [b.y + b.h / 2 for b in boxes.values()] + [p[1] for e in paths for p in e.points]
+    return Layout(
+        nodes=boxes,
+        edges=paths,
+        width=max(xs, default=0) + MARGIN,
+        height=max(ys, default=0) + MARGIN,
+    )
+
+
+def _midpoint(points: List[Point]) -> Point:
+    """경로 길이의 절반 지점 (엣지 라벨 위치)"""
+    segments = list(zip(points, points[1:]))
+    half = sum(math.dist(a, b) for a, b in segments) / 2
+    for a, b in segments:
+        length = math.dist(a, b)
+        if length >= half and length:
+            t = half / length
+            return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
+        half -= length
+    return points[-1]
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def render_svg(graph: Any) -> str:
+    """그래프를 SVG 문자열로 렌더링 (추가 의존성 없음)"""
+    layout = layout_graph(graph)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout.width:.0f}" '
+        f'height="{layout.height:.0f}" viewBox="0 0 {layout.width:.0f} {layout.height:.0f}" '
+        f'font-family="sans-serif" font-size="{FONT_SIZE}">',
+        "<defs><marker id=\"arrow\" viewBox=\"0 0 10 10\" refX=\"10\" refY=\"5\" "
+        "markerWidth=\"8\" markerHeight=\"8\" orient=\"auto-start-reverse\">"
+        f"<path d=\"M0,0 L10,5 L0,10 z\" fill=\"{EDGE_COLOR}\"/></marker></defs>",
+        '<rect width="100%" height="100%" fill="white"/>',
+    ]
+
+    for edge in layout.edges:
+        points = " ".join(f"{x:.1f},{y:.1f}" for x, y in edge.points)
+        dash = ' stroke-dasharray="6,4"' if edge.conditional else ""
+        parts.append(
+            f'<polyline points="{points}" fill="none" stroke="{EDGE_COLOR}" '
+            f'stroke-width="1.5"{dash} marker-end="url(#arrow)"/>'
+        )
+        if edge.label:
+            x, y = _midpoint(edge.points)
+            width = len(edge.label) * CHAR_WIDTH * 0.85 + 8
+            parts.append(
+                f'<rect x="{x - width / 2:.1f}" y="{y - 9:.1f}" width="{width:.1f}" '
+                f'height="18" fill="white" opacity="0.9"/>'
+                f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="middle" '
+                f'dominant-baseline="central" font-size="{FONT_SIZE - 2}" '
+                f'fill="{TEXT_COLOR}">{_escape(edge.label)}</text>'
+            )
+
+    for box in layout.nodes.values():
+        fill = TERMINAL_FILL if box.terminal else NODE_FILL
+        radius = box.h / 2 if box.terminal else 6
+        parts.append(
+            f'<rect x="{box.x - box.w / 2:.1f}" y="{box.y - box.h / 2:.1f}" '
+            f'width="{box.w:.1f}" height="{box.h:.1f}" rx="{radius:.1f}" '
+            f'fill="{fill}" stroke="{NODE_STROKE}" stroke-width="1.5"/>'
+            f'<text x="{box.x:.1f}" y="{box.y:.1f}" text-anchor="middle" '
+            f'dominant-baseline="central" fill="{TEXT_COLOR}">{_escape(box.label)}</text>'
+        )
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _load_font(size: int):
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1: 크기 지정 불가
+        return ImageFont.load_default()
+
+
+def _dashed_line(draw, a: Point, b: Point, fill: str, width: int, dash: float = 6, gap: float = 4):
+    length = math.dist(a, b)
+    if not length:
+        return
+    ux, uy = (b[0] - a[0]) / length, (b[1] - a[1]) / length
+    pos = 0.0
+    while pos < length:
+        end = min(pos + dash, length)
+        draw.line(
+            [(a[0] + ux * pos, a[1] + uy * pos), (a[0] + ux * end, a[1] + uy * end)],
+            fill=fill,
+            width=width,
+        )
+        pos = end + gap
+
+
+def render_png(graph: Any, scale: float = 2.0) -> bytes:
+    """
+    그래프를 PNG 바이트로 렌더링 (Pillow 사용)
+
+    Args:
+        graph: compiled_graph.get_graph() 결과
+        scale: 해상도 배율 (2.0이면 레티나 화면용)
+    """
+    from PIL import Image, ImageDraw
+
+    layout = layout_graph(graph)
+    s = scale
+    image = Image.new(
+        "RGB", (math.ceil(layout.width * s), math.ceil(layout.height * s)), "white"
+    )
+    draw = ImageDraw.Draw(image)
+    font = _load_font(round(FONT_SIZE * s))
+    small = _load_font(round((FONT_SIZE - 2) * s))
+    line_width = max(1, round(1.5 * s))
+
+    for edge in layout.edges:
+        points = [(x * s, y * s) for x, y in edge.points]
+        for a, b in zip(points, points[1:]):
+            if edge.conditional:
+                _dashed_line(draw, a, b, EDGE_COLOR, line_width, 6 * s, 4 * s)
+            else:
+                draw.line([a, b], fill=EDGE_COLOR, width=line_width)
+
+        # 마지막 선분 방향으로 화살촉
+        (x1, y1), (x2, y2) = points[-2], points[-1]
+        angle = math.atan2(y2 - y1, x2 - x1)
+        size = 8 * s
+        draw.polygon(
+            [
+                (x2, y2),
+                (x2 - size * math.cos(angle - 0.4), y2 - size * math.sin(angle - 0.4)),
+                (x2 - size * math.cos(angle + 0.4), y2 - size * math.sin(angle + 0.4)),
+            ],
+            fill=EDGE_COLOR,
+        )
+
+        if edge.label:
+            x, y = _midpoint(points)
+            left, top, right, bottom = draw.textbbox((x, y), edge.label, font=small, anchor="mm")
+            draw.rectangle((left - 4, top - 2, right + 4, bottom + 2), fill="white")
+            draw.text((x, y), edge.label, fill=TEXT_COLOR, font=small, anchor="mm")
+
+    for box in layout.nodes.values():
+        rect = (
+            (box.x - box.w / 2) * s,
+            (box.y - box.h / 2) * s,
+            (box.x + box.w / 2) * s,
+            (box.y + box.h / 2) * s,
+        )
+        draw.rounded_rectangle(
+            rect,
+            radius=(box.h / 2 if box.terminal else 6) * s,
+            fill=TERMINAL_FILL if box.terminal else NODE_FILL,
+            outline=NODE_STROKE,
+            width=line_width,
+        )
+        draw.text((box.x * s, box.y * s), box.label, fill=TEXT_COLOR, font=font, anchor="mm")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _sample_graph():
+    """시간 비교용 예제 그래프 (2_complex_state.py와 같은 구조)"""
+    from typing import TypedDict
+
+    from langgraph.graph import StateGraph
+
+    class State(TypedDict):
+        count: int
+
+    workflow = StateGraph(State)
+    workflow.add_node("increment", lambda state: {"count": state["count"] + 1})
+    workflow.add_node("print", lambda state: state)
+    workflow.set_entry_point("increment")
+    workflow.add_conditional_edges(
+        "increment",
+        lambda state: "continue" if state["count"] < 5 else "stop",
+        {"continue": "print", "stop": "__end__"},
+    )
+    workflow.add_edge("print", "increment")
+    return workflow.compile()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 렌더러와 원격 mermaid 렌더링 시간 비교")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-remote", action="store_true", help="원격 렌더링 측정 생략")
+    args = parser.parse_args()
+
+    graph = _sample_graph().get_graph()
+    renderers = {"local svg": render_svg, "local png": render_png}
+    if not args.skip_remote:
+        renderers["remote png (mermaid.ink)"] = lambda g: g.draw_mermaid_png()
+
+    for name, render in renderers.items():
+        timings = []
+        try:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                output = render(graph)
+                timings.append(time.perf_counter() - start)
+        except Exception as e:
+            print(f"❌ {name:28} 실패: {e}")
+            continue
+        timings.sort()
+        print(
+            f"⏱️ {name:28} 중앙값 {timings[len(timings) // 2] * 1000:8.1f}ms "
+            f"(최소 {timings[0] * 1000:.1f}ms, {len(output)} bytes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
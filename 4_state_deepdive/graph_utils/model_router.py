@@ -0,0 +1,364 @@
+"""
+🧭 지연 시간/비용 기반 모델 라우터
+
+챗봇 노드의 llm 자리에 그대로 넣어 쓰는 Runnable입니다.
+턴마다 값싼 로컬 특징(프롬프트 길이, 도구 바인딩 여부, 대화 깊이)으로 필요한 등급을 정하고,
+모델별 최근 지연 시간/오류율을 보고 상태가 나쁜 모델은 건너뜁니다.
+상태 판단에는 최근 sample_ttl초 안의 표본만 쓰므로, 건너뛴 모델도 시간이 지나면
+오래된 표본이 빠져 다시 요청을 받고 회복 여부가 확인됩니다.
+호출이 실패하면 다음 후보 모델로 한 번 더 시도합니다.
+
+모든 결정과 결과(지연 시간, 토큰, 비용)는 JSONL 로그에 남겨 정책 조정에 사용합니다.
+
+사용 예:
+    llm = default_router()
+    llm_with_tools = llm.bind_tools(tools)   # 도구 바인딩도 모든 등급에 적용
+    response = llm.invoke(state["messages"])
+    print(llm.summary())
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from .lazy import lazy_chat_model
+from .profiler import percentile
+
+DEFAULT_ROUTING_LOG_PATH = ".cache/model_routing.jsonl"
+
+
+@dataclass
+class ModelTier:
+    """라우팅 대상 모델 하나 (tiers 목록은 싼 모델 → 큰 모델 순서)
+
+    Attributes:
+        name: 로그/통계에 쓸 이름
+        model: 채팅 모델 Runnable
+        input_per_1m: 입력 100만 토큰당 가격 (USD)
+        output_per_1m: 출력 100만 토큰당 가격 (USD)
+        max_prompt_tokens: 이 모델에 보낼 최대 프롬프트 토큰 수 (None이면 제한 없음)
+    """
+
+    name: str
+    model: Any
+    input_per_1m: float = 0.0
+    output_per_1m: float = 0.0
+    max_prompt_tokens: Optional[int] = None
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        return (input_tokens * self.input_per_1m + output_tokens * self.output_per_1m) / 1e6
+
+
+@dataclass
+class RoutingPolicy:
+    """등급 선택 규칙
+
+    Attributes:
+        long_prompt_tokens: 이보다 긴 프롬프트는 한 등급 위 모델 사용
+        deep_turns: 사용자 턴이 이 이상이면 한 등급 위 모델 사용
+        tools_tier: 도구가 바인딩된 경우 최소 등급 (0이면 도구 여부 무시)
+        latency_slo: 최근 p95 지연 시간이 이보다 크면 건너뜀 (초)
+        max_error_rate: 최근 오류율이 이보다 크면 건너뜀
+        min_samples: 상태 판단에 필요한 최소 표본 수
+        sample_ttl: 상태 판단에 쓸 표본의 최대 나이 (초)
+        max_attempts: 실패 시 다른 모델까지 포함한 최대 시도 횟수
+    """
+
+    long_prompt_tokens: int = 2000
+    deep_turns: int = 8
+    tools_tier: int = 1
+    latency_slo: float = 5.0
+    max_error_rate: float = 0.2
+    min_samples: int = 10
+    sample_ttl: float = 60.0
+    max_attempts: int = 2
+
+
+@dataclass
+class TurnFeatures:
+    """한 턴의 라우팅 특징"""
+
+    prompt_tokens: int
+    tools_bound: bool
+    depth: int
+
+
+class TierStats:
+    """모델 하나의 최근 호출 결과 (지연 시간, 성공 여부)와 누적 비용"""
+
+    def __init__(self, window: int = 200):
+        self._recent: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.cost = 0.0
+
+    def record(self, latency: float, ok: bool, cost: float = 0.0) -> None:
+        with self._lock:
+            self._recent.append((time.monotonic(), latency, ok))
+            self.calls += 1
+            self.cost += cost
+
+    def snapshot(self, max_age: Optional[float] = None) -> Tuple[List[float], float, int]:
+        """
+        (성공한 호출 지연 시간들, 오류율, 표본 수)
+
+        Args:
+            max_age: 이보다 오래된 표본은 제외 (초, None이면 창 전체)
+        """
+        with self._lock:
+            recent = list(self._recent)
+        if max_age is not None:
+            cutoff = time.monotonic() - max_age
+            recent = [r for r in recent if r[0] >= cutoff]
+        if not recent:
+            return [], 0.0, 0
+        latencies = [latency for _, latency, ok in recent if ok]
+        return latencies, 1 - len(latencies) / len(recent), len(recent)
+
+    def healthy(self, policy: RoutingPolicy) -> bool:
+        # 건너뛰는 동안에는 새 표본이 없으므로, 오래된 표본이 빠지면 다시 시도됨
+        latencies, error_rate, samples = self.snapshot(policy.sample_ttl)
+        if samples < policy.min_samples:
+            return True
+        if error_rate > policy.max_error_rate:
+            return False
+        return percentile(latencies, 95) <= policy.latency_slo
+
+
+class RoutingLog:
+    """라우팅 결정/결과 기록 (JSONL 파일, path가 None이면 메모리만)"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_ROUTING_LOG_PATH, keep: int = 1000):
+        self.path = Path(path) if path else None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.records: deque = deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def write(self, record: dict) -> None:
+        with self._lock:
+            self.records.append(record)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _messages(input: Any) -> List[BaseMessage]:
+    if isinstance(input, PromptValue):
+        return input.to_messages()
+    if isinstance(input, str):
+        return [HumanMessage(content=input)]
+    return list(input)
+
+
+def _usage(response: Any, prompt_tokens: int) -> Tuple[int, int]:
+    """응답의 실제 토큰 사용량 (없으면 근사값)"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+    return prompt_tokens, count_tokens_approximately([response])
+
+
+class ModelRouter(Runnable):
+    """턴마다 모델 등급을 골라 호출하는 llm 대체 Runnable"""
+
+    def __init__(
+        self,
+        tiers: List[ModelTier],
+        policy: Optional[RoutingPolicy] = None,
+        log: Optional[RoutingLog] = None,
+        tools_bound: bool = False,
+        stats: Optional[Dict[str, TierStats]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            tiers: 싼 모델 → 큰 모델 순서의 등급 목록
+            policy: 등급 선택 규칙 (기본 RoutingPolicy())
+            log: 결정/결과 로그 (기본 .cache/model_routing.jsonl)
+            tools_bound: bind_tools로 만든 라우터인지 여부
+            stats: 등급 이름별 통계 (bind_tools로 만든 라우터끼리 공유)
+        """
+        if not tiers:
+            raise ValueError("tiers가 비어 있습니다")
+        self.tiers = tiers
+        self.policy = policy or RoutingPolicy()
+        self.log = log if log is not None else RoutingLog()
+        self.tools_bound = tools_bound
+        self.stats = stats if stats is not None else {t.name: TierStats() for t in tiers}
+
+    def bind_tools(self, tools: list, **kwargs: Any) -> "ModelRouter":
+        """모든 등급에 도구를 바인딩한 라우터 (통계/로그는 공유)"""
+        tiers = [
+            ModelTier(
+                name=t.name,
+                model=t.model.bind_tools(tools, **kwargs),
+                input_per_1m=t.input_per_1m,
+                output_per_1m=t.output_per_1m,
+                max_prompt_tokens=t.max_prompt_tokens,
+            )
+            for t in self.tiers
+        ]
+        return ModelRouter(tiers, self.policy, self.log, tools_bound=True, stats=self.stats)
+
+    # ============================================
+    # 결정
+    # ============================================
+
+    def features(self, messages: List[BaseMessage]) -> TurnFeatures:
+        return TurnFeatures(
+            prompt_tokens=count_tokens_approximately(messages),
+            tools_bound=self.tools_bound,
+            depth=sum(isinstance(m, HumanMessage) for m in messages),
+        )
+
+    def choose(self, features: TurnFeatures) -> Tuple[List[int], List[str]]:
+        """
+        등급 선택
+
+        Returns:
+            (시도할 등급 인덱스 순서, 선택 이유 목록)
+        """
+        policy = self.policy
+        want, reasons = 0, []
+        if features.prompt_tokens > policy.long_prompt_tokens:
+            want, reasons = max(want, 1), reasons + ["long_prompt"]
+        if features.depth >= policy.deep_turns:
+            want, reasons = max(want, 1), reasons + ["deep_conversation"]
+        if features.tools_bound and policy.tools_tier:
+            want, reasons = max(want, policy.tools_tier), reasons + ["tools"]
+        want = min(want, len(self.tiers) - 1)
+
+        # 원하는 등급부터 위로, 그다음 아래로 (프롬프트가 들어가는 모델만)
+        order = list(range(want, len(self.tiers))) + list(range(want - 1, -1, -1))
+        fits = [
+            i for i in order
+            if self.tiers[i].max_prompt_tokens is None
+            or features.prompt_tokens <= self.tiers[i].max_prompt_tokens
+        ] or order
+        healthy = [i for i in fits if self.stats[self.tiers[i].name].healthy(policy)]
+        if healthy and healthy[0] != fits[0]:
+            reasons.append(f"unhealthy:{self.tiers[fits[0]].name}")
+        # 상태가 나쁜 모델도 마지막 후보로는 남겨 둠
+        candidates = healthy + [i for i in fits if i not in healthy]
+        return candidates[: policy.max_attempts], reasons or ["default"]
+
+    def _finish(
+        self,
+        tier: ModelTier,
+        features: TurnFeatures,
+        reasons: List[str],
+        attempt: int,
+        start: float,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        latency = time.perf_counter() - start
+        input_tokens = output_tokens = 0
+        cost = 0.0
+        if error is None:
+            input_tokens, output_tokens = _usage(response, features.prompt_tokens)
+            cost = tier.cost(input_tokens, output_tokens)
+        self.stats[tier.name].record(latency, ok=error is None, cost=cost)
+        self.log.write(
+            {
+                "ts": time.time(),
+                "tier": tier.name,
+                "attempt": attempt,
+                "reasons": reasons,
+                **asdict(features),
+                "latency_s": round(latency, 4),
+                "ok": error is None,
+                "error": repr(error) if error is not None else None,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost_usd": cost,
+            }
+        )
+
+    # ============================================
+    # 호출
+    # ============================================
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        features = self.features(_messages(input))
+        candidates, reasons = self.choose(features)
+        for attempt, index in enumerate(candidates):
+            tier = self.tiers[index]
+            start = time.perf_counter()
+            try:
+                response = tier.model.invoke(input, config, **kwargs)
+            except Exception as e:
+                self._finish(tier, features, reasons, attempt, start, error=e)
+                if attempt == len(candidates) - 1:
+                    raise
+                continue
+            self._finish(tier, features, reasons, attempt, start, response=response)
+            return response
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        features = self.features(_messages(input))
+        candidates, reasons = self.choose(features)
+        for attempt, index in enumerate(candidates):
+            tier = self.tiers[index]
+            start = time.perf_counter()
+            try:
+                response = await tier.model.ainvoke(input, config, **kwargs)
+            except Exception as e:
+                self._finish(tier, features, reasons, attempt, start, error=e)
+                if attempt == len(candidates) - 1:
+                    raise
+                continue
+            self._finish(tier, features, reasons, attempt, start, response=response)
+            return response
+
+    def summary(self) -> str:
+        """등급별 호출 수, 지연 시간, 오류율, 누적 비용"""
+        lines = ["🧭 모델 라우팅 요약"]
+        for tier in self.tiers:
+            stats = self.stats[tier.name]
+            latencies, error_rate, _ = stats.snapshot()
+            lines.append(
+                f"  {tier.name:12} {stats.calls:>4}회, p50 {percentile(latencies, 50):.2f}s / "
+                f"p95 {percentile(latencies, 95):.2f}s, 오류 {error_rate:.0%}, ${stats.cost:.5f}"
+            )
+        return "\n".join(lines)
+
+
+def default_router(
+    policy: Optional[RoutingPolicy] = None, log: Optional[RoutingLog] = None
+) -> ModelRouter:
+    """
+    챗봇 기본 라우터: Groq 8B (기본) → Groq 70B (긴 프롬프트/깊은 대화/도구 바인딩)
+
+    가격은 입력/출력 100만 토큰당 USD이며, 모델은 처음 호출될 때 생성됩니다.
+    """
+    tiers = [
+        ModelTier(
+            "small",
+            lazy_chat_model("groq", model="llama-3.1-8b-instant"),
+            input_per_1m=0.05,
+            output_per_1m=0.08,
+        ),
+        ModelTier(
+            "large",
+            lazy_chat_model("groq", model="llama-3.3-70b-versatile"),
+            input_per_1m=0.59,
+            output_per_1m=0.79,
+        ),
+    ]
+    return ModelRouter(tiers, policy, log)
@@ -0,0 +1,80 @@
+"""
+📈 노드 실행 시간 수집
+
+LangGraph 실행 중 콜백으로 각 노드의 시작/종료 시각을 기록합니다.
+invoke/stream/ainvoke 호출 시 config={"callbacks": [profiler]}로 전달합니다.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+def percentile(values: list, q: float) -> float:
+    """정렬 후 선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+class NodeTimingCallback(BaseCallbackHandler):
+    """노드별 실행 시간을 모으는 콜백 핸들러 (여러 스레드/동시 실행에서 공유 가능)"""
+
+    # 비동기 실행에서도 이벤트 루프 안에서 바로 호출되어야 시각이 정확함
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._starts: dict = {}
+        self.durations: dict = defaultdict(list)
+
+    def on_chain_start(
+        self,
+        serialized: Optional[dict],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        # 노드 안의 하위 체인도 같은 metadata를 가지므로 노드 자체 실행만 기록
+        if node is not None and kwargs.get("name") == node:
+            with self._lock:
+                self._starts[run_id] = (node, time.perf_counter())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._finish(run_id)
+
+    def _finish(self, run_id: UUID) -> None:
+        with self._lock:
+            started = self._starts.pop(run_id, None)
+            if started is not None:
+                node, start = started
+                self.durations[node].append(time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        """노드별 {count, total, p50, p95} (초)"""
+        with self._lock:
+            return {
+                node: {
+                    "count": len(values),
+                    "total": sum(values),
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                }
+                for node, values in self.durations.items()
+            }
@@ -0,0 +1,155 @@
+"""
+🧵 백그라운드 렌더링 큐
+
+quick_visualize/show_graph는 PNG 생성과 파일 열기가 끝날 때까지 스크립트를 멈춥니다.
+visualize_async는 요청을 작업 스레드에 넘기고 Future를 바로 반환하므로
+그래프 실행과 시각화가 겹쳐서 진행됩니다.
+
+- 렌더링 중인 그래프와 구조/이름/형식이 같은 요청은 같은 Future를 반환
+  (끝난 요청은 큐에서 지우고, 다시 요청하면 아티팩트 매니페스트가 기존 파일을 돌려줌)
+- 인터프리터 종료 시 남은 렌더링을 최대 FLUSH_TIMEOUT초까지만 기다린 뒤 종료 (atexit)
+  작업 스레드는 데몬이므로 시간 안에 끝나지 않은 렌더링은 종료와 함께 버려짐
+
+사용 예:
+    future = visualize_async(app, "my_graph")
+    result = app.invoke(state)      # 렌더링과 동시에 실행
+    png_path = future.result()      # 필요할 때만 기다림
+"""
+
+import atexit
+import queue
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Dict, List, Optional
+
+from .visualizer import GraphVisualizer, topology_hash
+
+FLUSH_TIMEOUT = 30  # 종료 시 남은 렌더링을 기다릴 최대 시간 (초)
+
+
+class RenderQueue:
+    """GraphVisualizer 호출을 작업 스레드에서 처리하는 큐"""
+
+    def __init__(self, max_workers: int = 1):
+        """
+        초기화
+
+        Args:
+            max_workers: 작업 스레드 수 (렌더링은 대부분 GIL을 잡으므로 1이면 충분)
+        """
+        # ThreadPoolExecutor는 종료 시 작업이 끝날 때까지 무조건 join하므로
+        # (flush의 timeout보다 먼저 실행됨) 데몬 스레드를 직접 관리
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._max_workers = max_workers
+        self._workers: List[threading.Thread] = []
+        self._futures: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _work(self) -> None:
+        while True:
+            fn, future = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn()
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def submit(
+        self,
+        compiled_graph: Any,
+        name: str = "graph",
+        formats: Optional[list] = None,
+        auto_open: bool = True,
+        output_dir: str = "graph_visualizations",
+        renderer: str = "local",
+    ) -> Future:
+        """
+        렌더링 요청 등록
+
+        Returns:
+            visualize_graph 결과 딕셔너리를 돌려줄 Future
+        """
+        formats = list(formats or ['png'])
+        # 객체 id는 그래프가 해제되면 재사용되므로 구조 해시로 같은 요청을 구분
+        key = (
+            topology_hash(compiled_graph.get_graph()),
+            name, tuple(formats), output_dir, renderer,
+        )
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future
+
+            def render() -> dict:
+                visualizer = GraphVisualizer(output_dir, renderer=renderer, verbose=False)
+                return visualizer.visualize_graph(
+                    compiled_graph, name, auto_open=auto_open, formats=formats
+                )
+
+            future = Future()
+            self._jobs.put((render, future))
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"graph-render-{len(self._workers)}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+            self._futures[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key: tuple, future: Future) -> None:
+        """끝난 Future를 중복 제거 테이블에서 제거 (그 사이 새 요청이 들어왔으면 유지)"""
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> None:
+        """대기 중인 렌더링이 모두 끝날 때까지 최대 timeout초 기다림"""
+        with self._lock:
+            pending = [f for f in self._futures.values() if not f.done()]
+        if pending:
+            wait(pending, timeout=timeout)
+
+
+_queue: Optional[RenderQueue] = None
+_queue_lock = threading.Lock()
+
+
+def render_queue() -> RenderQueue:
+    """프로세스 공용 렌더링 큐 (처음 사용할 때 생성)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = RenderQueue()
+        return _queue
+
+
+def visualize_async(
+    compiled_graph: Any,
+    name: str = "graph",
+    show_png_only: bool = True,
+    output_dir: str = "graph_visualizations",
+) -> Future:
+    """
+    quick_visualize의 비블로킹 버전
+
+    Args:
+        compiled_graph: 컴파일된 LangGraph
+        name: 그래프 이름
+        show_png_only: PNG만 생성할지 여부
+        output_dir: 출력 디렉토리
+
+    Returns:
+        visualize_graph 결과 딕셔너리를 돌려줄 Future
+    """
+    formats = ['png'] if show_png_only else ['png', 'html']
+    return render_queue().submit(
+        compiled_graph, name, formats=formats, auto_open=True, output_dir=output_dir
+    )
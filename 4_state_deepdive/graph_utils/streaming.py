@@ -0,0 +1,198 @@
+"""
+⚡ 단일 실행 스트리밍 러너
+
+stream()으로 진행 상황을 출력한 뒤 invoke()로 최종 결과를 다시 받는 방식은
+LLM/도구 호출 비용이 두 배가 됩니다. 이 러너는 그래프를 한 번만 실행하면서
+노드 진행, 도구 호출, 토큰 청크, 최종 상태를 모두 이벤트로 전달합니다.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from langchain_core.messages import AIMessageChunk, BaseMessage, ToolMessage
+
+# updates: 노드별 진행 / messages: 토큰 청크 / values: 최종 상태
+STREAM_MODES = ["updates", "messages", "values"]
+
+
+@dataclass
+class StreamEvent:
+    """스트리밍 이벤트 하나
+
+    Attributes:
+        kind: 이벤트 종류 ('node', 'tool_call', 'tool_result', 'token', 'final')
+        node: 이벤트를 발생시킨 노드 이름 (final은 None)
+        data: 이벤트 데이터 (노드 업데이트, 도구 호출, 토큰 문자열, 최종 상태)
+        elapsed: 실행 시작 후 경과 시간 (초)
+    """
+
+    kind: str
+    node: Optional[str]
+    data: Any
+    elapsed: float
+
+
+@dataclass
+class StreamMetrics:
+    """인터랙티브 지연 시간 지표
+
+    Attributes:
+        time_to_first_token: 첫 토큰이 도착하기까지 걸린 시간 (초)
+        node_times: (노드 이름, 노드 완료 시점) 목록
+        total_time: 전체 실행 시간 (초)
+        token_chunks: 수신한 토큰 청크 수
+    """
+
+    time_to_first_token: Optional[float] = None
+    node_times: list = field(default_factory=list)
+    total_time: Optional[float] = None
+    token_chunks: int = 0
+
+    def summary(self) -> str:
+        """지표를 사람이 읽기 쉬운 문자열로 반환"""
+        ttft = (
+            f"{self.time_to_first_token:.2f}s"
+            if self.time_to_first_token is not None
+            else "-"
+        )
+        lines = [f"⏱️ 첫 토큰까지: {ttft}"]
+        for node, elapsed in self.node_times:
+            lines.append(f"   [{node}] 완료: {elapsed:.2f}s")
+        if self.total_time is not None:
+            lines.append(f"⏱️ 전체 실행: {self.total_time:.2f}s")
+        lines.append(f"🔤 토큰 청크: {self.token_chunks}개")
+        return "\n".join(lines)
+
+
+def _content_text(content: Any) -> str:
+    """메시지 content에서 텍스트만 추출 (문자열 또는 content block 리스트)"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, str):
+                parts.append(part)
+            elif isinstance(part, dict) and part.get("type") == "text":
+                parts.append(part.get("text", ""))
+        return "".join(parts)
+    return ""
+
+
+class StreamRunner:
+    """그래프를 한 번만 실행하면서 진행 상황과 최종 상태를 함께 스트리밍"""
+
+    def __init__(self, app: Any, config: Optional[dict] = None):
+        """
+        초기화
+
+        Args:
+            app: 컴파일된 LangGraph (또는 create_agent 결과)
+            config: 실행 시 전달할 RunnableConfig
+        """
+        self.app = app
+        self.config = config
+        self.metrics = StreamMetrics()
+        self.final_state: Optional[dict] = None
+
+    def run(self, inputs: Any) -> Iterator[StreamEvent]:
+        """
+        그래프를 실행하고 이벤트를 순서대로 반환
+
+        Args:
+            inputs: 그래프 입력 (예: {"messages": [...]})
+
+        Yields:
+            StreamEvent - 마지막 이벤트는 항상 kind='final' (data=최종 상태)
+        """
+        self.metrics = StreamMetrics()
+        self.final_state = None
+        start = time.perf_counter()
+
+        for mode, chunk in self.app.stream(
+            inputs, config=self.config, stream_mode=STREAM_MODES
+        ):
+            elapsed = time.perf_counter() - start
+
+            if mode == "messages":
+                message, metadata = chunk
+                if not isinstance(message, AIMessageChunk):
+                    continue
+                text = _content_text(message.content)
+                if not text:
+                    continue
+                if self.metrics.time_to_first_token is None:
+                    self.metrics.time_to_first_token = elapsed
+                self.metrics.token_chunks += 1
+                yield StreamEvent("token", metadata.get("langgraph_node"), text, elapsed)
+
+            elif mode == "updates":
+                for node, data in chunk.items():
+                    self.metrics.node_times.append((node, elapsed))
+                    yield StreamEvent("node", node, data, elapsed)
+                    yield from self._message_events(node, data, elapsed)
+
+            elif mode == "values":
+                self.final_state = chunk
+
+        self.metrics.total_time = time.perf_counter() - start
+        yield StreamEvent("final", None, self.final_state, self.metrics.total_time)
+
+    def _message_events(
+        self, node: str, data: Any, elapsed: float
+    ) -> Iterator[StreamEvent]:
+        """노드 업데이트에 포함된 도구 호출/도구 결과를 이벤트로 변환"""
+        if not isinstance(data, dict):
+            return
+        for msg in data.get("messages", []):
+            if not isinstance(msg, BaseMessage):
+                continue
+            for tool_call in getattr(msg, "tool_calls", None) or []:
+                yield StreamEvent("tool_call", node, tool_call, elapsed)
+            if isinstance(msg, ToolMessage):
+                yield StreamEvent("tool_result", node, msg, elapsed)
+
+
+def print_stream(
+    app: Any,
+    inputs: Any,
+    config: Optional[dict] = None,
+    show_tokens: bool = True,
+) -> Optional[dict]:
+    """
+    그래프를 한 번 실행하면서 진행 과정을 출력하고 최종 상태를 반환
+
+    Args:
+        app: 컴파일된 LangGraph
+        inputs: 그래프 입력
+        config: RunnableConfig
+        show_tokens: 토큰 청크를 실시간으로 출력할지 여부
+
+    Returns:
+        최종 상태 (invoke() 결과와 동일)
+    """
+    runner = StreamRunner(app, config)
+    streaming_text = False
+
+    for event in runner.run(inputs):
+        if event.kind == "token":
+            if show_tokens:
+                print(event.data, end="", flush=True)
+                streaming_text = True
+            continue
+
+        if streaming_text:
+            print()
+            streaming_text = False
+
+        if event.kind == "node":
+            print(f"\n[{event.node}] ({event.elapsed:.2f}s)")
+        elif event.kind == "tool_call":
+            print(f"  🔧 도구 사용: {event.data['name']}")
+            print(f"     입력: {event.data['args']}")
+        elif event.kind == "tool_result":
+            print(f"  ✅ 도구 결과: {_content_text(event.data.content)[:200]}...")
+
+    print("\n" + runner.metrics.summary())
+    return runner.final_state
@@ -1,23 +1,69 @@
+import hashlib
+import json
 import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Any
 
+from .artifacts import MANIFEST_NAME, ArtifactStore
+from .heatmap import heatmap_mermaid
+from .local_render import render_png, render_svg
+
+# 형식 → 파일 확장자
+EXTENSIONS = {'png': 'png', 'svg': 'svg', 'html': 'html', 'mermaid': 'mermaid'}
+
+
+def topology_hash(graph: Any) -> str:
+    """
+    그래프 구조(노드, 엣지, 조건 분기)의 해시
+
+    Args:
+        graph: compiled_graph.get_graph() 결과
+
+    Returns:
+        sha256 hex 문자열 - 구조가 같으면 항상 같은 값
+    """
+    topology = {
+        "nodes": [[node_id, getattr(node, "name", node_id)] for node_id, node in graph.nodes.items()],
+        "edges": [
+            [edge.source, edge.target, None if edge.data is None else str(edge.data), edge.conditional]
+            for edge in graph.edges
+        ],
+    }
+    raw = json.dumps(topology, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
 
 class GraphVisualizer:
     """LangGraph 시각화 전용 유틸리티"""
 
-    def __init__(self, output_dir: str = "graph_visualizations"):
+    def __init__(
+        self,
+        output_dir: str = "graph_visualizations",
+        renderer: str = "local",
+        verbose: bool = True,
+    ):
         """
         초기화
 
         Args:
             output_dir: 시각화 파일들을 저장할 디렉토리
+            renderer: PNG 렌더링 방식 - 'local' (네트워크 없이 직접 그림) 또는
+                'mermaid' (draw_mermaid_png, 원격 렌더링 서비스 사용)
+            verbose: 진행 메시지 출력 여부 (실패 메시지는 항상 출력)
         """
         self.output_dir = Path(output_dir)
+        self.renderer = renderer
+        self.verbose = verbose
         self.output_dir.mkdir(exist_ok=True)
 
+        # 매니페스트가 처음 만들어질 때만 기존 파일을 한 번 색인
+        new_manifest = not (self.output_dir / MANIFEST_NAME).exists()
+        self.store = ArtifactStore(self.output_dir)
+        if new_manifest:
+            self.store.reindex()
+
     def visualize_graph(
         self,
         compiled_graph: Any,
@@ -32,7 +78,7 @@ class GraphVisualizer:
             compiled_graph: 컴파일된 LangGraph 객체
             graph_name: 그래프 이름 (파일명에 사용)
             auto_open: 생성된 파일을 자동으로 열지 여부
-            formats: 생성할 형식 리스트 ['png', 'html', 'mermaid']
+            formats: 생성할 형식 리스트 ['png', 'svg', 'html', 'mermaid']
 
         Returns:
             생성된 파일 경로들을 담은 딕셔너리
@@ -40,55 +86,134 @@ class GraphVisualizer:
         if formats is None:
             formats = ['png', 'html', 'mermaid']
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_filename = f"{graph_name}_{timestamp}"
-
         results = {}
 
-        print(f"\n🎨 '{graph_name}' 그래프 시각화 시작...")
-        print("=" * 60)
-
-        # Mermaid 코드 생성
-        mermaid_code = compiled_graph.get_graph().draw_mermaid()
-
-        if 'mermaid' in formats:
+        self._log(f"\n🎨 '{graph_name}' 그래프 시각화 시작...")
+        self._log("=" * 60)
+
+        # 그래프는 호출마다 한 번만 만들고, 구조 해시로 파일 이름을 정함
+        graph = compiled_graph.get_graph()
+        topology = topology_hash(graph)[:12]
+        base_filename = f"{graph_name}_{topology}"
+
+        # 구조가 바뀌지 않았다면 이미 만든 파일을 그대로 사용 (매니페스트 조회)
+        pending = []
+        for fmt in formats:
+            artifact = None
+            if fmt in EXTENSIONS:
+                artifact = self.store.lookup(graph_name, topology, self._format_key(fmt))
+            if artifact is not None:
+                self._log(f"♻️ 캐시 사용: {artifact.path.name}")
+                results[fmt] = str(artifact.path)
+                if auto_open and fmt in ('png', 'html'):
+                    self._open_file(artifact.path)
+            else:
+                pending.append(fmt)
+
+        mermaid_code = None
+        if 'mermaid' in pending or 'html' in pending:
+            mermaid_code = graph.draw_mermaid()
+
+        if 'mermaid' in pending:
             results['mermaid'] = self._save_mermaid_text(mermaid_code, base_filename)
 
-        if 'png' in formats:
-            results['png'] = self._save_png(compiled_graph, base_filename, auto_open)
+        if 'png' in pending:
+            results['png'] = self._save_png(graph, base_filename, auto_open)
 
-        if 'html' in formats:
+        if 'svg' in pending:
+            results['svg'] = self._save_svg(graph, base_filename)
+
+        if 'html' in pending:
             results['html'] = self._save_html(
                 mermaid_code, base_filename, graph_name, auto_open
             )
 
-        print("\n✅ 시각화 완료!")
-        print(f"📁 저장 위치: {self.output_dir.absolute()}")
+        self._log("\n✅ 시각화 완료!")
+        self._log(f"📁 저장 위치: {self.output_dir.absolute()}")
+
+        return results
+
+    def visualize_execution(
+        self,
+        compiled_graph: Any,
+        recorder: Any,
+        graph_name: str = "graph",
+        metric: str = "p95",
+        auto_open: bool = True,
+        formats: list = None,
+    ) -> dict:
+        """
+        실행 기록을 입힌 히트맵으로 시각화
+
+        Args:
+            compiled_graph: 컴파일된 LangGraph 객체
+            recorder: 실행 중 callbacks로 전달한 ExecutionRecorder
+            graph_name: 그래프 이름 (파일명에 사용)
+            metric: 노드 색 기준 - 'p50' 또는 'p95'
+            auto_open: 생성된 HTML을 자동으로 열지 여부
+            formats: 생성할 형식 리스트 ['html', 'mermaid']
+
+        Returns:
+            생성된 파일 경로들을 담은 딕셔너리
+        """
+        if formats is None:
+            formats = ['html', 'mermaid']
+
+        self._log(f"\n🔥 '{graph_name}' 실행 히트맵 생성 ({metric} 기준)...")
+        self._log("=" * 60)
+
+        mermaid_code = heatmap_mermaid(compiled_graph.get_graph(), recorder, metric)
+        # 실행마다 결과가 다르므로 구조 해시 대신 시각으로 구분
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        base_filename = f"{graph_name}_heatmap-{timestamp}"
 
+        results = {}
+        if 'mermaid' in formats:
+            results['mermaid'] = self._save_mermaid_text(mermaid_code, base_filename)
+        if 'html' in formats:
+            results['html'] = self._save_html(
+                mermaid_code, base_filename, f"{graph_name} ({metric} heatmap)", auto_open
+            )
+
+        for node, stats in recorder.summary().items():
+            self._log(
+                f"   [{node}] {stats['count']}회, p50 {stats['p50'] * 1000:.0f}ms, "
+                f"p95 {stats['p95'] * 1000:.0f}ms"
+            )
         return results
 
+    def _format_key(self, fmt: str) -> str:
+        """매니페스트 형식 키 = 파일 확장자 (원격 렌더링 PNG는 로컬 PNG와 구분)"""
+        if fmt == 'png' and self.renderer == 'mermaid':
+            return 'mermaid.png'
+        return EXTENSIONS[fmt]
+
+    def _write(self, base_filename: str, fmt: str, data: Any) -> Path:
+        """임시 파일 + 교체로 저장하고 매니페스트에 등록"""
+        name, _, topology = base_filename.rpartition("_")
+        key = self._format_key(fmt)
+        artifact = self.store.write(f"{base_filename}.{key}", data, name, topology, key)
+        return artifact.path
+
     def _save_mermaid_text(self, mermaid_code: str, base_filename: str) -> str:
         """Mermaid 텍스트 파일 저장"""
-        filepath = self.output_dir / f"{base_filename}.mermaid"
+        filepath = self._write(base_filename, 'mermaid', mermaid_code)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(mermaid_code)
-
-        print(f"📝 Mermaid 텍스트: {filepath.name}")
+        self._log(f"📝 Mermaid 텍스트: {filepath.name}")
         return str(filepath)
 
     def _save_png(
-        self, compiled_graph: Any, base_filename: str, auto_open: bool
+        self, graph: Any, base_filename: str, auto_open: bool
     ) -> Optional[str]:
         """PNG 이미지 파일 저장"""
         try:
-            png_data = compiled_graph.get_graph().draw_mermaid_png()
-            filepath = self.output_dir / f"{base_filename}.png"
-
-            with open(filepath, 'wb') as f:
-                f.write(png_data)
+            if self.renderer == "mermaid":
+                png_data = graph.draw_mermaid_png()
+            else:
+                png_data = render_png(graph)
+            filepath = self._write(base_filename, 'png', png_data)
 
-            print(f"🖼️ PNG 이미지: {filepath.name}")
+            self._log(f"🖼️ PNG 이미지: {filepath.name}")
 
             if auto_open:
                 self._open_file(filepath)
@@ -97,9 +222,19 @@ class GraphVisualizer:
 
         except Exception as e:
             print(f"❌ PNG 생성 실패: {e}")
-            print("💡 해결 방법: brew install graphviz && uv add pygraphviz")
+            if self.renderer == "mermaid":
+                print("💡 해결 방법: 네트워크 연결 확인 또는 renderer='local' 사용")
+            else:
+                print("💡 해결 방법: uv add pillow grandalf")
             return None
 
+    def _save_svg(self, graph: Any, base_filename: str) -> str:
+        """SVG 이미지 파일 저장 (로컬 렌더링, 추가 의존성 없음)"""
+        filepath = self._write(base_filename, 'svg', render_svg(graph))
+
+        self._log(f"🧩 SVG 이미지: {filepath.name}")
+        return str(filepath)
+
     def _save_html(
         self, mermaid_code: str, base_filename: str, graph_name: str, auto_open: bool
     ) -> str:
@@ -193,18 +328,19 @@ class GraphVisualizer:
 </body>
 </html>"""
 
-        filepath = self.output_dir / f"{base_filename}.html"
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        filepath = self._write(base_filename, 'html', html_content)
 
-        print(f"🌐 HTML 파일: {filepath.name}")
+        self._log(f"🌐 HTML 파일: {filepath.name}")
 
         if auto_open:
             self._open_file(filepath)
 
         return str(filepath)
 
+    def _log(self, *args: Any) -> None:
+        if self.verbose:
+            print(*args)
+
     def _open_file(self, filepath: Path):
         """파일을 시스템 기본 앱으로 열기"""
         try:
@@ -217,27 +353,31 @@ class GraphVisualizer:
             print(f"📂 수동으로 열어보세요: {filepath}")
 
     def list_visualizations(self) -> list:
-        """저장된 시각화 파일들 목록 반환"""
-        files = []
-        for ext in ['*.png', '*.html', '*.mermaid']:
-            files.extend(self.output_dir.glob(ext))
-
-        return sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
-
-    def clean_old_files(self, keep_recent: int = 5):
-        """오래된 시각화 파일들 정리"""
-        files = self.list_visualizations()
-
-        if len(files) > keep_recent:
-            to_remove = files[keep_recent:]
-            for file in to_remove:
-                try:
-                    file.unlink()
-                    print(f"🗑️ 삭제: {file.name}")
-                except Exception as e:
-                    print(f"❌ 삭제 실패: {file.name} - {e}")
-
-            print(f"✅ {len(to_remove)}개 파일 정리 완료")
+        """저장된 시각화 파일들 목록 반환 (매니페스트 기준, 최신순)"""
+        return [artifact.path for artifact in self.store.list()]
+
+    def clean_old_files(
+        self,
+        keep_recent: Optional[int] = 5,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        """
+        오래된 시각화 파일들 정리
+
+        Args:
+            keep_recent: 남길 최대 파일 수
+            max_bytes: 전체 크기 상한
+            max_age: 보관 기간 (초)
+        """
+        removed = self.store.prune(
+            max_bytes=max_bytes, max_age=max_age, keep_recent=keep_recent
+        )
+        for artifact in removed:
+            self._log(f"🗑️ 삭제: {artifact.path.name}")
+
+        if removed:
+            self._log(f"✅ {len(removed)}개 파일 정리 완료")
 
 
 def quick_visualize(
@@ -1,6 +1,8 @@
 from datetime import datetime
 
+from deadline import DeadlineMiddleware
 from dotenv import load_dotenv
+from graph_utils import cached_tool
 
 # from langgraph.prebuilt import create_react_agent
 from langchain.agents import create_agent
@@ -20,11 +22,13 @@ def get_system_time(format: str = "%Y-%m-%d %H:%M:%S") -> str:
     return datetime.now().strftime(format)
 
 
-# tools
-search_tool = TavilySearch(search_depth="basic")
+# tools (반복 검색은 SQLite 캐시에서 바로 반환)
+search_tool = cached_tool(TavilySearch(search_depth="basic"))
 
 # 툴 정의
 tools = [search_tool, get_system_time]
 
-# Agent 생성
-react_agent_runnable = create_agent(model=llm, tools=tools)
+# Agent 생성 (config에 마감 시간이 있으면 도구 타임아웃/강제 최종 답변 적용)
+react_agent_runnable = create_agent(
+    model=llm, tools=tools, middleware=[DeadlineMiddleware()]
+)
@@ -0,0 +1,258 @@
+# ==============================================
+# ReAct 그래프 동시 처리 벤치마크: 스레드-요청당 동기 vs 비동기
+# ==============================================
+# API 키 없이 가짜 모델/도구로 react_graph_manual.py 방식(동기 노드 + 스레드 풀)과
+# react_graph_async.py 방식(async 노드 + 이벤트 루프 하나)을 비교합니다.
+# cached 모드는 비동기 그래프의 검색 도구를 기본값처럼 cached_tool로 감싸
+# SQLite 캐시 조회/저장이 이벤트 루프를 막지 않는지 확인합니다 (라운드마다 캐시를 비워 미스 + 저장).
+#
+# 가짜 모델은 첫 턴에 검색/시간 도구를 함께 호출하고, 도구 결과를 받으면 답변합니다.
+# 측정: 처리량, 세션 지연 p50/p95, 최대 스레드 수
+#
+# 결과 해석: 세션 하나는 가짜 지연 외에 그래프 실행(Pregel 루프, 콜백, 메시지 병합,
+# ToolNode 검증)에 CPU 약 4~5ms를 씁니다. 비동기 경로는 이 작업이 이벤트 루프 스레드
+# 하나에서 줄을 서므로, 지연이 짧은 설정(--llm-latency 0.05)에서 동시 50이면 세션마다
+# 50 x ~4.5ms를 더 기다려 p50이 동기보다 높아집니다. 동기 경로도 GIL 때문에 더 빠르지는
+# 않지만 --threads개만 동시에 실행하고 풀 대기 시간은 세션 지연에 포함되지 않습니다.
+# 비동기의 이점은 I/O 대기가 CPU 작업보다 훨씬 긴 경우(실제 LLM/검색)에 나타납니다.
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python benchmark_react_async.py
+#   PYTHONPATH=../4_state_deepdive python benchmark_react_async.py \
+#       --concurrency 1 10 100 300 --threads 32 --llm-latency 0.2 --json react.json
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, List, Optional
+
+from graph_utils import SqliteCache, cached_tool, percentile
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import BaseTool, tool
+from langgraph.graph import END, StateGraph
+from langgraph.prebuilt import ToolNode
+from react_graph_async import build_graph, get_system_time
+from react_state import AgentState, should_continue
+
+
+class FakeToolCallingModel(BaseChatModel):
+    """첫 턴에는 도구를 호출하고, 도구 결과가 있으면 최종 답변하는 가짜 모델"""
+
+    latency: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-tool-calling"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeToolCallingModel":
+        return self
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        if any(isinstance(m, ToolMessage) for m in messages):
+            message = AIMessage(content="도구 결과를 바탕으로 한 최종 답변입니다.")
+        else:
+            query = messages[-1].content
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "tavily_search",
+                        "args": {"query": query},
+                        "id": f"call_{uuid.uuid4().hex}",
+                    },
+                    {
+                        "name": "get_system_time",
+                        "args": {},
+                        "id": f"call_{uuid.uuid4().hex}",
+                    },
+                ],
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+class FakeSearchTool(BaseTool):
+    """TavilySearch 자리에 쓰는 가짜 검색 도구"""
+
+    name: str = "tavily_search"
+    description: str = "가짜 웹 검색 (벤치마크용)"
+    latency: float = 0.1
+
+    def _results(self, query: str) -> dict:
+        return {"query": query, "results": [{"url": "https://example.com", "content": "..."}]}
+
+    def _run(self, query: str) -> dict:
+        time.sleep(self.latency)
+        return self._results(query)
+
+    async def _arun(self, query: str) -> dict:
+        await asyncio.sleep(self.latency)
+        return self._results(query)
+
+
+# react_graph_manual.py의 동기 get_system_time과 같은 도구
+@tool("get_system_time")
+def get_system_time_sync(format: str = "%Y-%m-%d %H:%M:%S") -> str:
+    """오늘 날짜와 시간을 지정된 형식으로 반환합니다."""
+    return datetime.now().strftime(format)
+
+
+def build_sync_graph(llm: Any, tools: List[BaseTool]):
+    """react_graph_manual.py와 같은 동기 그래프 (노드가 스레드를 점유)"""
+    llm_with_tools = llm.bind_tools(tools)
+
+    def call_agent(state: AgentState) -> dict:
+        return {"messages": [llm_with_tools.invoke(state["messages"])]}
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("agent", call_agent)
+    workflow.add_node("tools", ToolNode(tools))
+    workflow.set_entry_point("agent")
+    workflow.add_conditional_edges(
+        "agent", should_continue, {"tools": "tools", "__end__": END}
+    )
+    workflow.add_edge("tools", "agent")
+    return workflow.compile()
+
+
+class ThreadSampler:
+    """실행 중 최대 활성 스레드 수 측정"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self) -> "ThreadSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _inputs(n: int) -> list:
+    return [{"messages": [HumanMessage(content=f"질문 {i}")]} for i in range(n)]
+
+
+def run_sync(app: Any, sessions: int, threads: int) -> List[float]:
+    """스레드 하나가 세션 하나를 끝까지 처리 (thread-per-request)"""
+
+    def one(inputs: dict) -> float:
+        start = time.perf_counter()
+        app.invoke(inputs)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(one, _inputs(sessions)))
+
+
+def run_async(app: Any, sessions: int, concurrency: int) -> List[float]:
+    """이벤트 루프 하나로 모든 세션을 동시에 처리"""
+
+    async def main() -> List[float]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(inputs: dict) -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                await app.ainvoke(inputs)
+                return time.perf_counter() - start
+
+        return await asyncio.gather(*(one(inputs) for inputs in _inputs(sessions)))
+
+    return asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동기 vs 비동기 ReAct 그래프 벤치마크")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100, 300])
+    parser.add_argument("--threads", type=int, default=32, help="동기 경로의 최대 스레드 수")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="가짜 LLM 응답 시간 (초)")
+    parser.add_argument("--tool-latency", type=float, default=0.1, help="가짜 검색 응답 시간 (초)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    llm = FakeToolCallingModel(latency=args.llm_latency)
+    search = FakeSearchTool(latency=args.tool_latency)
+    sync_app = build_sync_graph(llm, [search, get_system_time_sync])
+    async_app = build_graph(llm, [search, get_system_time])
+    cache_dir = tempfile.TemporaryDirectory()
+    cache = SqliteCache(os.path.join(cache_dir.name, "cache.sqlite"), namespace="bench")
+    cached_app = build_graph(llm, [cached_tool(search, cache), get_system_time])
+
+    results = []
+    for concurrency in args.concurrency:
+        sessions = max(concurrency, 10)
+        for mode in ("sync", "async", "cached"):
+            start = time.perf_counter()
+            with ThreadSampler() as sampler:
+                if mode == "sync":
+                    latencies = run_sync(sync_app, sessions, min(concurrency, args.threads))
+                elif mode == "async":
+                    latencies = run_async(async_app, sessions, concurrency)
+                else:
+                    cache.clear()
+                    latencies = run_async(cached_app, sessions, concurrency)
+            elapsed = time.perf_counter() - start
+
+            result = {
+                "mode": mode,
+                "concurrency": concurrency,
+                "sessions": sessions,
+                "elapsed_s": elapsed,
+                "sessions_per_s": sessions / elapsed,
+                "p50_s": percentile(latencies, 50),
+                "p95_s": percentile(latencies, 95),
+                "peak_threads": sampler.peak,
+            }
+            results.append(result)
+            print(
+                f"⚙️ {mode:6} 동시 {concurrency:>4}: {result['sessions_per_s']:7.1f} sessions/s, "
+                f"p50 {result['p50_s']:.2f}s / p95 {result['p95_s']:.2f}s, "
+                f"최대 스레드 {sampler.peak}"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
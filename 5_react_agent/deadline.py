@@ -0,0 +1,360 @@
+"""
+⏳ ReAct 루프 마감 시간(deadline) 전파
+
+요청마다 RunnableConfig의 configurable["deadline"]에 마감 시각을 넣으면
+- 라우터가 모델 호출 전후로 남은 예산을 확인하고
+- 도구 호출은 남은 예산에서 계산한 타임아웃으로 실행하며
+- 예산이 거의 소진되면 도구 없이 지금까지 모은 정보로 최종 답변하도록 강제합니다.
+
+수동 그래프(react_graph_manual.py)는 deadline_router / after_tools_router /
+tools_with_deadline / final_answer_node를, create_agent(agent_reason_runnable.py)는
+DeadlineMiddleware를 사용합니다.
+
+사용 예:
+    app.invoke(inputs, config=with_deadline(budget=30))
+    print(metrics.summary())
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langgraph.config import get_config
+
+DEADLINE_KEY = "deadline"  # configurable 안의 마감 시각 (time.time() 기준 초)
+FINAL_ANSWER_RESERVE = 5.0  # 최종 답변 생성을 위해 남겨둘 시간 (초)
+MIN_TOOL_TIMEOUT = 1.0  # 도구 호출에 줄 최소 타임아웃 (초)
+
+FINAL_ANSWER_PROMPT = (
+    "시간 예산이 거의 소진되었습니다. 더 이상 도구를 호출하지 말고, "
+    "지금까지 수집한 정보만으로 최선의 최종 답변을 작성하세요. "
+    "확인하지 못한 부분이 있다면 그 사실을 밝히세요."
+)
+
+
+@dataclass
+class DeadlineMetrics:
+    """마감 시간으로 실행이 중단된 빈도
+
+    Attributes:
+        runs: 끝난 실행 수
+        cut_short: 마감 때문에 강제 최종 답변으로 끝난 실행 수
+        tool_timeouts: 타임아웃된 도구 호출 수
+        skipped_tools: 예산 부족으로 실행하지 않은 도구 호출 수
+    """
+
+    runs: int = 0
+    cut_short: int = 0
+    tool_timeouts: int = 0
+    skipped_tools: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def cut_rate(self) -> float:
+        return self.cut_short / self.runs if self.runs else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"⏳ 실행 {self.runs}회 중 마감으로 중단 {self.cut_short}회 "
+            f"({self.cut_rate:.0%}), 도구 타임아웃 {self.tool_timeouts}회, "
+            f"건너뛴 도구 {self.skipped_tools}회"
+        )
+
+
+metrics = DeadlineMetrics()
+
+
+def with_deadline(
+    budget: float, config: Optional[RunnableConfig] = None
+) -> RunnableConfig:
+    """지금부터 budget초 뒤를 마감으로 하는 config 반환 (기존 config는 복사)"""
+    config = dict(config or {})
+    configurable = dict(config.get("configurable") or {})
+    configurable[DEADLINE_KEY] = time.time() + budget
+    config["configurable"] = configurable
+    return config
+
+
+def remaining(config: Optional[RunnableConfig] = None) -> Optional[float]:
+    """남은 예산 (초) - 마감이 없으면 None
+
+    config를 주지 않으면 현재 실행 중인 그래프의 config를 사용합니다.
+    """
+    if config is None:
+        try:
+            config = get_config()
+        except RuntimeError:  # 그래프 실행 밖
+            return None
+    deadline = (config.get("configurable") or {}).get(DEADLINE_KEY)
+    return None if deadline is None else deadline - time.time()
+
+
+def budget_exhausted(config: Optional[RunnableConfig] = None) -> bool:
+    """최종 답변용 여유 시간만 남았는지 여부"""
+    left = remaining(config)
+    return left is not None and left <= FINAL_ANSWER_RESERVE
+
+
+def tool_timeout(config: Optional[RunnableConfig] = None) -> Optional[float]:
+    """도구 호출 타임아웃 = 남은 예산 - 최종 답변 여유 시간 (마감이 없으면 None)"""
+    left = remaining(config)
+    if left is None:
+        return None
+    return max(left - FINAL_ANSWER_RESERVE, MIN_TOOL_TIMEOUT)
+
+
+def _start_tool(fn: Callable, *args: Any) -> Future:
+    """
+    도구 호출 하나를 전용 데몬 스레드에서 실행
+
+    스레드는 멈출 수 없으므로 타임아웃된 호출은 끝날 때까지 스레드를 붙잡습니다.
+    공용 풀을 쓰면 그런 호출이 작업자를 다 차지해 다른 요청의 도구가 줄을 서므로,
+    호출마다 스레드를 만들고 버립니다 (데몬이라 프로세스 종료도 막지 않음).
+    """
+    future: Future = Future()
+    context = contextvars.copy_context()  # get_config() 등 실행 컨텍스트 유지
+
+    def target() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(fn, *args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="deadline-tool", daemon=True).start()
+    return future
+
+
+def _timeout_message(call: dict, timeout: float) -> ToolMessage:
+    return ToolMessage(
+        content=f"⏱️ 시간 초과: {timeout:.1f}초 안에 결과를 받지 못했습니다.",
+        tool_call_id=call["id"],
+        name=call["name"],
+        status="error",
+    )
+
+
+def _error_message(call: dict, error: BaseException) -> ToolMessage:
+    return ToolMessage(
+        content=f"Error: {error!r}",
+        tool_call_id=call["id"],
+        name=call["name"],
+        status="error",
+    )
+
+
+def _skipped_messages(message: AIMessage) -> List[ToolMessage]:
+    """실행하지 않은 도구 호출에 대한 응답 (tool_calls 뒤에는 ToolMessage가 있어야 함)"""
+    return [
+        ToolMessage(
+            content="⏳ 시간 예산 부족으로 실행하지 않았습니다.",
+            tool_call_id=call["id"],
+            name=call["name"],
+            status="error",
+        )
+        for call in message.tool_calls
+    ]
+
+
+# ============================================
+# 수동 StateGraph용 노드/라우터
+# ============================================
+
+
+def deadline_router(route: Callable[[Dict[str, Any]], str]) -> Callable:
+    """
+    기존 라우터(should_continue)에 남은 예산 확인을 추가
+
+    Args:
+        route: "tools" 또는 "__end__"를 반환하는 라우터
+
+    Returns:
+        "tools": 도구를 실행할 예산이 남은 경우
+        "final_answer": 도구를 호출하려 하지만 예산이 거의 소진된 경우
+        "__end__": 최종 답변을 생성한 경우
+    """
+
+    def router(state: Dict[str, Any], config: RunnableConfig) -> str:
+        next_node = route(state)
+        if next_node == "tools" and budget_exhausted(config):
+            return "final_answer"
+        if next_node == "__end__":
+            metrics.record(runs=1)
+        return next_node
+
+    return router
+
+
+def after_tools_router(state: Dict[str, Any], config: RunnableConfig) -> str:
+    """
+    tools → agent 엣지의 예산 확인
+
+    도구가 마감 근처에서 끝났는데 agent로 돌아가면 도구가 바인딩된 모델 호출을
+    한 번 더 한 뒤에야 deadline_router가 예산 소진을 알게 되고, final_answer가
+    또 한 번 호출됩니다. 도구 직후에 확인해 바로 최종 답변으로 보냅니다.
+
+    Returns:
+        "agent": 예산이 남은 경우
+        "final_answer": 최종 답변용 여유 시간만 남은 경우
+    """
+    return "final_answer" if budget_exhausted(config) else "agent"
+
+
+def tools_with_deadline(tools: List[Any]) -> Callable:
+    """남은 예산에서 계산한 타임아웃으로 도구 호출들을 동시에 실행하는 노드 생성"""
+    tools_by_name = {tool.name: tool for tool in tools}
+
+    def run(call: dict, config: RunnableConfig) -> ToolMessage:
+        try:
+            return tools_by_name[call["name"]].invoke({**call, "type": "tool_call"}, config)
+        except Exception as e:
+            return _error_message(call, e)
+
+    def node(state: Dict[str, Any], config: RunnableConfig) -> dict:
+        calls = state["messages"][-1].tool_calls
+        timeout = tool_timeout(config)
+        futures = [_start_tool(run, call, config) for call in calls]
+        wait(futures, timeout=timeout)
+
+        results = []
+        for call, future in zip(calls, futures):
+            if future.done():
+                results.append(future.result())
+            else:
+                # 스레드는 멈출 수 없으므로 결과만 버림 (전용 스레드라 다른 호출은 막지 않음)
+                metrics.record(tool_timeouts=1)
+                results.append(_timeout_message(call, timeout))
+        return {"messages": results}
+
+    async def anode(state: Dict[str, Any], config: RunnableConfig) -> dict:
+        calls = state["messages"][-1].tool_calls
+        timeout = tool_timeout(config)
+
+        async def arun(call: dict) -> ToolMessage:
+            try:
+                return await asyncio.wait_for(
+                    tools_by_name[call["name"]].ainvoke({**call, "type": "tool_call"}, config),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                metrics.record(tool_timeouts=1)
+                return _timeout_message(call, timeout)
+            except Exception as e:
+                return _error_message(call, e)
+
+        return {"messages": list(await asyncio.gather(*(arun(c) for c in calls)))}
+
+    return RunnableLambda(node, afunc=anode, name="tools")
+
+
+def final_answer_node(llm: Any) -> Callable:
+    """도구 없이 지금까지의 대화로 최종 답변을 만드는 노드 생성"""
+
+    def _messages(state: Dict[str, Any]) -> tuple:
+        last_message = state["messages"][-1]
+        skipped = []
+        if isinstance(last_message, AIMessage) and last_message.tool_calls:
+            skipped = _skipped_messages(last_message)
+        prompt = state["messages"] + skipped + [HumanMessage(content=FINAL_ANSWER_PROMPT)]
+        return skipped, prompt
+
+    def _record(skipped: list) -> None:
+        metrics.record(runs=1, cut_short=1, skipped_tools=len(skipped))
+
+    def node(state: Dict[str, Any]) -> dict:
+        skipped, prompt = _messages(state)
+        response = llm.invoke(prompt)
+        _record(skipped)
+        return {"messages": skipped + [response]}
+
+    async def anode(state: Dict[str, Any]) -> dict:
+        skipped, prompt = _messages(state)
+        response = await llm.ainvoke(prompt)
+        _record(skipped)
+        return {"messages": skipped + [response]}
+
+    return RunnableLambda(node, afunc=anode, name="final_answer")
+
+
+# ============================================
+# create_agent용 미들웨어
+# ============================================
+
+
+class DeadlineMiddleware(AgentMiddleware):
+    """create_agent 루프에 마감 시간 적용
+
+    - 예산이 거의 소진되면 모델 호출에서 도구를 빼고 최종 답변을 지시
+    - 도구 호출은 남은 예산에서 계산한 타임아웃으로 실행
+    """
+
+    def _force_final(self, request: Any) -> Any:
+        note = FINAL_ANSWER_PROMPT
+        if request.system_prompt:
+            note = f"{request.system_prompt}\n\n{note}"
+        return request.override(tools=[], system_prompt=note)
+
+    @staticmethod
+    def _mark_forced(response: Any) -> Any:
+        for message in getattr(response, "result", []):
+            if isinstance(message, AIMessage):
+                message.response_metadata["deadline_forced"] = True
+        return response
+
+    def wrap_model_call(self, request: Any, handler: Callable) -> Any:
+        if budget_exhausted():
+            return self._mark_forced(handler(self._force_final(request)))
+        return handler(request)
+
+    async def awrap_model_call(self, request: Any, handler: Callable) -> Any:
+        if budget_exhausted():
+            return self._mark_forced(await handler(self._force_final(request)))
+        return await handler(request)
+
+    def wrap_tool_call(self, request: Any, handler: Callable) -> Any:
+        timeout = tool_timeout()
+        if timeout is None:
+            return handler(request)
+        future = _start_tool(handler, request)
+        wait([future], timeout=timeout)
+        if not future.done():
+            metrics.record(tool_timeouts=1)
+            return _timeout_message(request.tool_call, timeout)
+        return future.result()
+
+    async def awrap_tool_call(self, request: Any, handler: Callable) -> Any:
+        timeout = tool_timeout()
+        try:
+            return await asyncio.wait_for(handler(request), timeout)
+        except asyncio.TimeoutError:
+            metrics.record(tool_timeouts=1)
+            return _timeout_message(request.tool_call, timeout)
+
+    def after_agent(self, state: Dict[str, Any], runtime: Any) -> None:
+        # 이번 요청(마지막 사용자 메시지 이후)의 응답만 확인
+        turn = []
+        for message in reversed(state["messages"]):
+            if isinstance(message, HumanMessage):
+                break
+            turn.append(message)
+        forced = any(
+            isinstance(m, AIMessage) and m.response_metadata.get("deadline_forced")
+            for m in turn
+        )
+        metrics.record(runs=1, cut_short=int(forced))
+        return None
@@ -1,5 +1,7 @@
 from agent_reason_runnable import react_agent_runnable
+from deadline import metrics, with_deadline
 from dotenv import load_dotenv
+from graph_utils import print_stream
 from langchain_core.messages import HumanMessage
 
 load_dotenv()
@@ -18,22 +20,11 @@ print("\n=== ReAct Agent 실행 ===\n")
 print(app.get_graph().draw_mermaid())
 
 
-# 스트리밍으로 상세 과정 보기
-for step in app.stream({"messages": messages}):
-    for node, data in step.items():
-        print(f"\n[{node}]")
-        if "messages" in data:
-            for msg in data["messages"]:
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        print(f"  도구 사용: {tool_call['name']}")
-                        print(f"  입력: {tool_call['args']}")
-                elif hasattr(msg, "name") and msg.name:
-                    print(f"  도구 결과: {msg.content[:200]}...")
-                elif msg.content and not hasattr(msg, "tool_calls"):
-                    print(f"  최종 답변: {msg.content}")
+# 스트리밍으로 상세 과정 보기 (단일 실행으로 최종 상태까지 반환)
+# 요청당 60초 예산: 마감이 가까우면 도구 없이 최종 답변
+result = print_stream(app, {"messages": messages}, config=with_deadline(budget=60))
 
 # 최종 결과 출력
-result = app.invoke({"messages": messages})
 print("\n=== 최종 결과 ===")
 print(result["messages"][-1].content)
+print(metrics.summary())
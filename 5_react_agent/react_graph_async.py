@@ -0,0 +1,104 @@
+import asyncio
+from datetime import datetime
+from typing import Any, List, Optional
+
+from dotenv import load_dotenv
+from graph_utils import cached_tool
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import BaseTool, tool
+from langgraph.graph import END, StateGraph
+from langgraph.prebuilt import ToolNode
+from react_state import AgentState, should_continue
+
+load_dotenv()
+
+
+# 비동기 도구: 이벤트 루프를 막지 않음
+@tool
+async def get_system_time(format: str = "%Y-%m-%d %H:%M:%S") -> str:
+    """오늘 날짜와 시간을 지정된 형식으로 반환합니다."""
+    return datetime.now().strftime(format)
+
+
+def default_tools() -> List[BaseTool]:
+    """캐시한 TavilySearch(캐시 미스는 네이티브 비동기 _arun으로 검색) + 비동기 get_system_time"""
+    from langchain_tavily import TavilySearch
+
+    return [cached_tool(TavilySearch(search_depth="basic")), get_system_time]
+
+
+def default_llm() -> Any:
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+
+def build_graph(llm: Optional[Any] = None, tools: Optional[List[BaseTool]] = None):
+    """
+    react_graph_manual.py와 같은 구조의 완전 비동기 ReAct 그래프
+
+    Args:
+        llm: 도구 바인딩이 가능한 채팅 모델 (기본: gpt-4o-mini)
+        tools: 도구 목록 (기본: 캐시한 TavilySearch, get_system_time)
+
+    Returns:
+        ainvoke/astream으로 실행하는 컴파일된 그래프
+    """
+    llm = llm or default_llm()
+    tools = tools or default_tools()
+    llm_with_tools = llm.bind_tools(tools)
+
+    # Agent 노드: 응답을 기다리는 동안 이벤트 루프가 다른 세션을 처리
+    async def call_agent(state: AgentState) -> dict:
+        """Agent 노드: LLM을 비동기로 호출하여 응답을 생성합니다."""
+        response = await llm_with_tools.ainvoke(state["messages"])
+        return {"messages": [response]}
+
+    # ToolNode는 비동기 실행 시 한 메시지의 도구 호출들을 asyncio.gather로 동시에 실행
+    tool_node = ToolNode(tools)
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("agent", call_agent)
+    workflow.add_node("tools", tool_node)
+    workflow.set_entry_point("agent")
+    workflow.add_conditional_edges(
+        "agent", should_continue, {"tools": "tools", "__end__": END}
+    )
+    workflow.add_edge("tools", "agent")
+
+    return workflow.compile()
+
+
+async def run_many(app: Any, queries: List[str], max_concurrency: int = 100) -> list:
+    """이벤트 루프 하나로 여러 ReAct 세션을 동시에 실행"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(query: str) -> dict:
+        async with semaphore:
+            return await app.ainvoke({"messages": [HumanMessage(content=query)]})
+
+    return await asyncio.gather(*(run(query) for query in queries))
+
+
+if __name__ == "__main__":
+    app = build_graph()
+    queries = [
+        "How many days ago was the latest SpaceX launch?",
+        "What is today's date?",
+        "Who won the most recent FIFA World Cup?",
+    ]
+
+    async def main() -> None:
+        # 단일 세션은 astream으로 진행 상황 확인
+        async for update in app.astream(
+            {"messages": [HumanMessage(content=queries[0])]}, stream_mode="updates"
+        ):
+            for node, output in update.items():
+                print(f"[{node}] {output['messages'][-1].content[:80]!r}")
+
+        # 여러 세션을 동시에 실행
+        results = await run_many(app, queries)
+        for query, result in zip(queries, results):
+            print(f"\n❓ {query}\n💬 {result['messages'][-1].content}")
+
+    asyncio.run(main())
@@ -1,13 +1,12 @@
 from datetime import datetime
 
 from dotenv import load_dotenv
-from langchain_core.messages import AIMessage
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain_tavily import TavilySearch
 from langgraph.graph import END, StateGraph
-from langgraph.prebuilt import ToolNode
-from react_state import AgentState
+from deadline import after_tools_router, deadline_router, final_answer_node, tools_with_deadline
+from react_state import AgentState, should_continue
 
 load_dotenv()
 
@@ -35,30 +34,11 @@ def call_agent(state: AgentState) -> dict:
     return {"messages": [response]}
 
 
-# Tools 노드 생성
-tool_node = ToolNode(tools)
+# Tools 노드 생성 (요청에 마감 시간이 있으면 남은 예산으로 도구 타임아웃 계산)
+tool_node = tools_with_deadline(tools)
 
-
-# 조건부 엣지: Agent 응답에 따라 다음 노드 결정
-def should_continue(state: AgentState) -> str:
-    """Agent의 응답을 확인하고 도구 호출 여부를 결정합니다.
-
-    Args:
-        state: 현재 상태
-
-    Returns:
-        "tools": 도구를 실행해야 하는 경우
-        "__end__": 최종 답변을 생성한 경우
-    """
-    messages = state["messages"]
-    last_message = messages[-1]
-
-    # AIMessage이고 tool_calls가 있으면 도구 실행
-    if isinstance(last_message, AIMessage) and last_message.tool_calls:
-        return "tools"
-
-    # 그렇지 않으면 종료
-    return "__end__"
+# 예산이 거의 소진되면 도구 없이 지금까지의 정보로 최종 답변
+final_answer = final_answer_node(llm)
 
 
 # StateGraph 생성
@@ -67,17 +47,23 @@ workflow = StateGraph(AgentState)
 # 노드 추가
 workflow.add_node("agent", call_agent)
 workflow.add_node("tools", tool_node)
+workflow.add_node("final_answer", final_answer)
 
 # 시작점 설정
 workflow.set_entry_point("agent")
 
-# 조건부 엣지 추가: agent -> tools or END
+# 조건부 엣지 추가: agent -> tools, final_answer(마감 임박) or END
 workflow.add_conditional_edges(
-    "agent", should_continue, {"tools": "tools", "__end__": END}
+    "agent",
+    deadline_router(should_continue),
+    {"tools": "tools", "final_answer": "final_answer", "__end__": END},
 )
+workflow.add_edge("final_answer", END)
 
-# 일반 엣지 추가: tools -> agent
-workflow.add_edge("tools", "agent")
+# 조건부 엣지 추가: tools -> agent, 도구가 마감 근처에 끝났으면 바로 final_answer
+workflow.add_conditional_edges(
+    "tools", after_tools_router, {"agent": "agent", "final_answer": "final_answer"}
+)
 
 # 그래프 컴파일
 app = workflow.compile()
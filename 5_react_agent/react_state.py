@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage
 from langgraph.graph import add_messages
 from typing_extensions import TypedDict
 
@@ -8,3 +8,25 @@ from typing_extensions import TypedDict
 class AgentState(TypedDict):
 
     messages: Annotated[list[BaseMessage], add_messages]
+
+
+# 조건부 엣지: Agent 응답에 따라 다음 노드 결정 (동기/비동기 그래프 공용)
+def should_continue(state: AgentState) -> str:
+    """Agent의 응답을 확인하고 도구 호출 여부를 결정합니다.
+
+    Args:
+        state: 현재 상태
+
+    Returns:
+        "tools": 도구를 실행해야 하는 경우
+        "__end__": 최종 답변을 생성한 경우
+    """
+    messages = state["messages"]
+    last_message = messages[-1]
+
+    # AIMessage이고 tool_calls가 있으면 도구 실행
+    if isinstance(last_message, AIMessage) and last_message.tool_calls:
+        return "tools"
+
+    # 그렇지 않으면 종료
+    return "__end__"
@@ -1,8 +1,8 @@
 from typing import Annotated, List, TypedDict
 
 from dotenv import load_dotenv
+from graph_utils import default_router
 from langchain_core.messages import AIMessage, HumanMessage
-from langchain_groq import ChatGroq
 from langgraph.graph import END, START, StateGraph, add_messages
 
 load_dotenv()
@@ -17,10 +17,8 @@ class BasicChatState(TypedDict):
     messages: Annotated[list[AIMessage | HumanMessage], add_messages]
 
 
-# 모델 생성
-llm = ChatGroq(
-    model="llama-3.1-8b-instant"
-)  # 가격 input 0.05 / 1K 토큰, 0.08 / 1k 토큰
+# 모델 생성: 턴마다 8B/70B 중 선택 (가격/지연 시간은 .cache/model_routing.jsonl에 기록)
+llm = default_router()
 
 # 그래프 선언
 workflow = StateGraph(BasicChatState)
@@ -48,6 +46,7 @@ while True:
 
     # 종료 조건
     if user_input in ["exit", "end"]:
+        print(llm.summary())
         break
 
     # 챗봇 호출
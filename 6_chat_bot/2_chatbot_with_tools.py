@@ -1,21 +1,20 @@
 from typing import Annotated, Final, TypedDict
 
 from dotenv import load_dotenv
+from graph_utils import cached_tool, default_router
 from langchain_core.messages import AIMessage, HumanMessage
-from langchain_groq import ChatGroq
 from langchain_tavily import TavilySearch
 from langgraph.graph import END, StateGraph, add_messages
 from langgraph.prebuilt import ToolNode
 
 load_dotenv()
 
-search_tool = TavilySearch(search_depth="basic")
+# 반복 검색은 SQLite 캐시에서 바로 반환
+search_tool = cached_tool(TavilySearch(search_depth="basic"))
 tools = [search_tool]
 
-# 모델 생성
-llm = ChatGroq(
-    model="llama-3.1-8b-instant"
-)  # 가격 input 0.05 / 1K 토큰, 0.08 / 1k 토큰
+# 모델 생성: 턴마다 8B/70B 중 선택 (가격/지연 시간은 .cache/model_routing.jsonl에 기록)
+llm = default_router()
 
 
 llm_with_tools = llm.bind_tools(tools=tools)
@@ -69,6 +68,7 @@ while True:
 
     # 종료 조건
     if user_input in ["exit", "end"]:
+        print(llm.summary())
         break
 
     # 챗봇 호출
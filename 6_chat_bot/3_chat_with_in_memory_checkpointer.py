@@ -1,28 +1,28 @@
-from typing import Annotated, TypedDict
-
+from context_window import ContextWindow, SummarizedChatState
 from dotenv import load_dotenv
+from graph_utils import default_router
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables.config import RunnableConfig
-from langchain_groq import ChatGroq
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph import END, StateGraph, add_messages
+from langgraph.graph import END, StateGraph
 
 load_dotenv()
 
 memory = MemorySaver()
 
-llm = ChatGroq(model="llama-3.1-8b-instant")
-
+# 턴마다 8B/70B 중 선택 (대화가 길어지면 큰 모델)
+llm = default_router()
 
-class BasicChatState(TypedDict):
-    messages: Annotated[list, add_messages]
+# 최근 턴은 토큰 예산 안에서 그대로, 오래된 턴은 체크포인트의 누적 요약으로
+context = ContextWindow(summarizer=llm, budget=3000, keep_tokens=1500)
 
 
-def chatbot(state: BasicChatState):
-    return {"messages": [llm.invoke(state["messages"])]}
+def chatbot(state: SummarizedChatState):
+    prompt, update = context.prepare(state)
+    return {"messages": [llm.invoke(prompt)], **update}
 
 
-graph = StateGraph(BasicChatState)
+graph = StateGraph(SummarizedChatState)
 
 graph.add_node("chatbot", chatbot)
 
@@ -40,6 +40,7 @@ while True:
 
     # 종료 조건
     if user_input in ["exit", "end"]:
+        print(context.stats.summary())
         break
 
     # 챗봇 호출
@@ -1,31 +1,28 @@
-import sqlite3
-from typing import Annotated, TypedDict
-
+from context_window import ContextWindow, SummarizedChatState
 from dotenv import load_dotenv
+from graph_utils import default_router
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables.config import RunnableConfig
-from langchain_groq import ChatGroq
-from langgraph.checkpoint.sqlite import SqliteSaver
-from langgraph.graph import END, StateGraph, add_messages
+from langgraph.graph import END, StateGraph
+from sqlite_checkpointer import ManagedSqliteSaver, format_report
 
 load_dotenv()
-# SQLite 체크포인터 대신 MemorySaver 사용 (LangGraph 1.0 호환)b
-sqlite_conn = sqlite3.connect("checkpoint.sqlite", check_same_thread=False)
-
-memory = SqliteSaver(sqlite_conn)
-
-llm = ChatGroq(model="llama-3.1-8b-instant")
+# WAL + 스레드별 최근 20개 체크포인트만 보관 (정리/VACUUM은 백그라운드)
+memory = ManagedSqliteSaver("checkpoint.sqlite", keep_last=20)
 
+# 턴마다 8B/70B 중 선택 (대화가 길어지면 큰 모델)
+llm = default_router()
 
-class BasicChatState(TypedDict):
-    messages: Annotated[list, add_messages]
+# 최근 턴은 토큰 예산 안에서 그대로, 오래된 턴은 체크포인트의 누적 요약으로
+context = ContextWindow(summarizer=llm, budget=3000, keep_tokens=1500)
 
 
-def chatbot(state: BasicChatState):
-    return {"messages": [llm.invoke(state["messages"])]}
+def chatbot(state: SummarizedChatState):
+    prompt, update = context.prepare(state)
+    return {"messages": [llm.invoke(prompt)], **update}
 
 
-graph = StateGraph(BasicChatState)
+graph = StateGraph(SummarizedChatState)
 
 graph.add_node("chatbot", chatbot)
 
@@ -40,6 +37,10 @@ config: RunnableConfig = {"configurable": {"thread_id": "1"}}
 while True:
     user_input = input("User: ")
     if user_input in ["exit", "end"]:
+        print(context.stats.summary())
+        memory.maintain()
+        print(format_report(memory.report()))
+        memory.close()
         break
     else:
         result = app.invoke(
@@ -0,0 +1,148 @@
+# ==============================================
+# SQLite 체크포인터 벤치마크: 기본 SqliteSaver vs ManagedSqliteSaver
+# ==============================================
+# API 키 없이 가짜 모델(FakeListChatModel)로 여러 대화 스레드를 실행하고
+# 파일 크기, put 지연 시간, 정리 처리량을 정리 전/후로 비교합니다.
+# 정리 후 put 지연 시간은 정리 뒤에 새 스레드로 한 라운드 더 실행해 측정합니다.
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python benchmark_checkpointer.py
+#   PYTHONPATH=../4_state_deepdive python benchmark_checkpointer.py \
+#       --threads 50 --turns 40 --keep-last 10 --json checkpointer.json
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from collections import deque
+from typing import Annotated, Any, TypedDict
+
+from graph_utils import percentile
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph import END, StateGraph, add_messages
+from sqlite_checkpointer import ManagedSqliteSaver, format_report
+
+
+class BasicChatState(TypedDict):
+    messages: Annotated[list, add_messages]
+
+
+class TimedSqliteSaver(SqliteSaver):
+    """기존 설정(sqlite3.connect 기본값) 그대로 put 지연 시간만 측정"""
+
+    def __init__(self, path: str):
+        super().__init__(sqlite3.connect(path, check_same_thread=False))
+        self.path = path
+        self.write_latencies: deque = deque(maxlen=10_000)
+
+    def put(self, config: dict, checkpoint: Any, metadata: Any, new_versions: Any) -> dict:
+        start = time.perf_counter()
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self.write_latencies.append(time.perf_counter() - start)
+        return result
+
+
+def build_app(checkpointer: Any, reply_chars: int) -> Any:
+    llm = FakeListChatModel(responses=["응답 " * (reply_chars // 3)])
+
+    def chatbot(state: BasicChatState):
+        return {"messages": [llm.invoke(state["messages"])]}
+
+    graph = StateGraph(BasicChatState)
+    graph.add_node("chatbot", chatbot)
+    graph.add_edge("chatbot", END)
+    graph.set_entry_point("chatbot")
+    return graph.compile(checkpointer=checkpointer)
+
+
+def file_bytes(path: str) -> int:
+    wal = f"{path}-wal"
+    return os.path.getsize(path) + (os.path.getsize(wal) if os.path.exists(wal) else 0)
+
+
+def run_turns(app: Any, threads: int, turns: int, prefix: str = "thread") -> float:
+    start = time.perf_counter()
+    for turn in range(turns):
+        for thread in range(threads):
+            config = {"configurable": {"thread_id": f"{prefix}-{thread}"}}
+            app.invoke({"messages": [HumanMessage(content=f"질문 {turn}")]}, config=config)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite 체크포인터 벤치마크")
+    parser.add_argument("--threads", type=int, default=20, help="대화 스레드 수")
+    parser.add_argument("--turns", type=int, default=30, help="스레드당 턴 수")
+    parser.add_argument("--keep-last", type=int, default=10, help="스레드당 남길 체크포인트 수")
+    parser.add_argument("--reply-chars", type=int, default=300, help="가짜 응답 길이")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1) 기존 설정
+        baseline = TimedSqliteSaver(os.path.join(tmp, "baseline.sqlite"))
+        elapsed = run_turns(build_app(baseline, args.reply_chars), args.threads, args.turns)
+        latencies = list(baseline.write_latencies)
+        result = {
+            "mode": "baseline",
+            "elapsed_s": elapsed,
+            "file_bytes": file_bytes(baseline.path),
+            "put_p50_ms": percentile(latencies, 50) * 1000,
+            "put_p95_ms": percentile(latencies, 95) * 1000,
+        }
+        results.append(result)
+        print(
+            f"⚙️ 기본 SqliteSaver: {elapsed:.2f}s, 파일 {result['file_bytes'] / 1024:.0f}KB, "
+            f"put p50 {result['put_p50_ms']:.2f}ms / p95 {result['put_p95_ms']:.2f}ms"
+        )
+        baseline.conn.close()
+
+        # 2) 관리형 (백그라운드 대신 실행 후 직접 정리해 전/후를 비교)
+        managed = ManagedSqliteSaver(
+            os.path.join(tmp, "managed.sqlite"), keep_last=args.keep_last, background=False
+        )
+        app = build_app(managed, args.reply_chars)
+        elapsed = run_turns(app, args.threads, args.turns)
+        before = managed.report()
+        print(f"⚙️ 관리형 정리 전 ({elapsed:.2f}s): {format_report(before)}")
+        start = time.perf_counter()
+        managed.maintain()
+        maintain_s = time.perf_counter() - start
+        pruned = managed.report()
+        print(
+            f"🧹 정리 ({maintain_s * 1000:.0f}ms): 파일 {pruned['file_bytes'] / 1024:.0f}KB "
+            f"(빈 페이지 {pruned['free_pages']}), 체크포인트 {pruned['checkpoints']}개, "
+            f"{pruned['pruned_rows']}행 삭제 ({pruned['prune_rows_per_s']:.0f}행/s)"
+        )
+
+        # 정리 후 쓰기 지연 시간은 새로 측정 (상태 크기가 첫 라운드와 같도록 새 스레드로 실행)
+        managed.write_latencies.clear()
+        after_elapsed = run_turns(app, args.threads, args.turns, prefix="after")
+        after = managed.report()
+        print(f"⚙️ 관리형 정리 후 ({after_elapsed:.2f}s): {format_report(after)}")
+        results.append(
+            {
+                "mode": "managed",
+                "elapsed_s": elapsed,
+                "maintain_s": maintain_s,
+                "after_elapsed_s": after_elapsed,
+                "before": before,
+                "pruned": pruned,
+                "after": after,
+            }
+        )
+        managed.close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# ==============================================
+# 동시 체크포인트 쓰기 벤치마크
+# ==============================================
+# 세션(스레드) 수를 1~64로 늘리며 초당 체크포인트 쓰기 수를 비교합니다.
+#   - shared:     기존 스크립트처럼 연결 하나를 공유하는 SqliteSaver
+#   - managed:    WAL/튜닝 PRAGMA만 적용한 ManagedSqliteSaver (연결 하나)
+#   - concurrent: 읽기 풀 + 그룹 커밋 ConcurrentSqliteSaver
+#
+# 각 세션은 그래프 한 스텝처럼 get_tuple → put → put_writes를 반복합니다.
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python benchmark_concurrent_checkpointer.py
+#   PYTHONPATH=../4_state_deepdive python benchmark_concurrent_checkpointer.py \
+#       --threads 1 4 16 64 --steps 100 --payload 2000 --json concurrent.json
+#   # 커밋마다 fsync하는 디스크에서 그룹 커밋 효과 확인
+#   PYTHONPATH=../4_state_deepdive python benchmark_concurrent_checkpointer.py \
+#       --synchronous FULL --dir .
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from concurrent_checkpointer import ConcurrentSqliteSaver
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.base.id import uuid6
+from langgraph.checkpoint.sqlite import SqliteSaver
+from sqlite_checkpointer import ManagedSqliteSaver
+
+SAVERS: Dict[str, Callable[..., Any]] = {
+    "shared": lambda path, pragmas: SqliteSaver(sqlite3.connect(path, check_same_thread=False)),
+    "managed": lambda path, pragmas: ManagedSqliteSaver(path, background=False, pragmas=pragmas),
+    "concurrent": lambda path, pragmas: ConcurrentSqliteSaver(
+        path, background=False, pragmas=pragmas
+    ),
+}
+
+
+def session(saver: Any, thread_id: str, steps: int, payload: int) -> int:
+    """get_tuple → put → put_writes를 steps번 반복하고 쓰기 횟수 반환"""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    message = AIMessage(content="x" * payload)
+    writes = 0
+    for step in range(steps):
+        saver.get_tuple(config)
+        checkpoint = empty_checkpoint()
+        checkpoint["id"] = str(uuid6(clock_seq=step))
+        checkpoint["channel_values"] = {"messages": [message]}
+        config = saver.put(config, checkpoint, {"source": "loop", "step": step}, {})
+        saver.put_writes(config, [("messages", message)], task_id=f"task-{step}")
+        writes += 2
+    return writes
+
+
+def run(mode: str, threads: int, steps: int, payload: int, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        pragmas = {"synchronous": args.synchronous}
+        saver = SAVERS[mode](os.path.join(tmp, "checkpoint.sqlite"), pragmas)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [
+                pool.submit(session, saver, f"thread-{i}", steps, payload)
+                for i in range(threads)
+            ]
+            writes = sum(f.result() for f in futures)
+        elapsed = time.perf_counter() - start
+
+        result = {
+            "mode": mode,
+            "threads": threads,
+            "writes": writes,
+            "elapsed_s": elapsed,
+            "writes_per_s": writes / elapsed,
+        }
+        if isinstance(saver, ConcurrentSqliteSaver):
+            result["mean_batch"] = saver.group_commit.mean_batch
+        if isinstance(saver, ManagedSqliteSaver):
+            saver.close()
+        else:
+            saver.conn.close()
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동시 체크포인트 쓰기 벤치마크")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--steps", type=int, default=50, help="세션당 스텝 수")
+    parser.add_argument("--payload", type=int, default=1000, help="메시지 크기 (글자)")
+    parser.add_argument(
+        "--synchronous", default="NORMAL", choices=["OFF", "NORMAL", "FULL"],
+        help="managed/concurrent의 synchronous PRAGMA (FULL이면 커밋마다 fsync)",
+    )
+    parser.add_argument("--dir", help="DB 파일을 만들 디렉토리 (기본: 임시 디렉토리, tmpfs면 fsync 비용 없음)")
+    parser.add_argument("--modes", nargs="+", default=list(SAVERS), choices=list(SAVERS))
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = []
+    for threads in args.threads:
+        for mode in args.modes:
+            result = run(mode, threads, args.steps, args.payload, args)
+            results.append(result)
+            line = (
+                f"⚙️ {mode:10} 스레드 {threads:>3}: {result['writes_per_s']:8.0f} writes/s "
+                f"({result['elapsed_s']:.2f}s)"
+            )
+            if "mean_batch" in result:
+                line += f", 평균 {result['mean_batch']:.1f}건/커밋"
+            print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
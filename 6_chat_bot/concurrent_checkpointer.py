@@ -0,0 +1,271 @@
+# ==============================================
+# 동시 세션용 SQLite 체크포인터 (읽기 풀 + 리더/팔로워 그룹 커밋)
+# ==============================================
+# SqliteSaver는 연결 하나와 잠금 하나를 모든 세션이 공유하므로
+# 여러 세션이 동시에 실행되면 체크포인트 쓰기가 한 줄로 서서 커밋마다 기다립니다.
+# ConcurrentSqliteSaver는 같은 스키마를 그대로 쓰면서
+# - get_tuple/list는 읽기 전용 연결 풀에서 병렬로 실행하고 (WAL이라 쓰기와 동시에 가능)
+# - put/put_writes/delete_thread는 대기열에 넣고, 그 순간 커밋 중인 스레드가 없으면
+#   호출한 스레드가 직접(리더) 대기열을 커밋합니다. 리더가 커밋하는 동안 들어온
+#   다른 세션의 쓰기(팔로워)는 다음 리더가 한 트랜잭션으로 묶어 커밋(group commit)합니다.
+#   세션이 하나면 별도 스레드를 거치지 않고 바로 커밋하므로 ManagedSqliteSaver와 같은 경로입니다.
+#
+# SQL과 직렬화는 SqliteSaver 구현을 그대로 사용합니다. 쓰기용 cursor()는
+# 실행할 SQL을 기록만 하고, with 블록이 끝나면 대기열에 넣은 뒤 커밋까지 기다립니다.
+# 따라서 put이 반환된 뒤에는 어떤 읽기 연결에서도 그 체크포인트가 보입니다.
+#
+# 사용 예:
+#     memory = ConcurrentSqliteSaver("checkpoint.sqlite", readers=8)
+#     app = graph.compile(checkpointer=memory)
+#     with ThreadPoolExecutor(32) as pool: ...   # 세션별 app.invoke 동시 실행
+#     print(memory.group_commit.summary())
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlite_checkpointer import ManagedSqliteSaver, connect
+
+
+@dataclass
+class GroupCommitStats:
+    """그룹 커밋 통계
+
+    Attributes:
+        commits: 커밋 횟수
+        writes: 커밋된 쓰기 요청 수 (put/put_writes/delete_thread)
+        failed: 실패한 쓰기 요청 수
+        max_batch: 한 커밋에 묶인 최대 요청 수
+    """
+
+    commits: int = 0
+    writes: int = 0
+    failed: int = 0
+    max_batch: int = 0
+
+    @property
+    def mean_batch(self) -> float:
+        return self.writes / self.commits if self.commits else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"📝 그룹 커밋 {self.commits}회, 쓰기 {self.writes}건 "
+            f"(평균 {self.mean_batch:.1f}건/커밋, 최대 {self.max_batch}건), 실패 {self.failed}건"
+        )
+
+
+class _RecordingCursor:
+    """SqliteSaver의 쓰기 SQL을 실행하지 않고 기록만 하는 커서"""
+
+    def __init__(self):
+        self.statements: List[Tuple[bool, str, Any]] = []
+
+    def execute(self, sql: str, params: Any = ()) -> None:
+        self.statements.append((False, sql, params))
+
+    def executemany(self, sql: str, seq: Any) -> None:
+        self.statements.append((True, sql, list(seq)))
+
+
+class _WriteRequest:
+    def __init__(self, statements: List[Tuple[bool, str, Any]]):
+        self.statements = statements
+        self.error: Optional[BaseException] = None
+        self.lead = False  # 직접 커밋할 차례인지 (처음부터 리더이거나 다음 리더로 지정됨)
+        self.event = threading.Event()
+
+
+class ConcurrentSqliteSaver(ManagedSqliteSaver):
+    """읽기 연결 풀 + 리더/팔로워 그룹 커밋을 쓰는 SqliteSaver (정리/VACUUM 기능 포함)"""
+
+    def __init__(
+        self,
+        path: str,
+        readers: int = 8,
+        max_batch: int = 256,
+        commit_delay: float = 0.0,
+        **kwargs: Any,
+    ):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로
+            readers: 최대 읽기 전용 연결 수
+            max_batch: 한 커밋에 묶을 최대 쓰기 요청 수
+            commit_delay: 리더가 커밋 전에 더 모으기 위해 기다릴 시간 (초, 0이면 대기 중인 것만 묶음)
+            **kwargs: ManagedSqliteSaver 인자 (keep_last, max_age, interval, background, pragmas, serde)
+        """
+        self.max_readers = readers
+        self.max_batch = max_batch
+        self.commit_delay = commit_delay
+        self.group_commit = GroupCommitStats()
+        self._local = threading.local()
+        self._readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._pending: List[_WriteRequest] = []
+        self._leading = False  # 커밋 중인 리더가 있는지
+        self._pending_cond = threading.Condition()
+
+        super().__init__(path, **kwargs)
+
+    # SqliteSaver.list는 writes 조회에 self.conn을 직접 쓰므로,
+    # 읽기 커서를 연 스레드에서는 self.conn이 그 읽기 연결을 가리키게 함
+    @property
+    def conn(self) -> sqlite3.Connection:
+        readers = getattr(self._local, "readers", None)
+        return readers[-1] if readers else self._write_conn
+
+    @conn.setter
+    def conn(self, value: sqlite3.Connection) -> None:
+        self._write_conn = value
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = connect(self.path, **self.pragmas)
+        conn.isolation_level = None  # 트랜잭션은 리더가 직접 관리
+        return conn
+
+    # ============================================
+    # 읽기: 읽기 전용 연결 풀
+    # ============================================
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+        for name in ("busy_timeout", "temp_store", "cache_size", "mmap_size"):
+            conn.execute(f"PRAGMA {name}={self.pragmas[name]}")
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            if self._reader_count < self.max_readers:
+                self._reader_count += 1
+                return self._open_reader()
+        return self._readers.get()
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[Any]:
+        if not transaction:
+            conn = self._checkout()
+            stack = self._local.__dict__.setdefault("readers", [])
+            stack.append(conn)
+            cur = conn.cursor()
+            try:
+                yield cur
+            finally:
+                cur.close()
+                # 커밋되지 않은 읽기 트랜잭션이 남지 않도록 (WAL 체크포인트를 막음)
+                conn.rollback()
+                stack.remove(conn)
+                self._readers.put(conn)
+            return
+
+        recorder = _RecordingCursor()
+        yield recorder
+        if recorder.statements:
+            self._write(_WriteRequest(recorder.statements))
+
+    # ============================================
+    # 쓰기: 그룹 커밋
+    # ============================================
+
+    def _write(self, request: _WriteRequest) -> None:
+        """요청을 대기열에 넣고, 커밋 중인 리더가 없으면 직접 커밋 (있으면 결과를 기다림)"""
+        with self._pending_cond:
+            self._pending.append(request)
+            if not self._leading:
+                self._leading = request.lead = True
+        if not request.lead:
+            request.event.wait()  # 다른 리더가 커밋했거나, 다음 리더로 지정될 때까지
+        if request.lead:
+            self._lead()  # 자기 요청은 대기열 맨 앞이므로 이번 배치에 포함
+        if request.error is not None:
+            raise request.error
+
+    def _lead(self) -> None:
+        """대기 중인 요청을 max_batch까지 한 번 커밋하고, 남은 요청이 있으면 리더를 넘김"""
+        try:
+            if self.commit_delay:
+                time.sleep(self.commit_delay)
+            with self._pending_cond:
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+            self._commit(batch)
+        finally:
+            with self._pending_cond:
+                if self._pending:
+                    # 리더가 남의 요청만 계속 커밋하지 않도록 가장 오래 기다린 요청에 넘김
+                    successor = self._pending[0]
+                    successor.lead = True
+                    successor.event.set()
+                else:
+                    self._leading = False
+                    self._pending_cond.notify_all()
+
+    @staticmethod
+    def _execute(conn: sqlite3.Connection, request: _WriteRequest) -> None:
+        for many, sql, params in request.statements:
+            if many:
+                conn.executemany(sql, params)
+            else:
+                conn.execute(sql, params)
+
+    def _apply(self, conn: sqlite3.Connection, request: _WriteRequest) -> Optional[BaseException]:
+        """요청 하나를 SAVEPOINT 안에서 실행 (실패해도 같은 커밋의 다른 요청은 유지)"""
+        conn.execute("SAVEPOINT request")
+        try:
+            self._execute(conn, request)
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO request")
+            conn.execute("RELEASE request")
+            return e
+        conn.execute("RELEASE request")
+        return None
+
+    def _commit(self, batch: List[_WriteRequest]) -> None:
+        conn = self._write_conn
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if len(batch) == 1:
+                # 혼자면 실패 시 트랜잭션 전체를 되돌리면 되므로 SAVEPOINT 생략
+                self._execute(conn, batch[0])
+                errors = [None]
+            else:
+                errors = [self._apply(conn, request) for request in batch]
+            conn.execute("COMMIT")
+        except BaseException as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            errors = [e] * len(batch)
+
+        failed = sum(error is not None for error in errors)
+        stats = self.group_commit
+        stats.commits += 1
+        stats.writes += len(batch) - failed
+        stats.failed += failed
+        stats.max_batch = max(stats.max_batch, len(batch))
+        for request, error in zip(batch, errors):
+            request.error = error
+            request.event.set()
+
+    def close(self) -> None:
+        """진행 중인 그룹 커밋이 끝난 뒤 모든 연결 닫기"""
+        with self._pending_cond:
+            self._pending_cond.wait_for(lambda: not self._leading)
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+        super().close()
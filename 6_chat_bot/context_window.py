@@ -0,0 +1,246 @@
+# ==============================================
+# 토큰 예산 기반 컨텍스트 윈도우
+# ==============================================
+# 체크포인터로 대화가 계속 쌓이면 매 턴 전체 기록을 LLM에 보내게 되어
+# 턴당 지연 시간과 비용이 끝없이 늘어납니다. 이 모듈은 LLM 앞에서
+# 1) 최근 턴은 토큰 예산 안에서 그대로 유지하고
+# 2) 예산을 넘으면 오래된 턴을 누적 요약(summary)에 접어 넣고
+# 3) 요약과 "어디까지 접었는지"를 체크포인트 상태에 저장합니다.
+#
+# - 메시지별 토큰 수는 메시지 id로 캐시하므로 턴마다 새 메시지만 계산
+# - 요약은 새로 밀려난 메시지만 기존 요약에 합치는 증분 방식
+# - 예산(budget)을 넘을 때 keep_tokens까지 한꺼번에 접어 요약 호출 횟수를 줄임
+#
+# 사용 예:
+#     context = ContextWindow(summarizer=llm, budget=3000, keep_tokens=1500)
+#
+#     def chatbot(state: SummarizedChatState):
+#         prompt, update = context.prepare(state)
+#         return {"messages": [llm.invoke(prompt)], **update}
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Annotated, Any, List, Optional, Tuple, TypedDict
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.graph import add_messages
+
+SUMMARIZE_PROMPT = (
+    "당신은 대화 요약기입니다. 기존 요약과 새로 추가된 대화를 합쳐 하나의 요약으로 갱신하세요. "
+    "사용자의 이름, 선호, 요청 사항, 결정된 내용, 아직 해결되지 않은 질문처럼 "
+    "이후 대화에 필요한 사실은 빠짐없이 남기고, 인사말 등은 생략하세요. "
+    "요약만 출력하세요."
+)
+SUMMARY_PREFIX = "지금까지의 대화 요약:\n"
+MAX_TRANSCRIPT_CHARS = 2000  # 요약에 넘길 메시지 하나의 최대 길이
+
+
+class SummarizedChatState(TypedDict):
+    """요약 필드를 포함한 챗봇 상태
+
+    Attributes:
+        messages: 전체 대화 기록 (체크포인트에는 그대로 보관)
+        summary: messages[:summarized]를 접어 넣은 누적 요약
+        summarized: 요약에 반영된 메시지 수
+    """
+
+    messages: Annotated[list, add_messages]
+    summary: str
+    summarized: int
+
+
+class TokenCounter:
+    """메시지 id별 토큰 수 캐시 (내용 길이가 바뀌면 다시 계산)"""
+
+    def __init__(self, max_entries: int = 50_000):
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, message: BaseMessage) -> int:
+        key = message.id
+        size = len(str(message.content))
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] == size:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached[1]
+        tokens = count_tokens_approximately([message])
+        with self._lock:
+            self.misses += 1
+            if key is not None:
+                self._cache[key] = (size, tokens)
+                if len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return tokens
+
+    def total(self, messages: List[BaseMessage]) -> int:
+        return sum(self.count(m) for m in messages)
+
+
+@dataclass
+class ContextStats:
+    """컨텍스트 윈도우 통계
+
+    Attributes:
+        turns: prepare 호출 수
+        folds: 요약 갱신 횟수
+        folded_messages: 요약에 접어 넣은 메시지 수
+        last_full_tokens: 마지막 턴의 전체 기록 토큰 수 (요약 이후 부분 + 요약)
+        last_sent_tokens: 마지막 턴에 LLM에 보낸 토큰 수
+    """
+
+    turns: int = 0
+    folds: int = 0
+    folded_messages: int = 0
+    last_full_tokens: int = 0
+    last_sent_tokens: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"🪟 컨텍스트: {self.turns}턴, 요약 갱신 {self.folds}회 "
+            f"(메시지 {self.folded_messages}개), 마지막 턴 전송 {self.last_sent_tokens} 토큰"
+        )
+
+
+def _transcript(messages: List[BaseMessage]) -> str:
+    """요약 모델에 넘길 대화 텍스트"""
+    lines = []
+    for message in messages:
+        content = str(message.content)[:MAX_TRANSCRIPT_CHARS]
+        if isinstance(message, HumanMessage):
+            lines.append(f"사용자: {content}")
+        elif isinstance(message, AIMessage):
+            if content:
+                lines.append(f"AI: {content}")
+            for call in message.tool_calls:
+                lines.append(f"AI(도구 호출): {call['name']}({call['args']})")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"도구 결과({message.name}): {content}")
+    return "\n".join(lines)
+
+
+class ContextWindow:
+    """LLM에 보낼 메시지를 토큰 예산 안으로 맞추는 단계"""
+
+    def __init__(
+        self,
+        summarizer: Any,
+        budget: int = 3000,
+        keep_tokens: int = 1500,
+        counter: Optional[TokenCounter] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            summarizer: 요약에 쓸 채팅 모델 (invoke/ainvoke 지원)
+            budget: LLM에 보낼 최대 토큰 수 - 넘으면 오래된 턴을 요약
+            keep_tokens: 요약 후 그대로 남길 최근 턴의 토큰 수 (budget보다 작게)
+            counter: 메시지 토큰 캐시 (여러 그래프가 공유 가능)
+        """
+        if keep_tokens >= budget:
+            raise ValueError("keep_tokens는 budget보다 작아야 합니다")
+        self.summarizer = summarizer
+        self.budget = budget
+        self.keep_tokens = keep_tokens
+        self.counter = counter or TokenCounter()
+        self.stats = ContextStats()
+
+    def _pinned(self, messages: List[BaseMessage]) -> int:
+        """앞쪽 시스템 메시지 수 (항상 유지)"""
+        count = 0
+        while count < len(messages) and isinstance(messages[count], SystemMessage):
+            count += 1
+        return count
+
+    def _window_start(self, messages: List[BaseMessage], lowest: int) -> int:
+        """
+        keep_tokens 안에 들어가는 가장 이른 턴 시작(HumanMessage) 위치
+
+        뒤에서부터 남길 메시지만 세므로 비용은 윈도우 크기에 비례합니다.
+        턴 경계에서 자르므로 도구 호출과 결과가 분리되지 않습니다.
+        """
+        total = 0
+        start = None
+        for i in range(len(messages) - 1, lowest - 1, -1):
+            total += self.counter.count(messages[i])
+            if isinstance(messages[i], HumanMessage):
+                # 마지막 턴 하나만으로 예산을 넘어도 그 턴은 그대로 보냄
+                if total > self.keep_tokens and start is not None:
+                    break
+                start = i
+                if total > self.keep_tokens:
+                    break
+        return start if start is not None else lowest
+
+    def _plan(self, state: dict) -> Tuple[List[BaseMessage], str, int, int, int]:
+        """(메시지, 요약, 접힌 위치, 새 윈도우 시작, 고정 메시지 수)"""
+        messages = state["messages"]
+        pinned = self._pinned(messages)
+        summary = state.get("summary") or ""
+        done = min(max(state.get("summarized") or 0, pinned), len(messages))
+
+        summary_tokens = self.counter.total([SystemMessage(content=summary)]) if summary else 0
+        full = self.counter.total(messages[:pinned] + messages[done:]) + summary_tokens
+        self.stats.turns += 1
+        self.stats.last_full_tokens = full
+        start = done if full <= self.budget else self._window_start(messages, done)
+        return messages, summary, done, start, pinned
+
+    def _prompt(
+        self, messages: List[BaseMessage], summary: str, start: int, pinned: int
+    ) -> List[BaseMessage]:
+        prompt = list(messages[:pinned])
+        if summary:
+            prompt.append(SystemMessage(content=SUMMARY_PREFIX + summary))
+        prompt.extend(messages[start:])
+        self.stats.last_sent_tokens = self.counter.total(prompt)
+        return prompt
+
+    def _fold_request(self, summary: str, evicted: List[BaseMessage]) -> List[BaseMessage]:
+        self.stats.folds += 1
+        self.stats.folded_messages += len(evicted)
+        return [
+            SystemMessage(content=SUMMARIZE_PROMPT),
+            HumanMessage(
+                content=f"기존 요약:\n{summary or '(없음)'}\n\n새 대화:\n{_transcript(evicted)}"
+            ),
+        ]
+
+    def prepare(self, state: dict) -> Tuple[List[BaseMessage], dict]:
+        """
+        LLM에 보낼 메시지와 상태 갱신값 계산
+
+        Returns:
+            (프롬프트 메시지 목록, 노드가 함께 반환할 상태 갱신 dict)
+        """
+        messages, summary, done, start, pinned = self._plan(state)
+        update = {}
+        if start > done:
+            request = self._fold_request(summary, messages[done:start])
+            summary = self.summarizer.invoke(request).content
+            update = {"summary": summary, "summarized": start}
+        return self._prompt(messages, summary, start, pinned), update
+
+    async def aprepare(self, state: dict) -> Tuple[List[BaseMessage], dict]:
+        """prepare의 비동기 버전"""
+        messages, summary, done, start, pinned = self._plan(state)
+        update = {}
+        if start > done:
+            request = self._fold_request(summary, messages[done:start])
+            summary = (await self.summarizer.ainvoke(request)).content
+            update = {"summary": summary, "summarized": start}
+        return self._prompt(messages, summary, start, pinned), update
@@ -0,0 +1,340 @@
+# ==============================================
+# 관리형 SQLite 체크포인터 (WAL + 정리 + 증분 VACUUM)
+# ==============================================
+# SqliteSaver는 모든 스레드의 모든 체크포인트를 영원히 보관하므로
+# checkpoint.sqlite가 계속 커지고 쓰기도 점점 느려집니다. ManagedSqliteSaver는
+# 1) WAL + 튜닝된 PRAGMA로 연결을 열고
+# 2) 스레드(thread_id)마다 최근 keep_last개(또는 max_age초 이내)만 남기고 정리하며
+# 3) 백그라운드 스레드에서 증분 VACUUM과 WAL 체크포인트를 실행합니다.
+#
+# - 정리는 마지막 실행 이후 쓰기가 있었던 스레드만 대상 (처음 한 번은 전체)
+# - 정리/VACUUM은 별도 연결에서 짧은 트랜잭션으로 나눠 실행 (WAL이라 읽기는 막지 않음)
+# - report()로 파일 크기, 쓰기 지연 시간, 정리 처리량 확인
+#
+# 사용 예:
+#     memory = ManagedSqliteSaver("checkpoint.sqlite", keep_last=20)
+#     app = graph.compile(checkpointer=memory)
+#     ...
+#     print(format_report(memory.report()))
+#     memory.close()
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable, List, Optional
+
+from graph_utils import percentile
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # WAL에서는 커밋마다 fsync하지 않아도 손상되지 않음
+    "busy_timeout": 5000,  # 정리 작업과 쓰기가 겹치면 기다림 (ms)
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # 16MB (음수는 KiB 단위)
+    "mmap_size": 128 * 1024 * 1024,
+    "wal_autocheckpoint": 1000,  # 페이지 수
+}
+
+PRUNE_BATCH = 50  # 한 트랜잭션에서 정리할 스레드 수
+VACUUM_STEP = 256  # 한 번에 반환할 빈 페이지 수
+
+# uuid6 타임스탬프 기준 (1582-10-15부터 100ns 단위)
+_UUID_EPOCH = 0x01B21DD213814000
+
+
+def connect(path: str, **pragmas: Any) -> sqlite3.Connection:
+    """WAL/튜닝 PRAGMA를 적용한 연결 (SqliteSaver의 잠금으로 스레드 간 공유)"""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    for name, value in {**PRAGMAS, **pragmas}.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def checkpoint_id_before(timestamp: float) -> str:
+    """
+    timestamp 시각의 가장 작은 체크포인트 id
+
+    체크포인트 id는 uuid6(시간순 정렬)이므로 문자열 비교만으로
+    "timestamp보다 오래된 체크포인트"를 찾을 수 있습니다.
+    """
+    ticks = int(timestamp * 10_000_000) + _UUID_EPOCH
+    time_high = (ticks >> 28) & 0xFFFFFFFF
+    time_mid = (ticks >> 12) & 0xFFFF
+    time_low = ticks & 0x0FFF
+    return f"{time_high:08x}-{time_mid:04x}-6{time_low:03x}-0000-000000000000"
+
+
+@dataclass
+class MaintenanceStats:
+    """정리/VACUUM 누적 통계
+
+    Attributes:
+        runs: 정리 실행 횟수
+        threads: 정리한 스레드 수 (중복 포함)
+        checkpoints: 삭제한 체크포인트 수
+        writes: 삭제한 writes 행 수
+        prune_seconds: 정리에 걸린 시간 (초)
+        vacuumed_pages: 증분 VACUUM으로 반환한 페이지 수
+    """
+
+    runs: int = 0
+    threads: int = 0
+    checkpoints: int = 0
+    writes: int = 0
+    prune_seconds: float = 0.0
+    vacuumed_pages: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        rows = self.checkpoints + self.writes
+        return rows / self.prune_seconds if self.prune_seconds else 0.0
+
+
+class ManagedSqliteSaver(SqliteSaver):
+    """보관 개수/기간 제한과 백그라운드 정리를 갖춘 SqliteSaver"""
+
+    def __init__(
+        self,
+        path: str,
+        keep_last: int = 20,
+        max_age: Optional[float] = None,
+        interval: float = 30.0,
+        background: bool = True,
+        pragmas: Optional[dict] = None,
+        **kwargs: Any,
+    ):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로
+            keep_last: 스레드(네임스페이스)마다 남길 최근 체크포인트 수
+            max_age: 이보다 오래된 체크포인트도 정리 (초, keep_last보다 우선하지만
+                최신 체크포인트 1개는 항상 남김)
+            interval: 백그라운드 정리 주기 (초)
+            background: False이면 maintain()을 직접 호출
+            pragmas: PRAGMAS 중 바꿀 값 (예: {"synchronous": "FULL"})
+            **kwargs: SqliteSaver 인자 (serde 등)
+        """
+        if keep_last < 1:
+            raise ValueError("keep_last는 1 이상이어야 합니다")
+        self.path = path
+        self.keep_last = keep_last
+        self.max_age = max_age
+        self.interval = interval
+        self.pragmas = {**PRAGMAS, **(pragmas or {})}
+        self.maintenance = MaintenanceStats()
+        self.write_latencies: deque = deque(maxlen=10_000)
+
+        # 증분 VACUUM 모드가 아니면 한 번만 전체 VACUUM으로 전환
+        self._admin = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        for name, value in self.pragmas.items():
+            self._admin.execute(f"PRAGMA {name}={value}")
+        self._enable_incremental_vacuum()
+
+        super().__init__(self._open_connection(), **kwargs)
+        self.setup()
+
+        self._dirty: set = set()
+        self._dirty_lock = threading.Lock()
+        self._full_sweep = True  # 첫 정리는 기존 스레드 전체 대상
+        self._admin_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="checkpoint-maintenance", daemon=True
+            )
+            self._thread.start()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """SqliteSaver가 쓰기에 사용할 연결"""
+        return connect(self.path, **self.pragmas)
+
+    def _enable_incremental_vacuum(self) -> None:
+        mode = self._admin.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode == 2:  # INCREMENTAL
+            return
+        # 새 파일도 VACUUM으로 헤더를 먼저 써야 다른 연결이 만든 테이블에 적용됨
+        self._admin.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._admin.execute("VACUUM")
+
+    # ============================================
+    # 쓰기 (지연 시간 측정 + 정리 대상 표시)
+    # ============================================
+
+    def put(self, config: dict, checkpoint: Any, metadata: Any, new_versions: Any) -> dict:
+        start = time.perf_counter()
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self.write_latencies.append(time.perf_counter() - start)
+        with self._dirty_lock:
+            self._dirty.add(config["configurable"]["thread_id"])
+        return result
+
+    # ============================================
+    # 정리
+    # ============================================
+
+    def _thread_ids(self) -> List[str]:
+        with self._dirty_lock:
+            full, self._full_sweep = self._full_sweep, False
+            dirty, self._dirty = self._dirty, set()
+        if full:
+            with self._admin_lock:
+                rows = self._admin.execute("SELECT DISTINCT thread_id FROM checkpoints")
+                return [row[0] for row in rows]
+        return list(dirty)
+
+    def prune(self, thread_ids: Optional[Iterable[str]] = None) -> MaintenanceStats:
+        """
+        스레드별 오래된 체크포인트와 그 writes 삭제
+
+        Args:
+            thread_ids: 정리할 스레드 (None이면 마지막 정리 이후 쓰기가 있었던 스레드)
+
+        Returns:
+            이번 정리의 통계
+        """
+        ids = list(thread_ids) if thread_ids is not None else self._thread_ids()
+        cutoff = checkpoint_id_before(time.time() - self.max_age) if self.max_age else ""
+        result = MaintenanceStats(runs=1, threads=len(ids))
+        start = time.perf_counter()
+        with self._admin_lock:
+            for i in range(0, len(ids), PRUNE_BATCH):
+                batch = ids[i : i + PRUNE_BATCH]
+                marks = ",".join("?" * len(batch))
+                self._admin.execute("BEGIN IMMEDIATE")
+                try:
+                    # 최신 keep_last개 밖이거나, cutoff보다 오래된 (최신 1개 제외) 체크포인트
+                    deleted = self._admin.execute(
+                        f"""
+                        DELETE FROM checkpoints WHERE rowid IN (
+                            SELECT rowid FROM (
+                                SELECT rowid, checkpoint_id, ROW_NUMBER() OVER (
+                                    PARTITION BY thread_id, checkpoint_ns
+                                    ORDER BY checkpoint_id DESC
+                                ) AS pos
+                                FROM checkpoints WHERE thread_id IN ({marks})
+                            )
+                            WHERE pos > ? OR (pos > 1 AND checkpoint_id < ?)
+                        )
+                        """,
+                        (*batch, self.keep_last, cutoff),
+                    ).rowcount
+                    orphans = self._admin.execute(
+                        f"""
+                        DELETE FROM writes
+                        WHERE thread_id IN ({marks}) AND NOT EXISTS (
+                            SELECT 1 FROM checkpoints c
+                            WHERE c.thread_id = writes.thread_id
+                              AND c.checkpoint_ns = writes.checkpoint_ns
+                              AND c.checkpoint_id = writes.checkpoint_id
+                        )
+                        """,
+                        batch,
+                    ).rowcount
+                    self._admin.execute("COMMIT")
+                except BaseException:
+                    self._admin.execute("ROLLBACK")
+                    raise
+                result.checkpoints += deleted
+                result.writes += orphans
+        result.prune_seconds = time.perf_counter() - start
+        self._accumulate(result)
+        return result
+
+    def vacuum(self, max_pages: Optional[int] = None) -> int:
+        """
+        빈 페이지를 파일 시스템에 반환 (한 번에 최대 VACUUM_STEP 페이지씩, 단계마다 커밋)
+
+        Returns:
+            반환한 페이지 수
+        """
+        freed = 0
+        with self._admin_lock:
+            while max_pages is None or freed < max_pages:
+                free = self._admin.execute("PRAGMA freelist_count").fetchone()[0]
+                if not free:
+                    break
+                step = min(free, VACUUM_STEP)
+                if max_pages is not None:
+                    step = min(step, max_pages - freed)
+                # execute()는 버전에 따라 한 스텝(한 페이지)만 진행하므로
+                # executescript로 step 페이지를 모두 반환할 때까지 실행
+                self._admin.executescript(f"PRAGMA incremental_vacuum({step});")
+                freed += free - self._admin.execute("PRAGMA freelist_count").fetchone()[0]
+            # WAL에 쌓인 페이지를 본 파일에 반영하고 WAL 파일 크기 줄이기
+            self._admin.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        self._accumulate(MaintenanceStats(vacuumed_pages=freed))
+        return freed
+
+    def maintain(self) -> MaintenanceStats:
+        """정리 + 증분 VACUUM 한 번 실행"""
+        result = self.prune()
+        result.vacuumed_pages = self.vacuum()
+        return result
+
+    def _accumulate(self, result: MaintenanceStats) -> None:
+        for name, value in asdict(result).items():
+            setattr(self.maintenance, name, getattr(self.maintenance, name) + value)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.maintain()
+            except sqlite3.Error as e:
+                print(f"⚠️ 체크포인트 정리 실패: {e!r}")
+
+    # ============================================
+    # 보고
+    # ============================================
+
+    def report(self) -> dict:
+        """파일 크기, 행 수, 쓰기 지연 시간, 정리 처리량"""
+        wal = f"{self.path}-wal"
+        with self._admin_lock:
+            pages, free, page_size = (
+                self._admin.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in ("page_count", "freelist_count", "page_size")
+            )
+            checkpoints = self._admin.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+            writes = self._admin.execute("SELECT COUNT(*) FROM writes").fetchone()[0]
+        latencies = list(self.write_latencies)
+        return {
+            "file_bytes": os.path.getsize(self.path),
+            "wal_bytes": os.path.getsize(wal) if os.path.exists(wal) else 0,
+            "page_size": page_size,
+            "pages": pages,
+            "free_pages": free,
+            "checkpoints": checkpoints,
+            "writes": writes,
+            "put_p50_ms": percentile(latencies, 50) * 1000,
+            "put_p95_ms": percentile(latencies, 95) * 1000,
+            "pruned_rows": self.maintenance.checkpoints + self.maintenance.writes,
+            "prune_rows_per_s": self.maintenance.rows_per_second,
+            "vacuumed_pages": self.maintenance.vacuumed_pages,
+        }
+
+    def close(self) -> None:
+        """백그라운드 정리를 멈추고 연결 닫기"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self.lock:
+            self.conn.close()
+        with self._admin_lock:
+            self._admin.close()
+
+
+def format_report(report: dict) -> str:
+    return (
+        f"💾 파일 {report['file_bytes'] / 1024:.0f}KB (+WAL {report['wal_bytes'] / 1024:.0f}KB, "
+        f"빈 페이지 {report['free_pages']}), 체크포인트 {report['checkpoints']}개 / "
+        f"writes {report['writes']}개, put p50 {report['put_p50_ms']:.2f}ms / "
+        f"p95 {report['put_p95_ms']:.2f}ms, 정리 {report['pruned_rows']}행 "
+        f"({report['prune_rows_per_s']:.0f}행/s)"
+    )
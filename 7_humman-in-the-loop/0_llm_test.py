@@ -1,6 +1,7 @@
 from typing import Annotated, TypedDict
 
 from dotenv import load_dotenv
+from graph_utils import hedged_chat_model, lazy_chat_model
 from langchain.tools import tool
 from langchain_core.messages import HumanMessage
 from langchain_groq import ChatGroq
@@ -14,7 +15,11 @@ class State(TypedDict):
     messages: Annotated[list, add_messages]
 
 
-llm = ChatGroq(model="llama-3.1-8b-instant")
+# Groq 첫 토큰이 최근 p95보다 늦으면 OpenAI에도 요청해 먼저 온 응답 사용
+llm = hedged_chat_model(
+    ChatGroq(model="llama-3.1-8b-instant"),
+    lazy_chat_model("openai", model="gpt-4o-mini"),
+)
 
 
 @tool
@@ -66,3 +71,4 @@ app = workflow.compile()
 response = app.invoke({"messages": [HumanMessage(content="현재시간은?")]})
 print("\n최종 응답:")
 print(response["messages"][-1].content)
+print(llm.stats.summary())
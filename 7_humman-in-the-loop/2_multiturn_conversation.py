@@ -21,6 +21,7 @@ from datetime import datetime
 from typing import Annotated, List, TypedDict
 
 from dotenv import load_dotenv
+from graph_utils import cached_tool
 from langchain.agents import create_agent
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.runnables.config import RunnableConfig
@@ -34,7 +35,8 @@ from langgraph.types import Command, interrupt
 load_dotenv()
 
 llm = ChatGroq(model="llama-3.1-8b-instant")
-search_tool = TavilySearch()
+# 피드백 반복 중 같은 검색은 SQLite 캐시에서 바로 반환
+search_tool = cached_tool(TavilySearch())
 
 
 @tool
@@ -0,0 +1,191 @@
+# ==============================================
+# 헤지 요청 벤치마크: primary 단독 vs HedgedChatModel
+# ==============================================
+# API 키 없이 지연 시간 분포를 흉내 내는 가짜 프로바이더 두 개로
+# 꼬리 지연(p95/p99)이 얼마나 줄어드는지, 추가 요청 비율은 얼마인지 측정합니다.
+#
+# 가짜 프로바이더: 첫 토큰 지연 = 로그정규 분포 + 일정 확률로 느린 꼬리 (tail-factor배)
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python benchmark_hedging.py
+#   PYTHONPATH=../4_state_deepdive python benchmark_hedging.py \
+#       --requests 500 --concurrency 50 --tail-prob 0.1 --percentiles 90 95 --json hedging.json
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+from graph_utils import hedged_chat_model, percentile, provider_latency
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import (
+    agenerate_from_stream,
+    generate_from_stream,
+)
+from langchain_core.messages import AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+
+class StandInChatModel(BaseChatModel):
+    """지연 시간 분포와 오류율을 흉내 내는 가짜 스트리밍 모델"""
+
+    name_: str = "stand-in"
+    median: float = 0.3  # 첫 토큰 지연 중앙값 (초)
+    sigma: float = 0.3  # 로그정규 분포 폭
+    tail_prob: float = 0.05  # 느린 꼬리 확률
+    tail_factor: float = 8.0  # 꼬리 요청의 지연 배수
+    error_rate: float = 0.0
+    tokens: int = 5
+    token_interval: float = 0.01
+
+    @property
+    def _llm_type(self) -> str:
+        return self.name_
+
+    def _first_token_delay(self) -> float:
+        delay = random.lognormvariate(0, self.sigma) * self.median
+        if random.random() < self.tail_prob:
+            delay *= self.tail_factor
+        return delay
+
+    def _words(self) -> List[str]:
+        return [f"{self.name_}-{i} " for i in range(self.tokens)]
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self._first_token_delay())
+        if random.random() < self.error_rate:
+            raise RuntimeError(f"{self.name_}: 503 Service Unavailable")
+        for i, word in enumerate(self._words()):
+            if i:
+                time.sleep(self.token_interval)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self._first_token_delay())
+        if random.random() < self.error_rate:
+            raise RuntimeError(f"{self.name_}: 503 Service Unavailable")
+        for i, word in enumerate(self._words()):
+            if i:
+                await asyncio.sleep(self.token_interval)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word))
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # 없으면 ainvoke가 _generate를 스레드 풀에서 실행해 primary 단독 기준선이 줄을 섬
+        return await agenerate_from_stream(self._astream(messages, stop, run_manager, **kwargs))
+
+
+async def run(llm: Any, requests: int, concurrency: int) -> Tuple[List[float], int]:
+    """성공한 요청별 전체 응답 시간 (초)과 실패한 요청 수"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> Optional[float]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await llm.ainvoke([HumanMessage(content=f"질문 {i}")])
+            except RuntimeError:
+                return None
+            return time.perf_counter() - start
+
+    results = await asyncio.gather(*(one(i) for i in range(requests)))
+    latencies = [r for r in results if r is not None]
+    return latencies, len(results) - len(latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="헤지 요청 꼬리 지연 벤치마크")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=30)
+    parser.add_argument("--median", type=float, default=0.3, help="첫 토큰 지연 중앙값 (초)")
+    parser.add_argument("--tail-prob", type=float, default=0.05, help="느린 꼬리 확률")
+    parser.add_argument("--tail-factor", type=float, default=8.0, help="꼬리 지연 배수")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="primary 오류율")
+    parser.add_argument("--percentiles", type=float, nargs="+", default=[90, 95])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    common = dict(median=args.median, tail_prob=args.tail_prob, tail_factor=args.tail_factor)
+    primary = StandInChatModel(name_="primary", error_rate=args.error_rate, **common)
+    backup = StandInChatModel(name_="backup", **common)
+
+    # 히스토그램 예열: 헤지 대기 시간이 실제 분포에서 나오도록 (헤지하지 않고 primary만 기록)
+    warmup = hedged_chat_model(primary, backup, default_delay=60, min_delay=60, max_delay=60)
+    asyncio.run(run(warmup, 50, args.concurrency))
+    print(f"📊 primary 첫 토큰 분포: {provider_latency('primary').buckets()}")
+
+    results = []
+    configs = [("primary", None)] + [(f"hedge-p{q:g}", q) for q in args.percentiles]
+    for label, q in configs:
+        if q is None:
+            llm = primary
+        else:
+            llm = hedged_chat_model(primary, backup, hedge_percentile=q)
+        latencies, errors = asyncio.run(run(llm, args.requests, args.concurrency))
+
+        result = {
+            "mode": label,
+            "requests": args.requests,
+            "p50_s": percentile(latencies, 50),
+            "p95_s": percentile(latencies, 95),
+            "p99_s": percentile(latencies, 99),
+            "errors": errors,
+        }
+        if q is not None:
+            stats = llm.stats
+            result.update(
+                hedge_delay_s=llm.hedge_delay(),
+                hedge_rate=stats.hedge_rate,
+                backup_wins=stats.backup_wins,
+                failovers=stats.failovers,
+            )
+        results.append(result)
+
+        line = (
+            f"⚙️ {label:10} p50 {result['p50_s']:.2f}s / p95 {result['p95_s']:.2f}s / "
+            f"p99 {result['p99_s']:.2f}s"
+        )
+        if errors:
+            line += f", 실패 {errors}건"
+        if q is not None:
+            line += f", 대기 {result['hedge_delay_s']:.2f}s, 추가 요청 {result['hedge_rate']:.0%}"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ==============================================
+# HedgedChatModel 스모크 테스트 (API 키 불필요)
+# ==============================================
+# 지연 시간이 고정된 가짜 프로바이더로 invoke/ainvoke 경로를 모두 실행합니다.
+#   - primary가 빠르면 헤지 없이 primary 응답
+#   - primary가 느리면 backup 요청 후 backup 응답, primary는 잘린 표본으로 기록
+#   - primary가 실패하면 기다리지 않고 backup으로 전환
+#
+# 실행 예:
+#   PYTHONPATH=../4_state_deepdive python test_hedging.py
+#   PYTHONPATH=../4_state_deepdive python -m pytest -q test_hedging.py
+
+import asyncio
+import itertools
+
+from benchmark_hedging import StandInChatModel
+from graph_utils import hedged_chat_model, provider_latency
+from langchain_core.messages import HumanMessage
+
+_ids = itertools.count()
+
+
+def stand_in(role: str, median: float, error_rate: float = 0.0) -> StandInChatModel:
+    # 히스토그램은 프로세스 공용이므로 경우마다 다른 이름 사용, sigma=0이면 지연이 고정
+    return StandInChatModel(
+        name_=f"{role}-{next(_ids)}", median=median, sigma=0.0, tail_prob=0.0,
+        error_rate=error_rate, tokens=3, token_interval=0.001,
+    )
+
+
+def cases():
+    """(이름, 헤지 모델, 기대 승자, 기대 통계)"""
+    fast, slow_backup = stand_in("primary", 0.01), stand_in("backup", 0.01)
+    yield "primary 응답", hedged_chat_model(fast, slow_backup, default_delay=0.5), fast, {}
+
+    slow, backup = stand_in("primary", 1.0), stand_in("backup", 0.01)
+    expected = {"hedged": 1, "backup_wins": 1}
+    yield "헤지 후 backup 응답", hedged_chat_model(slow, backup, default_delay=0.05), backup, expected
+
+    broken, backup = stand_in("primary", 0.01, error_rate=1.0), stand_in("backup", 0.01)
+    expected = {"failovers": 1, "backup_wins": 1}
+    yield "장애 전환", hedged_chat_model(broken, backup, default_delay=5.0), backup, expected
+
+
+def check(label: str, llm, winner, expected: dict, message) -> None:
+    assert message.content.startswith(winner.name_), (label, message.content)
+    assert message.response_metadata["hedge_provider"] == winner.name_, label
+    stats = llm.stats
+    for name in ("hedged", "backup_wins", "failovers"):
+        assert getattr(stats, name) == expected.get(name, 0), (label, name, stats)
+    if expected.get("hedged"):
+        # 첫 토큰 전에 취소된 primary는 관측값이 아닌 잘린 표본으로만 남음
+        assert provider_latency(llm.primary_name).censored == 1, label
+
+
+def test_invoke():
+    for label, llm, winner, expected in cases():
+        check(label, llm, winner, expected, llm.invoke([HumanMessage(content="안녕")]))
+
+
+def test_ainvoke():
+    async def run():
+        for label, llm, winner, expected in cases():
+            check(label, llm, winner, expected, await llm.ainvoke([HumanMessage(content="안녕")]))
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_invoke()
+    test_ainvoke()
+    print("✅ HedgedChatModel invoke/ainvoke 통과")